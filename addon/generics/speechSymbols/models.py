@@ -52,6 +52,8 @@ class SpeechSymbols(object):
 		"""
 		self.symbols = collections.OrderedDict()
 		self.fileName = None
+		#: Bumped whenever L{symbols} changes so that derived caches can be rebuilt.
+		self.revision = 0
 		self.localesToNames = dict(languageHandler.getAvailableLanguages())
 
 	def load(self, fileName):
@@ -76,6 +78,7 @@ class SpeechSymbols(object):
 				except ValueError:
 					log.warning(u"Invalid line in file {file}: {line}".format(
 						file=fileName, line=line))
+		self.revision += 1
 
 	def _loadSymbolField(self, input, inputMap=None):
 		if input == "-":
@@ -193,6 +196,8 @@ class SpeechSymbols(object):
 
 	def updateSymbol(self, symbol):
 		self.symbols[symbol.identifier] = symbol
+		self.revision += 1
 
 	def deleteSymbol(self, symbol):
 		del self.symbols[symbol.identifier]
+		self.revision += 1
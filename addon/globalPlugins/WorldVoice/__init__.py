@@ -16,7 +16,7 @@ from .speechSettingsDialog import WorldVoiceSettingsDialog
 from generics.speechSymbols.views import SpeechSymbolsDialog
 
 from synthDrivers.WorldVoice import WVStart, WVEnd
-from synthDrivers.WorldVoice.pipeline import pl
+from synthDrivers.WorldVoice.pipeline import pl, refresh_instrumentation
 from synthDrivers.WorldVoice.pipeline.settings import (
 	apply_global_pipeline_scope,
 	apply_pipeline_after_worldvoice_end,
@@ -185,6 +185,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 				wx.YES | wx.NO, gui.mainFrame
 			) == wx.YES:
 				config.conf["WorldVoice"]["log"]["enable"] = False
+				refresh_instrumentation()
 				try:
 					pl.export()
 				except Exception:
@@ -199,10 +200,12 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 			wx.YES | wx.NO, gui.mainFrame
 		) == wx.YES:
 			config.conf["WorldVoice"]["log"]["enable"] = True
+			refresh_instrumentation()
 			ui.message(_("turn on WorldVoice`s log record"))
 
 	def disable_log_record(self):
 		config.conf["WorldVoice"]["log"]["enable"] = False
+		refresh_instrumentation()
 		if gui.messageBox(
 			# Translators: The message displayed
 			_("Logging of WorldVoice’s speech pipeline has been disabled. Would you like to export the pipeline log now?"),
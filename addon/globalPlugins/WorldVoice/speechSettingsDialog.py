@@ -13,7 +13,8 @@ from logHandler import log
 import queueHandler
 from synthDriverHandler import getSynth
 from synthDrivers.WorldVoice import languageDetection
-from synthDrivers.WorldVoice.pipeline import pl
+from synthDrivers.WorldVoice.pipeline import pl, refresh_instrumentation
+from synthDrivers.WorldVoice.profiler import profiler
 from synthDrivers.WorldVoice.pipeline.settings import (
 	PipelineSettings,
 	apply_global_pipeline_scope,
@@ -655,6 +656,46 @@ class UnicodeDetectionSettingsPanel(SettingsPanel):
 		self._ignorePunctuationCheckBox.SetValue(config.conf["WorldVoice"]["autoLanguageSwitching"]["ignorePunctuationInLanguageDetection"])
 		settingsSizerHelper.addItem(self._ignorePunctuationCheckBox)
 
+		self._statisticalDetectionCheckBox = wx.CheckBox(
+			self,
+			# Translators: Either to tell apart languages written in the same script (such as English and French) from the text itself
+			label=_("Identify languages sharing a script (Latin, Cyrillic, Arabic) from the text")
+		)
+		self._statisticalDetectionCheckBox.SetValue(config.conf["WorldVoice"]["autoLanguageSwitching"]["statisticalDetection"])
+		settingsSizerHelper.addItem(self._statisticalDetectionCheckBox)
+
+		self._carryDetectionStateCheckBox = wx.CheckBox(
+			self,
+			# Translators: Either to continue in the detected language from one speech (such as a say all line) to the next
+			label=_("Keep the detected language across consecutive speech, such as say all lines")
+		)
+		self._carryDetectionStateCheckBox.SetValue(config.conf["WorldVoice"]["autoLanguageSwitching"]["carryDetectionState"])
+		settingsSizerHelper.addItem(self._carryDetectionStateCheckBox)
+
+		self._mergeCJKExtensionsCheckBox = wx.CheckBox(
+			self,
+			# Translators: Either to detect rare Chinese characters (CJK extensions and compatibility ideographs) as Chinese characters
+			label=_("Detect rare Chinese characters (CJK extensions, compatibility ideographs) as Chinese characters")
+		)
+		self._mergeCJKExtensionsCheckBox.SetValue(config.conf["WorldVoice"]["autoLanguageSwitching"]["mergeCJKExtensions"])
+		settingsSizerHelper.addItem(self._mergeCJKExtensionsCheckBox)
+
+		self._lookaheadDetectionCheckBox = wx.CheckBox(
+			self,
+			# Translators: Either to detect the language of upcoming say all lines while the current one is spoken
+			label=_("Detect the language of upcoming say all lines in the background")
+		)
+		self._lookaheadDetectionCheckBox.SetValue(config.conf["WorldVoice"]["autoLanguageSwitching"]["lookaheadDetection"])
+		settingsSizerHelper.addItem(self._lookaheadDetectionCheckBox)
+
+		self._lookaheadSynthesisCheckBox = wx.CheckBox(
+			self,
+			# Translators: Either to synthesize the next language while the current one is spoken, for engines that support it
+			label=_("Synthesize the next language while the current one is spoken (Vocalizer Expressive, Cerence)")
+		)
+		self._lookaheadSynthesisCheckBox.SetValue(config.conf["WorldVoice"]["autoLanguageSwitching"]["lookaheadSynthesis"])
+		settingsSizerHelper.addItem(self._lookaheadSynthesisCheckBox)
+
 		latinChoiceLocaleNames = [self.localesToNames[l] for l in self._latinLocales]
 		self._latinChoice = settingsSizerHelper.addLabeledControl(_("Language assumed for latin characters:"), wx.Choice, choices=latinChoiceLocaleNames)
 		latinLocale = config.conf["WorldVoice"]["autoLanguageSwitching"]["latinCharactersLanguage"]
@@ -706,14 +747,21 @@ class UnicodeDetectionSettingsPanel(SettingsPanel):
 			return
 		config.conf["WorldVoice"]["autoLanguageSwitching"]["ignoreNumbersInLanguageDetection"] = self._ignoreNumbersCheckBox.GetValue()
 		config.conf["WorldVoice"]["autoLanguageSwitching"]["ignorePunctuationInLanguageDetection"] = self._ignorePunctuationCheckBox.GetValue()
+		config.conf["WorldVoice"]["autoLanguageSwitching"]["statisticalDetection"] = self._statisticalDetectionCheckBox.GetValue()
+		config.conf["WorldVoice"]["autoLanguageSwitching"]["carryDetectionState"] = self._carryDetectionStateCheckBox.GetValue()
+		config.conf["WorldVoice"]["autoLanguageSwitching"]["mergeCJKExtensions"] = self._mergeCJKExtensionsCheckBox.GetValue()
+		previous_lookahead = config.conf["WorldVoice"]["autoLanguageSwitching"]["lookaheadDetection"]
+		config.conf["WorldVoice"]["autoLanguageSwitching"]["lookaheadDetection"] = self._lookaheadDetectionCheckBox.GetValue()
+		config.conf["WorldVoice"]["autoLanguageSwitching"]["lookaheadSynthesis"] = self._lookaheadSynthesisCheckBox.GetValue()
 		if self._latinChoice.IsEnabled():
 			config.conf["WorldVoice"]["autoLanguageSwitching"]["latinCharactersLanguage"] = self._latinLocales[self._latinChoice.GetCurrentSelection()]
 		if self._CJKChoice.IsEnabled():
 			config.conf["WorldVoice"]["autoLanguageSwitching"]["CJKCharactersLanguage"] = self._CJKLocales[self._CJKChoice.GetCurrentSelection()]
+		getSynth()._languageDetector.invalidate()
 
 		previous_DLT = config.conf["WorldVoice"]["autoLanguageSwitching"]["DetectLanguageTiming"]
 		current_DLT = self._DetectLanguageTimingValue[self._DLTChoice.GetCurrentSelection()]
-		if current_DLT != previous_DLT:
+		if current_DLT != previous_DLT or self._lookaheadDetectionCheckBox.GetValue() != previous_lookahead:
 			config.conf["WorldVoice"]["autoLanguageSwitching"]["DetectLanguageTiming"] = current_DLT
 
 			# trigger register/unregister language detector
@@ -795,6 +843,13 @@ class LogSettingsPanel(BaseSettingsPanel):
 		"item_wait_factor": {"label": _("item wait factor")},
 		"chinesespace_wait_factor": {"label": _("chinese space wait factor")},
 		"speech_viewer": {"label": _("speech viewer")},
+		"format": {
+			"label": _("Log format:"),
+			"options": OrderedDict({
+				"csv": _("CSV"),
+				"jsonl": _("JSON Lines (compact)"),
+			}),
+		},
 	})
 
 	def makeSettings(self, sizer):
@@ -811,19 +866,59 @@ class LogSettingsPanel(BaseSettingsPanel):
 		super().makeSettings(group_sizer)
 		self.onEnableCheckboxChange(None)
 
+		profile_sizer = wx.StaticBoxSizer(wx.StaticBox(self, label=_("Latency Profile")), wx.VERTICAL)
+		sizer.Add(profile_sizer, proportion=1, flag=wx.EXPAND)
+		self._profile_checkbox = wx.CheckBox(
+			self,
+			label=_("Record latency of pipeline stages, speak dispatch and task queue")
+		)
+		self._profile_checkbox.SetValue(config.conf["WorldVoice"]["log"]["profile"])
+		profile_sizer.Add(self._profile_checkbox, flag=wx.EXPAND)
+		self._profile_report = wx.TextCtrl(
+			self,
+			value=profiler.report(),
+			size=(-1, 150),
+			style=wx.TE_READONLY | wx.TE_MULTILINE | wx.TE_DONTWRAP
+		)
+		profile_sizer.Add(self._profile_report, proportion=1, flag=wx.EXPAND)
+
+		button_sizer = wx.BoxSizer(wx.HORIZONTAL)
+		for label, handler in (
+			(_("&Refresh"), self.onProfileRefresh),
+			(_("Re&set"), self.onProfileReset),
+			(_("E&xport..."), self.onProfileExport),
+		):
+			button = wx.Button(self, label=label)
+			self.Bind(wx.EVT_BUTTON, handler, button)
+			button_sizer.Add(button)
+		profile_sizer.Add(button_sizer)
+
+	def onProfileRefresh(self, event):
+		self._profile_report.SetValue(profiler.report())
+
+	def onProfileReset(self, event):
+		profiler.reset()
+		self.onProfileRefresh(None)
+
+	def onProfileExport(self, event):
+		wx.CallAfter(profiler.export)
+
 	def onEnableCheckboxChange(self, event):
 		if self._enable_checkbox.GetValue():
 			self.sliderEnable()
 		else:
 			self.sliderDisable()
 
+	def _widget(self, key, value):
+		return getattr(self, key + ("Selection" if "options" in value else "CheckBox"))
+
 	def sliderEnable(self):
 		for k, v in self.settings.items():
-			getattr(self, k + "CheckBox").Enable()
+			self._widget(k, v).Enable()
 
 	def sliderDisable(self):
 		for k, v in self.settings.items():
-			getattr(self, k + "CheckBox").Disable()
+			self._widget(k, v).Disable()
 
 	def isValid(self) -> bool:
 		enabled_before = config.conf["WorldVoice"]["log"]["enable"]
@@ -861,7 +956,9 @@ class LogSettingsPanel(BaseSettingsPanel):
 				) == wx.YES:
 					wx.CallAfter(pl.export)
 
+		config.conf["WorldVoice"]["log"]["profile"] = self._profile_checkbox.GetValue()
 		super().onSave()
+		refresh_instrumentation()
 
 
 class WorldVoiceSettingsDialog(MultiCategorySettingsDialog):
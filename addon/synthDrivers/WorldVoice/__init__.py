@@ -9,6 +9,7 @@ from typing import Any
 import addonHandler
 from autoSettingsUtils.driverSetting import BooleanDriverSetting, DriverSetting, NumericDriverSetting
 from autoSettingsUtils.utils import StringParameterInfo
+import buildVersion
 import config
 import extensionPoints
 import gui
@@ -17,10 +18,12 @@ from logHandler import log as nvdaLog
 import speech
 from speech.commands import IndexCommand, CharacterModeCommand, LangChangeCommand, BreakCommand, PitchCommand, RateCommand, VolumeCommand, SpeechCommand
 from speech.extensions import filter_speechSequence
+from speech.priorities import SpeechPriority
 from synthDriverHandler import SynthDriver, synthIndexReached, synthDoneSpeaking
 
 from . import languageDetection
 from .engine import READY_ENGINE_CLASS
+from .lookahead import DetectionLookahead
 from .pipeline import (
 	ignore_comma_between_number,
 	item_wait_factor,
@@ -28,16 +31,20 @@ from .pipeline import (
 	deduplicate_language_command,
 	lang_cmd_to_voice,
 	order_move_to_start_register,
+	register_stage,
+	unregister_stage,
 	listable,
 )
 from .pipeline.settings import (
 	apply_worldvoice_pipeline,
 	clear_pipeline,
 	get_effective_pipeline_settings,
+	invalidate_pipeline_settings,
 	save_pipeline_settings,
 )
-from ._speechcommand import SplitCommand
-from .taskManager import TaskManager
+from ._speechcommand import SplitCommand, WVLangChangeCommand
+from .profiler import METRIC_SPEAK_DISPATCH, profiler
+from .taskManager import LANE_IMMEDIATE, LANE_NEXT, LANE_NORMAL, TaskManager
 from .driver import Voice
 from .voiceManager import VoiceManager
 from .VoiceSettingsDialogs import WorldVoiceVoiceSettingsPanel
@@ -51,6 +58,10 @@ from generics.speechSymbols.models import SpeechSymbols
 
 addonHandler.initTranslation()
 
+# NVDA releases whose speech manager is known to set _curPriQueue before it
+# calls SynthDriver.speak, see SynthDriver._speech_lane.
+_PRIORITY_QUEUE_VERSIONS = ((2024, 1), (2026, 1))
+
 config.conf.spec["WorldVoice"] = {
 	"autoLanguageSwitching": {
 		"ignoreNumbersInLanguageDetection": "boolean(default=false)",
@@ -58,6 +69,13 @@ config.conf.spec["WorldVoice"] = {
 		"latinCharactersLanguage": "string(default=en)",
 		"CJKCharactersLanguage": "string(default=ja)",
 		"arabicCharactersLanguage": "string(default=ar)",
+		"statisticalDetection": "boolean(default=false)",
+		"statisticalMinLength": "integer(default=20)",
+		"carryDetectionState": "boolean(default=false)",
+		"mergeCJKExtensions": "boolean(default=false)",
+		"lookaheadDetection": "boolean(default=true)",
+		"lookaheadSequences": "integer(default=8,min=1,max=64)",
+		"lookaheadSynthesis": "boolean(default=true)",
 		"DetectLanguageTiming": "string(default=after)",
 		"KeepMainLocaleVoiceConsistent": "boolean(default=true)",
 		"KeepMainLocaleParameterConsistent": "boolean(default=false)",
@@ -65,6 +83,7 @@ config.conf.spec["WorldVoice"] = {
 	},
 	"pipeline": {
 		"scope": "string(default=WorldVoice)",
+		"fused": "boolean(default=true)",
 		"ignore_comma_between_number": "boolean(default=false)",
 		"number_mode": "string(default=value)",
 		"global_wait_factor": "integer(default=10,min=0,max=100)",
@@ -86,6 +105,8 @@ config.conf.spec["WorldVoice"] = {
 		"item_wait_factor": "boolean(default=false)",
 		"chinesespace_wait_factor": "boolean(default=false)",
 		"speech_viewer": "boolean(default=false)",
+		"format": "string(default=csv)",
+		"profile": "boolean(default=false)",
 	},
 	"voices": {
 		"__many__": {
@@ -333,6 +354,10 @@ class SynthDriver(SynthDriver):
 		step_start = time.perf_counter()
 		self._languageDetector = languageDetection.LanguageDetector(list(self._voiceManager.allLanguages), self.speechSymbols)
 		self.add_detected_language_commands = listable(self._languageDetector.add_detected_language_commands)
+		self._detectionLookahead = DetectionLookahead(
+			self._languageDetector,
+			config.conf["WorldVoice"]["autoLanguageSwitching"]["lookaheadSequences"],
+		)
 		nvdaLog.debug("WorldVoice init timing: LanguageDetector %.3fs", time.perf_counter() - step_start)
 
 		self._voice = None
@@ -340,6 +365,8 @@ class SynthDriver(SynthDriver):
 
 	def terminate(self):
 		clear_pipeline()
+		filter_speechSequence.unregister(self._detectionLookahead.submit)
+		self._detectionLookahead.terminate()
 
 		gui.settingsDialogs.VoiceSettingsPanel = self.OriginVoiceSettingsPanel
 
@@ -365,7 +392,12 @@ class SynthDriver(SynthDriver):
 		save_pipeline_settings(get_effective_pipeline_settings(synth=self))
 
 	def speak(self, speechSequence):
+		profiling = profiler.enabled
+		start = time.perf_counter() if profiling else None
+		self.taskManager.begin_utterance(start)
+
 		self.order = 0
+		lane = self._speech_lane()
 		if self.uwv and config.conf["WorldVoice"]['autoLanguageSwitching']['DetectLanguageTiming'] == 'after':
 			speechSequence = self.add_detected_language_commands(speechSequence)
 
@@ -383,36 +415,90 @@ class SynthDriver(SynthDriver):
 		charMode = False
 
 		voiceInstance = self._voiceManager.defaultVoiceInstance
+		# Milliseconds of consecutive BreakCommands, queued as one break.
+		breakTime = 0
 
 		for command in speechSequence:
 			if voiceInstance.engine in READY_ENGINE_CLASS.keys():
+				if isinstance(command, BreakCommand):
+					if chunks:
+						voiceInstance.speak(chunks, lane)
+					chunks = []
+					breakTime += command.time
+					continue
+				if breakTime:
+					voiceInstance.breaks(breakTime / 1000, lane)
+					breakTime = 0
 				if isinstance(command, Voice):
 					newInstance = command
 					if chunks:
-						voiceInstance.speak(chunks)
+						voiceInstance.speak(chunks, lane)
 					chunks = []
 					voiceInstance = newInstance
-				elif isinstance(command, BreakCommand):
-					if chunks:
-						voiceInstance.speak(chunks)
-					chunks = []
-					voiceInstance.breaks(command.time / 1000)
 				else:
 					chunks.append(command)
 
 		if voiceInstance.engine in READY_ENGINE_CLASS.keys():
 			if chunks:
-				voiceInstance.speak(chunks)
+				voiceInstance.speak(chunks, lane)
+			if breakTime:
+				voiceInstance.breaks(breakTime / 1000, lane)
+
+		if profiling:
+			profiler.record(
+				METRIC_SPEAK_DISPATCH,
+				self._voiceManager.defaultVoiceInstance.engine,
+				time.perf_counter() - start,
+			)
+
+	@staticmethod
+	def _speech_lane():
+		"""
+		The TaskManager lane for the priority NVDA is speaking the sequence at.
+
+		NVDA passes no priority to SynthDriver.speak and has no public hook
+		that does. Its speech manager sets _curPriQueue to the queue of the
+		priority it speaks from before it calls speak, so the priority is read
+		from there, only on the NVDA releases in _PRIORITY_QUEUE_VERSIONS. On
+		other releases, or when it is gone or not set, the sequence goes to the
+		normal lane, where speech runs in order as it did before lanes.
+		"""
+		first, last = _PRIORITY_QUEUE_VERSIONS
+		if not first <= (buildVersion.version_year, buildVersion.version_major) <= last:
+			return LANE_NORMAL
+		manager = getattr(speech.speech, "_manager", None)
+		priorityQueue = getattr(manager, "_curPriQueue", None)
+		priority = getattr(priorityQueue, "priority", None)
+		if priority is None:
+			return LANE_NORMAL
+		if priority == SpeechPriority.NOW:
+			return LANE_IMMEDIATE
+		if priority == SpeechPriority.NEXT:
+			return LANE_NEXT
+		return LANE_NORMAL
 
 	def patchedSpeakSpelling(self, text, locale=None, useCharacterDescriptions=False, priority=None):
 		if self.uwv \
 		and config.conf["speech"]["trustVoiceLanguage"]:
-			for text, loc in self._languageDetector.process_for_spelling(text, locale):
-				self._realSpellingFunc(text, loc, useCharacterDescriptions, priority=priority)
+			parts = list(self._languageDetector.process_for_spelling(text, locale))
+			if len(parts) > 1:
+				# Spell all languages in one speech sequence, so one dispatch covers the whole text.
+				speechSequence = []
+				for part, loc in parts:
+					speechSequence.append(WVLangChangeCommand(loc))
+					speechSequence.extend(speech.speech.getSpellingSpeech(part, loc, useCharacterDescriptions))
+				speech.speech.speak(speechSequence, priority=priority)
+			elif parts:
+				part, loc = parts[0]
+				self._realSpellingFunc(part, loc, useCharacterDescriptions, priority=priority)
+			else:
+				self._realSpellingFunc(text, locale, useCharacterDescriptions, priority=priority)
 		else:
 			self._realSpellingFunc(text, locale, useCharacterDescriptions, priority=priority)
 
 	def cancel(self):
+		self._detectionLookahead.cancel()
+		self._languageDetector.reset()
 		self._voiceManager.cancel()
 
 	def pause(self, switch):
@@ -518,17 +604,25 @@ class SynthDriver(SynthDriver):
 		else:
 			filter_speechSequence.unregister(self.add_detected_language_commands)
 
+		# Detect the languages of queued say-all speech before speak() gets it.
+		if self.uwv and config.conf["WorldVoice"]['autoLanguageSwitching']['DetectLanguageTiming'] == 'after' \
+		and config.conf["WorldVoice"]['autoLanguageSwitching']['lookaheadDetection']:
+			filter_speechSequence.register(self._detectionLookahead.submit)
+			filter_speechSequence.moveToEnd(self._detectionLookahead.submit)
+		else:
+			filter_speechSequence.unregister(self._detectionLookahead.submit)
+
 	def _get_cni(self):
 		return self._cni
 
 	def _set_cni(self, value):
 		self._cni = value
 		if value:
-			filter_speechSequence.register(ignore_comma_between_number)
-			order_move_to_start_register()
+			register_stage(ignore_comma_between_number)
 		else:
-			filter_speechSequence.unregister(ignore_comma_between_number)
+			unregister_stage(ignore_comma_between_number)
 		config.conf["WorldVoice"]["pipeline"]["ignore_comma_between_number"] = self.cni
+		invalidate_pipeline_settings()
 
 	def _get_availableNumlans(self):
 		return dict(
@@ -558,6 +652,7 @@ class SynthDriver(SynthDriver):
 	def _set_nummod(self, value):
 		self._nummod = value
 		config.conf["WorldVoice"]["pipeline"]["number_mode"] = self.nummod
+		invalidate_pipeline_settings()
 
 	def _get_globalwaitfactor(self):
 		return self._globalwaitfactor * 10
@@ -566,6 +661,7 @@ class SynthDriver(SynthDriver):
 		self._globalwaitfactor = value // 10
 		self._voiceManager.waitfactor = min(value // 10, 9)
 		config.conf["WorldVoice"]["pipeline"]["global_wait_factor"] = self.globalwaitfactor
+		invalidate_pipeline_settings()
 
 	def _get_numberwaitfactor(self):
 		return self._numberwaitfactor
@@ -573,6 +669,7 @@ class SynthDriver(SynthDriver):
 	def _set_numberwaitfactor(self, value):
 		self._numberwaitfactor = value
 		config.conf["WorldVoice"]["pipeline"]["number_wait_factor"] = self.numberwaitfactor
+		invalidate_pipeline_settings()
 
 	def _get_itemwaitfactor(self):
 		return self._itemwaitfactor
@@ -580,11 +677,11 @@ class SynthDriver(SynthDriver):
 	def _set_itemwaitfactor(self, value):
 		self._itemwaitfactor = value
 		if value > 0:
-			filter_speechSequence.register(item_wait_factor)
-			order_move_to_start_register()
+			register_stage(item_wait_factor)
 		else:
-			filter_speechSequence.unregister(item_wait_factor)
+			unregister_stage(item_wait_factor)
 		config.conf["WorldVoice"]["pipeline"]["item_wait_factor"] = self.itemwaitfactor
+		invalidate_pipeline_settings()
 
 	def _get_sayallwaitfactor(self):
 		return self._sayallwaitfactor
@@ -592,6 +689,7 @@ class SynthDriver(SynthDriver):
 	def _set_sayallwaitfactor(self, value):
 		self._sayallwaitfactor = value
 		config.conf["WorldVoice"]["pipeline"]["sayall_wait_factor"] = self.sayallwaitfactor
+		invalidate_pipeline_settings()
 
 	def _get_chinesespacewaitfactor(self):
 		return self._chinesespacewaitfactor
@@ -599,6 +697,7 @@ class SynthDriver(SynthDriver):
 	def _set_chinesespacewaitfactor(self, value):
 		self._chinesespacewaitfactor = value
 		config.conf["WorldVoice"]["pipeline"]["chinesespace_wait_factor"] = self.chinesespacewaitfactor
+		invalidate_pipeline_settings()
 
 	def patchedLengthSpeechSequence(self, speechSequence):
 		result = []
@@ -322,6 +322,15 @@ class SynthDriver(SynthDriver):
 		self._veCallback = None
 
 	def speak(self, speechSequence):
+		self.synthesize(speechSequence)
+		DoneSpeaking(self._player, self._onIndexReached)()
+
+	def synthesize(self, speechSequence):
+		"""
+		Synthesize *speechSequence* into the player without waiting for it to be
+		played, so the next sequence can be synthesized while this one plays.
+		speak() also waits for the player and reports done speaking.
+		"""
 		currentInstance = defaultInstance = self.voiceInstance
 		currentLanguage = defaultLanguage = self.language
 		chunks = []
@@ -407,7 +416,6 @@ class SynthDriver(SynthDriver):
 				log.error(f"Unknown speech: {command}")
 		if chunks:
 			self._speak(currentInstance, chunks)
-		DoneSpeaking(self._player, self._onIndexReached)()
 
 	def _speak(self, voiceInstance, chunks):
 		text = "".join(chunks)
@@ -1,9 +1,10 @@
-import time
-
 import config
 import languageHandler
+from speech.commands import BreakCommand
 from synthDriverHandler import getSynth
 
+from ..taskManager import LANE_NORMAL
+
 
 def boolean(value):
 	if isinstance(value, str):
@@ -146,17 +147,31 @@ class Voice(object):
 		if self.core and self.core.voice != self.id:
 			self.setCoreParameter()
 
-	def speak(self, text):
-		def _speak():
+	def speak(self, text, lane=LANE_NORMAL):
+		def _speak(sequence):
 			self.active()
-			self.core.speak(text)
+			self.core.speak(sequence)
+
+		run_ahead = None
+		if hasattr(self.core, "synthesize") and config.conf["WorldVoice"]["autoLanguageSwitching"]["lookaheadSynthesis"]:
+			# The engine can synthesize the next voice while this one plays.
+			def run_ahead(sequence):
+				self.active()
+				self.core.synthesize(sequence)
 		# self.taskManager.add_dispatch_task((self, _speak),)
-		self.taskManager.add_speak_task(self, _speak)
+		self.taskManager.add_speak_task(self, _speak, run_ahead=run_ahead, lane=lane, sequence=text)
+
+	@property
+	def nativeBreaks(self):
+		"""Whether the engine pauses on BreakCommands, so breaks can be spoken along with the text."""
+		return BreakCommand in getattr(self.core, "supportedCommands", ())
+
+	def drain(self):
+		"""Wait until the speech synthesized ahead has been played and report done speaking."""
+		self.core.speak([])
 
-	def breaks(self, sec):
-		def _breaks():
-			time.sleep(sec)
-		self.taskManager.add_task(self, _breaks)
+	def breaks(self, sec, lane=LANE_NORMAL):
+		self.taskManager.add_break_task(self, sec, lane=lane)
 
 	def stop(self):
 		self.core.cancel()
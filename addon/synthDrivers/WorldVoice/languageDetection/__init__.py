@@ -1,13 +1,31 @@
 # -*- coding: utf-8 -*-
 
 from collections import defaultdict
-from io import StringIO
+import threading
 
 import config
+from speech.commands import LangChangeCommand
 from synthDriverHandler import getSynth
 
-from .blocks import BLOCKS, BLOCK_RSHIFT
+from . import ngram
+from .segmentation import (
+	CHARSET_BASE,
+	CHARSET_IDS,
+	CHARSETS,
+	DIGIT,
+	NEUTRAL,
+	PUNCTUATION,
+	SYMBOL,
+	category_table,
+	charset_of,
+	iter_category_runs,
+	iter_runs,
+	run_pattern,
+	symbol_chars,
+	symbol_pattern,
+)
 from .._speechcommand import WVLangChangeCommand
+from ..pipeline.cache import SegmentCache
 
 BASIC_LATIN = [
     u"en", u"ha", u"so", u"id", u"la", u"sw", u"eu",
@@ -51,6 +69,89 @@ _configKeys = {'CJK Unified Ideographs': 'CJKCharactersLanguage'}
 for charset in ('Basic Latin', 'Extended Latin', 'Latin Extended-B'):
 	_configKeys[charset] = 'latinCharactersLanguage'
 
+_DIGITS = frozenset(str(i) for i in range(10))
+
+
+def _merged_charset(charset):
+	"""The charset the languages list for *charset*, with mergeCJKExtensions."""
+	if charset is None:
+		return None
+	if charset.startswith(("CJK Unified Ideographs Extension", "CJK Compatibility Ideographs")):
+		return "CJK Unified Ideographs"
+	if charset == "Kangxi Radicals":
+		return "KangXi Radicals"
+	return charset
+
+
+def _symbols_key(speechSymbols):
+	if not speechSymbols:
+		return None
+	return (id(speechSymbols.symbols), getattr(speechSymbols, "revision", 0))
+
+
+class CompiledDetection(object):
+	""" What language detection needs, resolved once from the available languages,
+	the speech symbols and the unicode detection settings: the category table,
+	the speech symbol matcher, the run pattern for the ignore flags and, per charset id, the languages
+	covering the charset, the language to switch to when the current one does not and the
+	candidates of statistical identification. *revision* tells detection results
+	of different compilations apart in the detector cache."""
+	def __init__(self, blockLanguages, speechSymbols, revision=0):
+		autoLanguageSwitching = config.conf["WorldVoice"]['autoLanguageSwitching']
+		self.symbols = speechSymbols.symbols if speechSymbols else {}
+		self.symbolsKey = _symbols_key(speechSymbols)
+		self.table = category_table()
+		self.symbolChars = symbol_chars(self.symbols)
+		self.symbolPattern = symbol_pattern(self.symbols)
+		self.ignoreNumbers = bool(autoLanguageSwitching['ignoreNumbersInLanguageDetection'])
+		self.ignorePunctuation = bool(autoLanguageSwitching['ignorePunctuationInLanguageDetection'])
+		self.pattern = run_pattern(self.ignoreNumbers, self.ignorePunctuation)
+		self.identifier = ngram.identifier() if autoLanguageSwitching['statisticalDetection'] else None
+		self.minLength = autoLanguageSwitching['statisticalMinLength']
+		self.carryState = bool(autoLanguageSwitching['carryDetectionState'])
+		mergeCJKExtensions = bool(autoLanguageSwitching['mergeCJKExtensions'])
+		self.revision = revision
+
+		self.languages = []
+		self.fallbacks = []
+		# Indexes in identifier.languages, None when fewer than two languages can be told apart.
+		self.candidates = []
+		for charset in CHARSETS:
+			if mergeCJKExtensions:
+				charset = _merged_charset(charset)
+			langs = blockLanguages.get(charset, [])
+			if not langs:
+				fallback = None
+			elif charset in _configKeys:
+				# See if we have any configured language for this charset.
+				fallback = autoLanguageSwitching[_configKeys[charset]]
+			else:
+				fallback = langs[0]
+			self.languages.append(frozenset(langs))
+			self.fallbacks.append(fallback)
+			candidates = None
+			if self.identifier is not None:
+				candidates = tuple(sorted(self.identifier.index[l] for l in set(langs) if l in self.identifier.index))
+				if len(candidates) < 2:
+					candidates = None
+			self.candidates.append(candidates)
+
+	def resolve(self, charsetId, curLang):
+		fallback = self.fallbacks[charsetId]
+		if fallback is None or curLang.split("_")[0] in self.languages[charsetId]:
+			return curLang
+		return fallback
+
+	def identify(self, charsetId, text, curLang, budget):
+		"""The language of *text* by statistical identification, None when undecided."""
+		candidates = self.candidates[charsetId]
+		if candidates is None:
+			return None
+		lang = self.identifier.identify(text, candidates, budget)
+		if lang is not None and lang == curLang.split("_")[0]:
+			return curLang
+		return lang
+
 
 class LanguageDetector(object):
 	""" Provides functionality to add guessed language commands to NVDA speech sequences.
@@ -97,14 +198,108 @@ class LanguageDetector(object):
 				blockLanguages[i].append(k)
 		self.blockLanguages = blockLanguages
 
+		self._compiled = None
+		# Incremented whenever the speech symbols or the unicode detection
+		# settings change, so cached detection results are never reused across them.
+		self.revision = 0
+		# Speech and the detection lookahead thread both compile.
+		self._compileLock = threading.Lock()
+		self.cache = SegmentCache(max_bytes=1 << 19)
+		# (defaultLang, tmpLang, charset) after the last sequence, when carrying state.
+		self._state = None
+		config.post_configProfileSwitch.register(self.invalidate)
+		config.post_configReset.register(self.invalidate)
+
+	def invalidate(self, *args, **kwargs):
+		"""Recompile on next use, after the unicode detection settings changed."""
+		self._compiled = None
+
+	def reset(self):
+		"""Forget the detection state carried over from the previous sequence."""
+		self._state = None
+
+	def compiled(self):
+		"""
+		The current CompiledDetection, compiled again after invalidate() or a
+		speech symbols change. Its revision keys the cache entries detected with it.
+		"""
+		with self._compileLock:
+			compiled = self._compiled
+			if compiled is None or compiled.symbolsKey != _symbols_key(self.speechSymbols):
+				self.revision += 1
+				compiled = self._compiled = CompiledDetection(self.blockLanguages, self.speechSymbols, self.revision)
+				self.cache.clear()
+		return compiled
+
 	def add_detected_language_commands(self, speechSequence):
-		sb = StringIO()
+		"""
+		Add WVLangChangeCommands for the scripts found in the strings of *speechSequence*.
+
+		The output for a string depends only on the string, the detection
+		state it starts in and the detector revision, so it is memoized in
+		self.cache: focus and menu speech repeat the same strings constantly.
+
+		With carryDetectionState, a sequence starts in the state the previous
+		one ended in, so say-all lines continuing in a detected language do
+		not switch back to the default one and again to the detected one.
+		Explicit language commands and reset() (on cancel) drop that state.
+		"""
+		compiled = self.compiled()
+		state = yield from self._detect_sequence(compiled, speechSequence, self.carried_state())
+		if compiled.carryState:
+			self._state = state
+
+	def carried_state(self):
+		"""The detection state the next sequence starts in, None for the default one."""
+		compiled = self._compiled
+		return self._state if compiled is not None and compiled.carryState else None
+
+	def predetect(self, speechSequence, state=None):
+		"""
+		Detect the languages of *speechSequence* ahead of
+		add_detected_language_commands, starting in the detection *state*, so
+		its strings are found in self.cache when it is spoken. The state carried
+		over is left untouched; the state after the sequence is returned, to
+		predetect the sequence following it.
+		"""
+		compiled = self.compiled()
+		if not compiled.carryState:
+			state = None
+		detected = self._detect_sequence(compiled, speechSequence, state)
+		try:
+			while True:
+				next(detected)
+		except StopIteration as stop:
+			return stop.value if compiled.carryState else None
+
+	def _detect_sequence(self, compiled, speechSequence, state):
+		"""Yield *speechSequence* with the detected language commands, return the state after it."""
+		revision = compiled.revision
+		cache = self.cache
+		budget = ngram.CpuBudget()
 		charset = None
 		defaultLang = getSynth().language
 		curLang = defaultLang
 		tmpLang = curLang.split("_")[0]
+		# Whether the state carried over is still in effect (no text seen yet)
+		# and the language command restoring it before the first text.
+		carrying = False
+		carried = None
+		if state is not None and state[0] == defaultLang:
+			_, tmpLang, charset = state
+			carrying = True
+			if tmpLang != curLang.split("_")[0]:
+				carried = WVLangChangeCommand(tmpLang)
 		for command in speechSequence:
-			if isinstance(command, WVLangChangeCommand):
+			if carrying and isinstance(command, LangChangeCommand):
+				carrying = False
+				carried = None
+				tmpLang = curLang.split("_")[0]
+				charset = None
+				yield command
+			elif isinstance(command, WVLangChangeCommand):
+				carrying = False
+				carried = None
 				if command.lang is None:
 					curLang = defaultLang
 				else:
@@ -113,163 +308,214 @@ class LanguageDetector(object):
 				yield command
 				charset = None # Whatever will come, reset the charset.
 			elif isinstance(command, str):
-				sb = StringIO()
 				command = str(command)
-				prevInIgnore = False
-				rule = False
-				for c in command:
-					if self.speechSymbols and c in self.speechSymbols.symbols:
-						rule = True
-						block = ord(c) >> BLOCK_RSHIFT
-						try:
-							newCharset = BLOCKS[block]
-						except IndexError:
-							newCharset = None
-						charset = newCharset
-						symbol = self.speechSymbols.symbols[c]
-						c = symbol.replacement if symbol.replacement and c not in [str(i) for i in range(10)] else c
-						if symbol.mode == 1:
-							newLang = symbol.language
-						else:
-							newLang = tmpLang
-						newLangFirst = newLang.split("_")[0]
-						if newLangFirst == tmpLang:
-							# Same old...
-							sb.write(c)
-							continue
-						# Change language
-						# First yield the string we already have.
-						if sb.getvalue():
-							yield sb.getvalue()
-							sb = StringIO()
-						tmpLang = newLangFirst
-						charset = None
-						yield WVLangChangeCommand(newLang)
-						yield c
-						continue
-
-					# For non-alphanumeric characters, revert to  the currently set language if in the ASCII range
-					block = ord(c) >> BLOCK_RSHIFT
-					if c.isspace():
-						sb.write(c)
-						continue
-					if c.isdigit() or (not c.isalpha() and block <= 0x8):
-						if config.conf["WorldVoice"]['autoLanguageSwitching']['ignoreNumbersInLanguageDetection'] and c.isdigit():
-							sb.write(c)
-							continue
-						if config.conf["WorldVoice"]['autoLanguageSwitching']['ignorePunctuationInLanguageDetection'] and not c.isdigit():
-							sb.write(c)
-							continue
-						if prevInIgnore and not rule:
-							# Digits and ascii punctuation. We already calculated
-							sb.write(c)
-							continue
-						prevInIgnore = True
-						charset = None # Revert to default charset, we don't care here and  have to recheck later
-						if tmpLang != curLang.split("_")[0]:
-							if sb.getvalue():
-								yield sb.getvalue()
-								sb = StringIO()
-							yield WVLangChangeCommand(curLang)
-							tmpLang = curLang.split("_")[0]
-						sb.write(c)
-						continue
-
-						# Process alphanumeric characters.
-					prevInIgnore = False
-					try:
-						newCharset = BLOCKS[block]
-					except IndexError:
-						newCharset = None
-					if not rule:
-						if newCharset == charset:
-							sb.write(c)
-							continue
-						charset = newCharset
-						if charset in self.languageBlocks[tmpLang]:
-							sb.write(c)
-							continue
-					else:
-						charset = newCharset
-					rule = False
-					# Find the new language to use
-					newLang = self.find_language_for_charset(charset, curLang)
-					newLangFirst = newLang.split("_")[0]
-					if newLangFirst == tmpLang:
-						# Same old...
-						sb.write(c)
-						continue
-					# Change language
-					# First yield the string we already have.
-					if sb.getvalue():
-						yield sb.getvalue()
-						sb = StringIO()
-					tmpLang = newLangFirst
-					if newLang == curLang:
-						yield WVLangChangeCommand(newLang)
-					else:
-						yield WVLangChangeCommand(tmpLang)
-					sb.write(c)
-				# Send the string, if we have one:
-				if sb.getvalue():
-					yield sb.getvalue()
+				key = (command, curLang, tmpLang, charset, revision)
+				value = cache.get(key)
+				if value is None:
+					skipped = budget.skipped
+					value = self._detect_string(compiled, command, curLang, tmpLang, charset, budget)
+					# Not cached when the budget cut statistical identification short.
+					if budget.skipped == skipped:
+						cache.put(key, command, value)
+				tmpLang, charset = value[0], value[1]
+				if carrying and len(value) > 2:
+					if carried is not None and not isinstance(value[2], WVLangChangeCommand):
+						yield carried
+					carrying = False
+					carried = None
+				yield from value[2:]
 			else:
 				yield command
+		return (defaultLang, tmpLang, charset)
 
-	def find_language_for_charset(self, charset, curLang):
-		langs = self.blockLanguages[charset]
-		if not langs or curLang.split("_")[0] in langs:
-			return curLang
-		# See if we have any configured language for this charset.
-		if charset in _configKeys:
-			configKey = _configKeys[charset]
-			lang = config.conf["WorldVoice"]['autoLanguageSwitching'][configKey]
-			return lang
-		return langs[0]
+	def _detect_string(self, compiled, command, curLang, tmpLang, charset, budget):
+		"""
+		Detect the languages of one string, returned as
+		(tmpLang, charset, *commands): the detection state after the string,
+		then the text and WVLangChangeCommands to speak it with.
+
+		The string is split into runs of characters with the same category
+		(see segmentation) and the language is decided once per run: after
+		the first character of a run, the rest of it never switches language.
+		When statistical identification is enabled, the language of text in a
+		script shared by several languages is identified from a sample starting
+		at its first run, if the sample has at least compiled.minLength characters.
+		"""
+		table = compiled.table
+		symbolChars = compiled.symbolChars
+		symbols = compiled.symbols
+		pattern = compiled.pattern
+		symbolPattern = compiled.symbolPattern
+		ignoreNumbers = compiled.ignoreNumbers
+		ignorePunctuation = compiled.ignorePunctuation
+		languages = compiled.languages
+		candidates = compiled.candidates
+		minLength = compiled.minLength
+		out = []
+		# Pending text is "".join(parts) + command[segStart:pos].
+		parts = []
+		segStart = 0
+		prevInIgnore = False
+		rule = False
+		identifiedEnd = 0
+		# Language identified for the sample ending at identifiedEnd, if any.
+		identified = None
+		for category, start, end in iter_runs(command, table, pattern, symbols, symbolPattern, symbolChars):
+			if category == NEUTRAL:
+				continue
+
+			if category == SYMBOL:
+				identifier = command[start:end]
+				rule = True
+				charset = charset_of(identifier[0])
+				symbol = symbols[identifier]
+				replacement = symbol.replacement if symbol.replacement and identifier not in _DIGITS else identifier
+				if symbol.mode == 1:
+					newLang = symbol.language
+				else:
+					newLang = tmpLang
+				newLangFirst = newLang.split("_")[0]
+				if newLangFirst == tmpLang:
+					# Same old...
+					parts.append(command[segStart:start])
+					parts.append(replacement)
+					segStart = end
+					continue
+				# Change language
+				# First emit the string we already have.
+				text = "".join(parts) + command[segStart:start]
+				if text:
+					out.append(text)
+				parts = []
+				segStart = end
+				tmpLang = newLangFirst
+				charset = None
+				out.append(WVLangChangeCommand(newLang))
+				out.append(replacement)
+				continue
+
+			# For non-alphanumeric characters, revert to  the currently set language if in the ASCII range
+			if category == DIGIT or category == PUNCTUATION:
+				if ignoreNumbers and category == DIGIT:
+					continue
+				if ignorePunctuation and category == PUNCTUATION:
+					continue
+				if identified is not None and start < identifiedEnd:
+					# Punctuation and digits inside an identified sample keep its language.
+					continue
+				if prevInIgnore and not rule:
+					# Digits and ascii punctuation. We already calculated
+					continue
+				prevInIgnore = True
+				charset = None # Revert to default charset, we don't care here and  have to recheck later
+				if tmpLang != curLang.split("_")[0]:
+					text = "".join(parts) + command[segStart:start]
+					if text:
+						out.append(text)
+					parts = []
+					segStart = start
+					out.append(WVLangChangeCommand(curLang))
+					tmpLang = curLang.split("_")[0]
+				continue
+
+			# Process alphanumeric characters.
+			prevInIgnore = False
+			charsetId = category - CHARSET_BASE
+			newCharset = CHARSETS[charsetId]
+			newLang = None
+			if candidates[charsetId] is not None and start >= identifiedEnd:
+				# Accented letters split a text in runs of several charsets,
+				# so the sample reaches beyond the run.
+				sample = command[start:start + ngram.SAMPLE_LENGTH]
+				identifiedEnd = start + len(sample)
+				identified = None
+				if len(sample) >= minLength:
+					newLang = identified = compiled.identify(charsetId, sample, curLang, budget)
+			elif identified is not None and start < identifiedEnd and candidates[charsetId] is not None:
+				# Back in the identified sample after punctuation or digits.
+				newLang = identified
+			if newLang is not None:
+				charset = newCharset
+			elif not rule:
+				if newCharset == charset:
+					continue
+				charset = newCharset
+				if tmpLang in languages[charsetId]:
+					continue
+			else:
+				charset = newCharset
+			rule = False
+			# Find the new language to use
+			if newLang is None:
+				newLang = compiled.resolve(charsetId, curLang)
+			newLangFirst = newLang.split("_")[0]
+			if newLangFirst == tmpLang:
+				# Same old...
+				continue
+			# Change language
+			# First emit the string we already have.
+			text = "".join(parts) + command[segStart:start]
+			if text:
+				out.append(text)
+			parts = []
+			segStart = start
+			tmpLang = newLangFirst
+			if newLang == curLang:
+				out.append(WVLangChangeCommand(newLang))
+			else:
+				out.append(WVLangChangeCommand(tmpLang))
+		# Send the string, if we have one:
+		text = "".join(parts) + command[segStart:]
+		if text:
+			out.append(text)
+		return (tmpLang, charset, *out)
+
+	def find_language_for_charset(self, charset, curLang, text=None):
+		compiled = self.compiled()
+		charsetId = CHARSET_IDS[charset]
+		if text is not None and len(text) >= compiled.minLength:
+			lang = compiled.identify(charsetId, text, curLang, ngram.CpuBudget())
+			if lang is not None:
+				return lang
+		return compiled.resolve(charsetId, curLang)
 
 	def process_for_spelling(self, text, locale=None):
+		"""
+		Split *text* into (text, language) parts to spell, one per language.
+		Spaces, digits and ASCII punctuation are spelled in the default language.
+		"""
 		if locale is None:
 			defaultLang = getSynth().language
 		else:
 			defaultLang = locale
 		curLang = defaultLang
 		charset = None
-		sb = StringIO()
-		for c in text:
-			block = ord(c) >> BLOCK_RSHIFT
-			if c.isspace() or c.isdigit() or (not c.isalpha() and block <= 0x8):
+		compiled = self.compiled()
+		languages = compiled.languages
+		segStart = 0
+		for category, start in iter_category_runs(text):
+			if category < CHARSET_BASE:
 				charset = None
-				if curLang == defaultLang:
-					sb.write(c)
-				else:
-					if sb.getvalue():
-						yield sb.getvalue(), curLang
+				if curLang != defaultLang:
+					if start > segStart:
+						yield text[segStart:start], curLang
+						segStart = start
 					curLang = defaultLang
-					sb = StringIO()
-					sb.write(c)
 				continue
-			try:
-				newCharset = BLOCKS[block]
-			except IndexError:
-				newCharset = None
-			if charset is None or charset != newCharset:
+			charsetId = category - CHARSET_BASE
+			if charset is None or charset != charsetId:
 				tmpLang = curLang.split("_")[0]
-				if newCharset in self.languageBlocks[tmpLang]:
-					sb.write(c)
+				if tmpLang in languages[charsetId]:
 					continue
-				lang = self.find_language_for_charset(newCharset, tmpLang)
-				charset = newCharset
+				lang = compiled.resolve(charsetId, tmpLang)
+				charset = charsetId
 				if lang == tmpLang:
-					sb.write(c)
 					continue
-				if sb.getvalue():
-					yield sb.getvalue(), curLang
-					sb = StringIO()
-				sb.write(c)
+				if start > segStart:
+					yield text[segStart:start], curLang
+					segStart = start
 				curLang = lang
 				if curLang == defaultLang.split("_")[0]:
 					curLang = defaultLang
-			else: # same charset
-				sb.write(c)
-		if sb.getvalue():
-			yield sb.getvalue(), curLang
+		if segStart < len(text):
+			yield text[segStart:], curLang
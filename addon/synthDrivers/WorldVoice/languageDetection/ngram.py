@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Statistical identification of languages sharing a script.
+
+Scripts alone cannot tell English from French or Russian from Ukrainian.
+NgramIdentifier scores the words of a text against the trigram profiles of
+ngrams.py (generated by tools/build_ngrams.py): the cost of a trigram is
+log2 of its rank in a language's profile, trigrams missing from the profile
+cost more than the last ranked one, and the language with the lowest total
+cost wins when it is clearly ahead of the next one.
+"""
+
+import math
+import re
+import time
+
+# Time the identifier may spend on one utterance.
+BUDGET_SECONDS = 0.003
+# Characters of a text looked at from the start of a run.
+SAMPLE_LENGTH = 160
+# Words of a sample looked at, enough to decide and bounding the time per run.
+MAX_WORDS = 32
+# Minimum gap between the two best languages, in cost per trigram.
+MIN_MARGIN = 0.15
+MISSING_PENALTY = 1.5
+WORD_CACHE_SIZE = 2048
+
+_WORD_RE = re.compile(r"[^\W\d_]+")
+
+_identifier = None
+
+
+class CpuBudget(object):
+	""" Time left for identification in one utterance. Each identification
+	refused because the budget is spent is counted in skipped."""
+	def __init__(self, seconds=BUDGET_SECONDS):
+		self.remaining = seconds
+		self.skipped = 0
+
+
+class NgramIdentifier(object):
+	def __init__(self, profiles, profileSize):
+		self.languages = tuple(sorted(profiles))
+		self.index = {language: i for i, language in enumerate(self.languages)}
+		missing = math.log2(profileSize + 2) + MISSING_PENALTY
+		costs = {}
+		for i, language in enumerate(self.languages):
+			grams = profiles[language]
+			for rank in range(len(grams) // 3):
+				gram = grams[rank * 3:rank * 3 + 3]
+				row = costs.get(gram)
+				if row is None:
+					row = costs[gram] = [missing] * len(self.languages)
+				row[i] = math.log2(rank + 2)
+		self._costs = {gram: tuple(row) for gram, row in costs.items()}
+		self._missing = (missing,) * len(self.languages)
+		self._words = {}
+
+	def word_costs(self, word):
+		"""Cost of *word* (lower case) per language of self.languages, cached per word."""
+		costs = self._words.get(word)
+		if costs is not None:
+			return costs
+		padded = " %s " % word
+		rows = [self._costs.get(padded[i:i + 3], self._missing) for i in range(len(padded) - 2)]
+		costs = tuple(map(sum, zip(*rows)))
+		if len(self._words) >= WORD_CACHE_SIZE:
+			# Forget the oldest entry, unless another thread just did.
+			self._words.pop(next(iter(self._words)), None)
+		self._words[word] = costs
+		return costs
+
+	def identify(self, text, candidates, budget):
+		"""
+		The language of *text* among the indexes *candidates* of self.languages,
+		or None when no language is clearly ahead or *budget* is spent.
+		"""
+		if budget.remaining <= 0:
+			budget.skipped += 1
+			return None
+		start = time.perf_counter()
+		totals = [0.0] * len(candidates)
+		trigrams = 0
+		for word in _WORD_RE.findall(text.lower())[:MAX_WORDS]:
+			costs = self.word_costs(word)
+			for k, i in enumerate(candidates):
+				totals[k] += costs[i]
+			trigrams += len(word)
+		budget.remaining -= time.perf_counter() - start
+		if not trigrams:
+			return None
+		ranked = sorted(range(len(candidates)), key=totals.__getitem__)
+		if (totals[ranked[1]] - totals[ranked[0]]) / trigrams < MIN_MARGIN:
+			return None
+		return self.languages[candidates[ranked[0]]]
+
+
+def identifier():
+	"""The shared NgramIdentifier, built on first use."""
+	global _identifier
+	if _identifier is None:
+		from .ngrams import PROFILES, PROFILE_SIZE
+		_identifier = NgramIdentifier(PROFILES, PROFILE_SIZE)
+	return _identifier
@@ -0,0 +1,518 @@
+# -*- coding: utf-8 -*-
+# Generated by tools/build_ngrams.py from gettext catalogs, do not edit.
+
+PROFILE_SIZE = 300
+
+# Language -> its most frequent word trigrams, most frequent first, concatenated.
+PROFILES = {
+	'ar': (
+		' الية المات رة مست صو مسند مة الأنيةير ملف فيانيلف الياتيتند'
+		'دة ستن مفالتالبالإفي غيرصورلمس غييح  لافاتيل لى  معورةليةمفت'
+		' عل ملديةصوتالكالراح لا فتاتاحلات مي خطمفاتيحسيةالحالولة الف'
+		'تة ستولماار ون اء  بدميتعلى للول يتةين  أرزيةتوىوى  فش مافشل'
+		'مع الع تعحدةيف ينيلإنفل ياتقفلام يو الثيزيالقيدي ترني رك لمل'
+		'ريةماكمانليزخطأطأ وت إنجنجلجلي منالسليمتحدرشيشيفروس كاأرش با'
+		' برمساكيةلمتدوننديشل النحة حزمان يانمتحروفوف من  إليم وسييا '
+		' اسالخالا قا قفبيررف وتيلمف محلب ميةكبي مصسارفية بيليسلندحرو'
+		'لأواناناتتي لرووم شفرلايألمصدربدوربيبيةتينايا عنطة  أودر  دو'
+		'مصديرةولاتعذاللفرة متلولديو والألبيا يو خا سل عالكبمكنالدالص'
+		'نسينتويد فيدلثابان شفلعرفرن مرلم  سيبة  مجديلعة لفرلحروني جد'
+		'عالال لخايميامةوز مينرنسوي وفر قركنتخامروم مضمضغضغوغوطتوشإلى'
+		' يميمك بوعمل فاويناكنوش دوفغاليق ماتيمةلميزمةلامرض ندوفرككن '
+		'دم وب علاقرصيسا صف ويفة ها برييت رص لمجاك حرف رو أنلبيقرا تح'
+		'وط اسمسم لحزلبربولعندعرض دييونكرومجرعذرور أو  حاثنااصلبت سلي'
+	),
+	'be': (
+		'ая скакая па каскіка ія кі  манскна ць вы араікаыя  са рэан '
+		' неаль за на мо пртраны ай ае га  бава кіяовы ратанра  крста'
+		'андлікйскаваана дамовпраары выкра тарэсансравбліма не ца кар'
+		'паўэспублрайранпубспуагані манангамаалата ла льналінаяры ар '
+		' сіакастрастход лаерацыя фада энтль нга сеоднсанмарканля тар'
+		'каеатаён  гарскдзі валананіван пе і ццааўнцкааў  ад асантдля'
+		'айлань ст длкал арацьрадалерабньнніячна во ко аўня ндапер бе'
+		'авіфайджант ымаас  хаадааўтрал сулі раматрацыеццленрыянг зна'
+		'барабаверграабуаўднік ліьскмаг тэці талтэнавы венёвўднмалэль'
+		' ча дэаёночн кіднёстэ ал абўнопамад інаночраёлас бутрыон ема'
+		' аныст акам патба асцкамрысінснтаольнтылінчым кумі  нівінійс'
+		'льстэрпаракрістнемтва грдскдалахо усрагова іньнарасасазахгчы'
+		' мі брагчыка віваріцьразгантэмадзса панаведанонгблавацаныуга'
+		'балард луентпрыменазаарэствкацначдзепадлавваяфікдніраўамінд '
+		'іраінгаўс месцьвобнь арс джрынбансхогалчэнайсьнебуеыфіазврым'
+	),
+	'bg': (
+		'на  нане  за пране не изта  пото ванка за те ия да ите дава '
+		' е но  ко отата сеен ки пресе ени фаайлфай съранни менредпро'
+		'разприираовескиска ре в денетостация с от ост стри ние мо оп'
+		'иятаванияподпраоже им раие аниимеможави и анд доли ент обест'
+		'ат полкатравът же  грма  саствпциопцзвайл ходленеждилиизпнат'
+		'извотонепикарештелнитнск арнетти данектятадавстоететан бенда'
+		'ме  инждазнагреацислеса  ка толед паенаносорикомато клторман'
+		'задватдървилешквърома сиве ловепрез  сладаявазвеновво матсти'
+		'ст ят шка илделписатеадеказко веж диомеолзлзвмесова нипълива'
+		'ичнстрверод рекйлобез ноистзапалирма маумеазаква въукаетиърж'
+		'чентва укликспеълнед янержави усплонеднресненренмербливенорм'
+		'нтиремфоркетодаина ве къизтати врел артемеан зпоемалноенеъм '
+		'граизхклюлючтовансдирройакозхола къмайтеусдадимаром пъ знеде'
+		'ра  акдатпо  вс таде тринеуиреено винт зпълнилнактоешнсвабра'
+		'аргметраттоймо рсипакобе ли сптарелеамеакези налпостроконреж'
+	),
+	'ca': (
+		' dede es  no es elel  coer no ió la  la a  reent unper s at '
+		'que pe ha ennt ar est cació l  fien  poha al da  in se d és '
+		'un ls comconstana txefitxeritx prdesta icats ra acimenre or '
+		'ia lesect aldel ditraionnomit  pa sieixrespro exns om els és'
+		'ix  quada ma amut isteu ca  ll leaqutorterambesp arersri tat'
+		'ot ir cteons i antrs gutinaet strrecsiómb unatreforpreidanci'
+		'cioue  su molitintstàpotontssi trorite errntrompgitescera op'
+		' foarinteuetcarormspelicten gi acsense bleranrmatà  o rroan '
+		'uraogule dirllapog erverpciifificadeitzortonates obact soord'
+		'eta te orpaqalluesopc usametzatroitadreradali velleempcadost'
+		'rorma  vaciaparcapmatntilidcanessbreferualàliminid steegiire'
+		'repmprcriableguctomésvàlmetsi reaval fa anus  mitaldeniu eci'
+		'ancdorria meos tarscrctuposicinvi líès ssais inspecmisnatign'
+		'll nalserbli và toge sa imilocic refiesnaríniticèncaltaraone'
+		'segpriissturmer aq taaràccimanalsodencaumerdrrreonflín cr ba'
+	),
+	'cs': (
+		' není  po přna  prje  nasou sepro soeníoub jeborubo vystaová'
+		'ze převánný  zainané se ké ovatinat rování chce  do stch it '
+		'or ujevatštiro  odno  a znaostou  v ho přílzeent klpouchyuži'
+		'skéhybnebpod ko nápřinelkon reelzlo ky ru orustule reste ka '
+		' vemento líčcí lat ba výná  s en  ar jakaznennepast adem ouž'
+		'telnačklíateovýtavba stradr maatn inýchslodreebony  obvolbo '
+		' ropla znodpvyplovku tup spzenřeplik liickternamko hod záká '
+		'ovétu dnoek vernovvý piséhost ínaist paodnvanpín al sybylyba'
+		'ty stita íkaříknakakoři epíměndatřenprájak daraztí ázeumebal'
+		'če forporán et ikaesánázpov noak seltovověpraledaceím ranmu '
+		' sk užnasdovsářla okuivant  toícíaz řád deorm si ceezn hoživ'
+		'dpoložli skáeplteneno řáně čísředale kaánoalínot fozad byíst'
+		'do že ti echvá  u ry dníalokovvennosočevé  číaliráv moid jíc'
+		'rozvytde arglicčennsk taaný zpedn teytvcho z postraam by zí '
+		' metnýelebrakláign buobr losahckéev rep slavetronouester dán'
+	),
+	'da': (
+		'er en et kkeke ikkfor fo ikingere dendetil tide tersk il  in'
+		'der afor ler er fi mere ne es ng filverlleand kainded an  st'
+		' ko enisk reentte staog enddenste i  udngeretivente magerion'
+		'kan brangaf edetteal genat rugundmedersrinbruerile se tal so'
+		'on linskrom men sk anproelldigker veelsligkridet saatanne pa'
+		'el  li ogmmeig atitiostr unnsklseken kurennin opkom elkunman'
+		'ylderngle test tet tasomldi aldelejlfejge gyl pr vi fe atnd '
+		'dat syvenileall fr sigt skeegnrerres adtegra taneks be se ug'
+		'rivgivndtdt kalortugenav arvisrogdes påugy etseravnnøgskaøgl'
+		'matpå jl rel miigevarværngsovekonensis merrsktreigt hafrabli'
+		'len nøval naafs x ettar istpe  nongiommldeansormnstrneunnner'
+		' hevet hvselintagefinlanaraertill bl flsti daspr gent ta  væ'
+		'lt rmaestlokjer mokatdskiv drered lovedonert ug rstlemsym sp'
+		'ktinorinsoreliksniypestø bambotypntaalgsseakkve injbolpakndo'
+		'njevn arsin rsemmaast lætenlagid senamm grsamtatlut poate la'
+	),
+	'de': (
+		'en scher ichch che deeiniscderes dente chtung beht  ni daver'
+		'nic unnde auie in on  inng  diate wente ei vetengendieterben'
+		'rdedatertierist anst  koit zeiine ge reereste siwerrt ention'
+		'erstei voang maend paeichenrennge kand nenne  zule  erigeehl'
+		'feh miandaus ismitei berundtio feeiterd al kekanet he  nasta'
+		'mensienis füachkonssean  seannde geb stbeifürür  witigabevon'
+		'ernellreinntsenebelisauflendeshleesenn  arge chlindkeigeslic'
+		' zerd ame co norteati ta enlle pr scal runlerwennamltias ing'
+		'im herchire hreerw sa baaraaltfor meültgülse estodent erzlte'
+		'ran leketien ch abrzeem wiralium all bienseruur selsprlt ite'
+		'egenga gi spintgabger soonedas oponniesuf zentelirdzu chn ha'
+		'us me warel ani nuileescngümatasstanrsthesmerchrariat ortenn'
+		'ls ordommnorbe untrweptiis  lausgprorachal odala li watzeeil'
+		' aklesvoressrieres foman moanzferarttztgitoptlantraeraeimefe'
+		'neraktastormeneals umhnichasisar  grla ra na nda teset netet'
+	),
+	'en': (
+		'ed  in reon  thionng ingle the co no toes tioor to ilehe er '
+		' finotot an  ofectnd is  foandforof fil seentin  iste ternt '
+		'atiate un an a  dere  mase  ca st pa prtedth  li exvalameme '
+		' aral st it reaaliut con di usblege agecomresid  chctinamang'
+		' wiessry  beic  opstalinuseablet  alcanouteadver siortineith'
+		'catrecint naallistns at  suen as  onne tinve  lawitch  do lo'
+		'pec enlidailirets stely ce  sytormenll ad ignianers orerrloc'
+		'strledonsno inv monteprematmannva farinliclanchaproarald ins'
+		'ackraniveexp mede sio so sp basetporomm wasec va haica ke ta'
+		'be ptionthanrep ercteernssi shputrro asdirss rorfaiann frare'
+		'optrt lesindred trherkeyrenormtrithiorydatnnoorechechi bysin'
+		'sh spe mi ouct nst neperds rmapacarg ginorsereraom ratoca da'
+		'endgesrom nuifisigndeeciay symhisenclisode heemoestrs warere'
+		' adritngepe overn ber buck  cr saope whcreumeparmboue guaain'
+		'num atizeninulttur vebolngutra gehar poactcouupponeadddef le'
+	),
+	'es': (
+		' dede  nodo no  se coel os es ón  esión el en rear  lase ent'
+		'la concióen ra ado in paas  unto or te da parestnteicaro al '
+		'aratraacific puta comeroer queionidosta ca fistrun adadesmen'
+		'cioperna era prede al direcon cci si lo aristlidandntondopue'
+		'idaresuedienntrchere delesplo porect a nes oponeio losradarc'
+		'ivo poteront quue eccalicadcarherrioenedenesctenble maencich'
+		'unaáliit  exbreváldosvo  hamitdirle prorch sospema  ustoserr'
+		'chiifiombina timbr faranlasncitrooriia rmasectornom y ca hiv'
+		'alllicirepreregste vair  sucto tavercac moacttar erce rearar'
+		'ciaompuratadfalpo so siópciizaamaablforant meint acoloonarro'
+		'quisercla o cerari obtivmo stárortesopcereinvndi peato liorm'
+		'dorlizgit te ve fu sain ntalesortiteegimieins lenvártaea bol'
+		'nstnaliciargcidntine merecivalnea giusa trtieetaece lípos cr'
+		'minco go  bive ecuambctusinualracema claceamiinitabces fonco'
+		'endtipivampoopetá cre raneraveersan incpecermlor x alombirep'
+	),
+	'et': (
+		'ne  kaiseon  võda ud le igaga  vaailfaise ta utamisei  vi fa'
+		' on eista koili seus tudatu saed ja id kasendti ik st ineasu'
+		'est väli sut kuataminvigerioleimialitusamite ist keel  siväl'
+		'ni ri eelkee jaasteereleariadaavavõiäljstu ar re palisselvõt'
+		' nisi riinimia ndakonsaaajami ks  süane sualdkuindi ol te ma'
+		'tatuse miustliknneaniidede di  po alimeui  baganandiikita li'
+		'il tamnes loljakiris lt ingtu  prab eta lues ldaõnnsis mägi '
+		' nulooõi ma abaaks tabarvaläärstena  kiundeksemientit er ega'
+		'nd vabjasritviitmeümbidatadseaeadledaadbolad itematlinamaema'
+		'numkatmaltanirjõtmmboeidet  inäradatsensedme sümara turea jä'
+		'menoonituimaadeteeaa pol kä lastiolltaltsitaval  antakont tü'
+		'aladis toeemileolira aalinaumb velem lõ stinu muaaroogkoraat'
+		'siouudaseseeatikseas essoniebapro hoateikaainnularg pian la '
+		'aloteilitmitisiversamagalidesiaanberserat ea järlii igvadge '
+		'ioo ee soogi levaiki määallndmaheini puooddus ebuureteikuult'
+	),
+	'fa': (
+		'یی ری اییده ای وریجمه جمهورمهونی ان انی در ایست در  نانامیای'
+		' اسوند با برمی رونام رای پرند وانلی استار ندهاز  خط پاویییک '
+		'تانپرو پیخطا ما ازدی رد یر هایطا  تو نمبان هاین الییا نگاستا'
+		' نشنیا کر دا نوشدهتی  سودار نیاندود توانه یانال  کا شدبرانمی'
+		'دن  راکی  فرایربه را این مو یکید اری یابی بر وی ادهیست بومال'
+		'ره کستکرد روندی جزشان انتن سه لندمه تبربایاتیاهیندا خو میمان'
+		'ونی سا تااردکارمعتعتب بهایاته نشا مقانهیه  گرزای کن هنجزا شک'
+		'شکسهی  و وروریازباالانیسینینوی شاسی  گومارشودات رویادشون یبا'
+		'ائوور  مشپیش بییت  کل شومقد سیفرا ویشاه زبزی شتیتیبپاددشاامع'
+		'اد امیویسامهبا انتنتظامباختمشخیش  پشپشتدون متفت ولی ارراتتون'
+		'دادینهپیا سنانگها نماهنگنها دو لادینخوایسه لووردوجوقداسیاگام'
+		' کوجودپاینشدمایلام بلکلیاراغیرشد  اورانانسکرالیاتیکوسی گیودی'
+		' اترنالیدندوداییالاناخه رالمورگوینگو خاسیرایدبرن غیختهشاخاخه'
+		'دوربری تر مسشناوه ردنبستدا بار هییلیدانونگدمووکر واجزینوشوشت'
+		'کانرفتیکا شمشمایل ادیله ربینوبوبییرییم اسلایجیجا جااماارسقی '
+	),
+	'fi': (
+		'en istta inenenon  eiei ettin  vaellle  ko käoitoststostasa '
+		' vitiean ssalin tutet talliittvirlleäyt tirheirhedotä ied si'
+		'dosttattuain olste onolekäyiteeenitutusteevaltonttieel lilit'
+		'tu avaaliia ja taaet isetelus menaa  sy lotteentttä arnniess'
+		'la llaritmattun luheenis pato htesymkohmerset saksilisimeimi'
+		'allaanolialastilaikäsjoi x  musenbolstumbo laymb kamää kuvai'
+		'miseriatoäärsi yttkkiosouttkisitssoi suennlohohkhkotiitäämin'
+		'nimtavollvoiluk reti  al jaetuilläänaustsisky voäskiviohtää '
+		'ri  seän teroisetaiinint astaiitaekiisäaseperntasä ustrektul'
+		'lä ukuema manteranuuthe ssätasvarotete  kinti jokooakeaiserk'
+		' potin tänneatakireesrkkatt meonnissumeko ilaarvtamsisva lta'
+		'kselueuetirjepä epty  ni nädotestamastä piodoiä ai  en tyit '
+		'ijoytäasana siiärierauksianulo veunttuityyuot haui tilsijope'
+		'aikrvonetisikansesoritueoa sinsimli sekamialtmi  opoodandver'
+		' rindioi inaot  yhaluat okolosroslii intiotoiktisuopäieleuse'
+	),
+	'fr': (
+		' dede es le ionon er  leenttiore  cour  pa lant ne  inla les'
+		'quens  unfic no d te ue ourchi po l eur reati enich mableest'
+		'as menier fien conpas esst che dé sedeslisctirestre sudu un '
+		'et  licom répouect du chdan daanshieireant prge ssial iquse '
+		'aliessparutits andrs  à onnageée nte imibliliignvalonsit ter'
+		' so auemeis postenverune motilistang n ec champoideont utise'
+		'ommimpien ne sice me  arnderrelleut ersstr ex opmanus nom av'
+		'ntrar sibsioossser ouran taort vaara trifi do sa peave quaut'
+		' loertnonie errale ca sy a  ce etintsse ba vetteaisurerti fo'
+		'stantiin  dirée éccatindancivesecou nalat an ins ericaactfor'
+		'lanreniteincprong tan alté vecendturntapercorisaateillncogne'
+		'éesau ir ptitraom ouvnceodeompablattlidargmatreche reunne to'
+		'ini teporoptssa mirousupmboez alaffital atéridéform stêtrpre'
+		' biousairrép êtnstsanfinoirole afdrehertiftiebolteundataisym'
+		' anpe pri apuppaffmodéchsonminassnguligés  étcesinaongues ka'
+	),
+	'hr': (
+		'je ki ski po prna ijeka  zani  je neja  na dastaanjdatti ne '
+		' koijaatonjecijtekoterijza tot ni st rerannijke  izpre u ori'
+		'ostno  seiraznaakoikanskma  mose proredmenli priom va  sata '
+		'ko nak do i  isistitientlja od arjedjen s  kara  ralikjanvan'
+		'mog opoguilitavjskatiezi vr suaniju ekaan stiicinjatanara in'
+		'acitor brpos mate guć zninapodci pisjez grak  ilednemaansava'
+		'nosena dikov sirazće  imstotreroj baanaimenicimaenialjarelje'
+		'renstrdannemovabrojevri nar akme iva tidirkorkomog alijelpci'
+		'opc svovnevavniućednovi risvalumeekeodalazska biicaispretve '
+		'usp deih ljuireakanu la st rekku oj ca  alda im sa rsk speno'
+		'veranoao ataešk ovektod  paji  mearibligreto oratar slnt  ta'
+		'vorijsrepgraerazicmjepotprapozeli usaviininevetaedbik ktoand'
+		'konitadržraveme tričkadavrščki no venovratkaojerizvoznrešenj'
+		'kojulaiševar lo litskforponovece travljojeodrsnien takpjespj'
+		'estvjeormremsu avetipavlše eskrmaemotrivrier  foenečit krspi'
+	),
+	'hu': (
+		' a  ne sz meem  azaz en nemele kilenmegek tt tel ha kaés sa '
+		'araásafájájlet gy cso le elegytás fá be kö vaasz éran  egok '
+		'ak ncsnál cs tamen ales agytárszeényhatlt ás hastésszasszal '
+		' éster patalranentsznett hi feésese felotttó at yel kecs ért'
+		'znányesít foparenevén mijelállrásja ítáre fornt el va szásol'
+		'ancinterelítjl atóhetsziker mani kaprvéközzetnet rehozletérv'
+		'gyeincsztra rakminapcpcsai  adkar z áltság nyzésvagik si eze'
+		'elv pron aktalaus  bilatos or tumalá arkorllekezyteeteála he'
+		'ti  hoolólhaarter zámlisányírá tenytindrteelyválsorelmzás ni'
+		' inba mezhibhelztáia llíezőeg is séglme si nénakpro vá lilás'
+		'nintar soítéág veklye fiban de koatosikta zernekez ktelvert '
+		'rencsaár ormasáellésztéknévha ve  tö jeadatotetiló eszibamag'
+		'datndeoma álendissverertvalrtéikesok baán rmátetnyv ku iskön'
+		'ega viistöveoz gadönylesrülandezéyvtvtáillelőkel coásoerüben'
+		'st össot ll atáli almvet veehelapeálsak létreargresév ozásom'
+	),
+	'id': (
+		'an kan daak  di ti meng angidadaktidsi menat  pe sealaeng ba'
+		'ah  bengaberri  keterperarikas re inal  taikaasiata te maara'
+		'uk gan unas da apantu kopattukuntali paama deyanlamtanam ada'
+		' yarandaldaprkaing saandakadarar laneraer ma erkungit ukaeri'
+		' kanyaai  si namemya hanndaagaia nam bupensebunais  ar hagun'
+		'eladenbahon ngg adntabua vaembmbani in ngkta id iniaha bibar'
+		'asa nosa  gadanlahka en  stnak su laentintik rinvalra enaor '
+		'ianilaol ke bollik cona galet  jadi  caebu at al anle lidmbo'
+		'takstrsan lostade matmantarbageksga isiindmaskunbanset opaba'
+		' chau  moilius diaistel komgkaambtorerlhasana poantsteorielu'
+		'ati gi leersuante es ong prurati simgitkonla ihauatpilipehar'
+		'panukuris kuaruokaesi guloktauuahndeodeendtikirebelatu li x '
+		'forlailuare ek aludir pirmanaljanuarvertu tamimblihkar miina'
+		'rsiur  nianyketrengagertdikmbupa relaniiteesaut eretemulali '
+		'nti akchindireknteemuagiec ksilinresuruormrukrakisaetananua '
+	),
+	'it': (
+		'le to  dire  coion de noon di ne ent inoneilenonziola ta del'
+		'ti  riconte atoil nte ilell seper fiposstaica maare uner ali'
+		' re pessibilmpono  es la immenel un filimpaleessna azi alchi'
+		' chibicomlo ese stse ni ett paestra  prin oss da sulla è and'
+		' soche neca ro li ereia sibatill oredo  sian tatnti l so all'
+		'ingterteninaverco  va me li ca moit ataeriran levalficaraseg'
+		'io me ifimanomema ri oni sa tada irettetorggi baitacorari qu'
+		'ng ntattocathe atterrndinto aragganglin i sci gimeruratraame'
+		'intoritro a  tronoontsioratostnal scstrant ustalpreizzei  e '
+		' pogioindza itoonariccarist tega  karmandorimforve zzasa que'
+		'nelnomancera op spser nuntrolo ermodianal prouna ve loporden'
+		'nesliclitusalloico anrecdirdei elegutti crndece mingitanapo '
+		'ngustoortlidoraich viusceroenzguianoaccresinirroreasi hiacit'
+		'triutoiliasseleiustesllelizinede ut alasti atomary ienpec ha'
+		'risrio natanspe misse mu foriasteene purorime agmitngamat ap'
+	),
+	'lt': (
+		'as os is  pati  ne kaja  prtasijainiių mas retų ai  sutinkla'
+		'sta kous nasės io men va mara  sapavstiara klamakal nuentjos'
+		'ika ar viepa talainų ntaali išintijoka ko avialbeikimanepinė'
+		'ras sipro facijaildinrašmo estrin seandta ba istres apfaima '
+		' ti naytilikkaičiųto  atnaulų ečieriblida lavantlintaiinavyk'
+		'ameperpri ranisomauriranavyespubllis laiečala pe ge de baspu'
+		'pubpraramgravalnė  gasisatyiamanaaidykoietnetasiikionailaviš'
+		'lbanim begalaustikrei irparoringariskasimoangkomustaikaisska'
+		'stųetirų ir karungardetagesvinlaniau šiajarodntisenvarpasadi'
+		'audpaklasing an tu lijuntar davieakemangasno inknt  intytes '
+		'traitiiesaittie verak doritverpatia mosdžikų elirijeradasje '
+		' kiariovi pi sknusumeava dina aciartrtiikoyra potatkiavadsu '
+		'ojaturlo pal grdo ojiamiudodytuotaka jaenaidasteterveienobos'
+		'oli me alauj no kuastrovkinjų launororoeiskosamoketncijamnda'
+		'ri  trtisėraogroti nėnėrso aukbų kurčiaalotė saste  moincui '
+	),
+	'nb': (
+		'er kkeen et ke ikkforil ing ikte  fo erter titilor ler av fi'
+		' inre  enng fil st deent mellever kode brues  brruk utig  i '
+		'tteom av rtesteed ere vaalg skval å  veallandoppertstaettell'
+		' sodigngene  reendndenne opkerinnmenarttt og  og mart ntesom'
+		'ldiderlinmed silar klklall nt skrdenser påel dat livispå rin'
+		'rerdetyldgyl seukegensjotal else le jon eteilmmeis feiatakel'
+		'kriavnvar pr lean ppenavtet ug fekommannøkger kaugy pask  hv'
+		'on kan nøldereslenrenge  viistar økkiskignpe blivn egndrener'
+		' arutteneriv du fr laprojenekslikstrat are te miommtegeriapp'
+		'lgendatenkondu lag alta undiv gt ligndr unfralgtmmamerernngs'
+		'ndo heangid al  ansigedest ersileill tahviinjantelelg ontmap'
+		'jerelsordumegn engfør saort berd skara atuorm nauk kalnjefik'
+		'asstrermaretken slut enslse grtatvenskeoveess haargntaate bl'
+		'rdisel adennlut dareprtistitanivelesmet ba tosluninkk gna n '
+		'teserdgjeoreasjlisageesisissetsen føvelikarsekst ovssetid sy'
+	),
+	'nl': (
+		'en an et de  ge deandstaver be vaeenvan inester nde ve nisch'
+		' optaningnie heie is oor isbesaarietaankentie maerend dente '
+		' alrenng  onder eeordhet voentege tengegel restein rdeten ka'
+		'genrd al or  toerserduitlen mees gebeldls ar  panaaeermenst '
+		' navooati stisccht cotaleke enns tervenel evegevkandig arlle'
+		' wo aaacheli biwor want ongmetruiebr uiangard tach  prondlij'
+		'igebru ba dole voeelegeeuikge chiendat  dialsindtaaalepro ko'
+		'ensam  saanson aalre kt arantatekoerwaaoptnenldioutalllin da'
+		' nose  micheijkit  moerwtelregtoe foconptiop  ofof ontntelan'
+		'fou leijdoneaamut id aatkke lawijgegpakslu grnst weijndt bij'
+		'reeistdelmaaelloveakkran ompenmapgesezerdtij ertna areuidket'
+		'grower ziantikesiettelee liap  ca afndats  syicaiekdinbarek '
+		'ig rijeriume seom rs chainsameieskererkakezijtonlieariintht '
+		'he ne  chmanoetjn jde ovreigindatteeede sindsrepmismerngsppe'
+		'arglaaeelsenld rwiescvin sowacke resra  poalihte anrt odeite'
+	),
+	'pl': (
+		'nieie  ni poanina  pr wy za naia  doeniwanniastaowa jech lik'
+		'rzepli plne  moprzny go egoów st możest w ścipispodjesych ko'
+		'awiwieżnaożnanyki ać ji rzyej znado raw odku ostier st z ane'
+		'praczy reuży lije czecjino  us siien in opentdannyc pa użcie'
+		'wy owyczala katika i ię  sesięnik roem konyć ka wa ik ikuja '
+		' tyoweodazentu procznza nazazwzy pow mazmi klami obcjadłodzi'
+		' znzytym kieera kakowacjmieneg błbra wibieci miaalesu owiit '
+		'ko men gity waroleuczluctalklugitpcjopcłowaln tealo skywaorz'
+		'tawapitan zmicz sytorkcjzapjącle logak  arystonyionist dldla'
+		' czzasforustpol alstrrozanoło artzonietacz luszydowresinijśc'
+		'oczkówlicwor weonecenumeskipozli ub ransekto twolubwidataść '
+		'rowtów walecrtoościepormez  spakoian coić  jaby ersra graobi'
+		'rmaidłwymeceanatoś tałącączastze wykjak tomi rakośćramnakyma'
+		'ająfik wsekcnalisazienejuni nozysięcteraki zotrząd yfizosbłą'
+		'odczance eksłądeprujewerące daeślwej bronaielże dniwyponozyć'
+	),
+	'pt': (
+		' dede ão do  coos da  se paadoar  a çãoro  inas  rera ficent'
+		'es  ficom esnão nãparem  o er connteeirarate iro noto cheich'
+		'or heiicaada pr umsta lita  poido catra doaçãter foest darad'
+		'menno el um veldosal verontposma des ma enpor exqueistia for'
+		' emmpoíveres imntrimp ta teesp e omeme ida di é  faandeci su'
+		'essmancadlizossse izasãoou  ar ve quproom prealiõessívnom al'
+		'io spessíesclidntolinerrlocinaserha so finir  si ou opalhtad'
+		'iniera us b efiura errmaifiintca lo tes mondorroortsecperáli'
+		'ormçõedefpo ionmo  aovál x  vaue ao umainvdadfalcarrecadena '
+		'tar saectocasteho temis strlicompnvápri meciaers asamaco tam'
+		'lhaodeve actros peomanderia chmboinhnhaval loecçrio accçãdas'
+		'cesboltivereicoranraraltrtausa naamepecdoropçla oloantacoote'
+		'calargtilaloreppacsemmasiliendcrire nho tielo aptiple ten to'
+		' barelupocha ne lerimualndiemarocntapodtallisitoquivo tosero'
+		'ncitriscopas stnalhecomo símatcidabeciocotanhturencsím trrem'
+	),
+	'ro': (
+		' dede te re are nuul ea  seentle tă  înrea conu  in fiiun re'
+		'stentrestate a ză  peat trufișier es di nese ie țiu pruneîn '
+		'ru azăpennummen cacarrului oareaz poeleileneaișișiela intica'
+		'terluinteistume la un cu liulunt ne ați suor ire macă  extat'
+		'erecțivalsta aralicheatăectră  actorconcomri un nă  si fo op'
+		'lizficii cu verloc stia ilicessecer să iza aluni o ifi daal '
+		'imbpreurirecștelictulit  pa șica  saeroți ta proalostroattil'
+		'in ut oca vainiecțutiecueruși me oriau  er ut tiaratartrear '
+		'turid bil s lă din moinepțirmares b roaei foreri chactst cat'
+		'poaloraceicilultranecimp meormopț vece rar taprisimandbol să'
+		' afinadesmbopersiurat au no puite trzatdatciticăabisautrilid'
+		'ări spparpor im adimeerslinrilionptativezăcuteptatochicteert'
+		'omp scșireștale ciive loastortputhei doțieînctipblilimtabmul'
+		'regesamanminitămatind nioluutuinsafițințiiițiscunaldircun x '
+		'stăanăoruesc birtindera ecicepdă ealeșispeermriepliteamaicri'
+	),
+	'ru': (
+		' неть ени по прне ие ия ние в атьый пол ко зака ова раая но '
+		'ся ольстрменля нияий ный выет  длпер соайл фафайтсяить надля'
+		'анипреразго на про оброввернныетсваталоудаки ой скидал удере'
+		'ов  пе редел отредии  па исльз сиска кальнкомспоогоост доста'
+		'естсь анное ые ством ван интрола ает стли ленеменовиспстикий'
+		' с подентченустсименнзовельпислосприосьданера изта каяандых '
+		'ироектловневует и щендерначмет имтортелволныеран опзнаитерем'
+		'катклюлючошите икашибимвист ошказненможмвоива веержибкравден'
+		'аражентанзаппусноерамжноногазаен ныхбрапарамецииьзоти илинно'
+		'ацира бканаязме сл сеата тоачездержирокстослийл мещресимеаль'
+		'азд номерок возтны клкциинсокаещеавирежернвае аролножнпраобр'
+		'атеконево мото аноопунстман да илер ьнырек укукаход зннойфор'
+		'слевлеми  сптно этда змочитей нскенеозмко ормрмаию етр быиче'
+		' мари товфиколо усталчес баьнопосоматекйлаодибликорытьле еск'
+		'опетруводнепожеедепо однрукрегдопан мя ны ориексадаедоэто та'
+	),
+	'sk': (
+		' prie  po nena je nie nané ovaný  je sú sapresa borsúbúbovan'
+		'inaov iť ať  vyka ia  re nieničinrovstamenná lo  zaor ujenep'
+		'ky re  v  do nápodprikon chverostch aniba  od in ak alte zna'
+		' koho str bapouentoužožnres mo sp stko  zostuácibol sene  ve'
+		'om iadmožká stiast sy obaleaný machyebopríhybto  a namcieru '
+		'orulatzovprotorkazvaťplaatntavnáz ad sktovhod holikrep arden'
+		'ázo s anétup vožnéistávaenýta adrbal vý toýchteľtvoého pa zá'
+		'epoaloodpíkaskooverazsloateoroakonenny dreodnicknovforalíská'
+		'niadnodar deikalíkobrbo arikcipornasti užiormeplcia roer leb'
+		'ké lovblinskriari  čí mekovredbrapubublívaštačasvoroloní len'
+		'estoznla azyenéepunotnt rmáovýej ou  nook žívku práužívoľdpo'
+		'sť vý  zlnosam aliybaadatu  heilo zntalvatodatanby  boamerík'
+		'čítítaumele az arcrilspr riet no trekto janed kaori sopisoľb'
+		'skaaviak sahandvyptnýsekerztypmiesymžia tetrokľúľúčrziesá kľ'
+		'sárrenra ký  tynčitinočaposrávložčendo va itehalzlypíslyh ča'
+	),
+	'sl': (
+		'na ka  pr na poje ni inačin zaščipre ni izno ti anj jeki ja '
+		'ne  nenjeskadat dasta mo kopriatotek doče ote seostke  matot'
+		'za podikamenreden tevstiran v ogoočezna panosrazpor st in re'
+		'likin ga  ramogko gočoraime vrlo jenpakov pis alta ijaljaali'
+		'nikse an ih va  imli to vanegaeni sate itekov spnamnja z la '
+		'bli kaena od ve obrepodaravavetan sivil deiloanianditievensk'
+		' arednovast ljenakem aj akestravira rabskiati bramevel tievi'
+		've kazjavakaest upavaposšteenoistočiupo vsproeljapaot me ira'
+		'ma napstoubldolanaca ri  s eke meizpica soovejannščnastreara'
+		'avner da epupub če štent bapra ukjščločvengraevačenneg kiisa'
+		' biter lakraakoeznre  no skzpikot znmanastjskvarolorsttav lo'
+		'enetratipuka tavrsrajev dnojemlju opdennt  te usedenihhod tr'
+		'jo nevvezek am  beik on oljodpketkonenjetiratanovnilovet pol'
+		'argetoak renmo sanarice izbizv piom rejritbitrempišine enema'
+		'ipkška isaz ekakljle ezireznovsteintmesbrajučvedikiovodelram'
+	),
+	'sr': (
+		' прје  пока  не на дана  зане  једатње  из сада  ники  копре'
+		'текатоста одња но за отева ориијени  у тотостке ава моредти '
+		'та ма одескиањеподпраањапро реан ја им са равујеистпис доија'
+		' ст синијра ска каисп опдељприте меном ли иваак  гррем исциј'
+		'икакорстизив врам  ве сезнаазинос и ла араакоспрсимогумогван'
+		'емепоз талазовако илигу исавањ бику ина бртањнскдржнисимаење'
+		'имбболрешешк марисмбосамликгреодрекаоданазеднсе риј ра упели'
+		'адрављог штаве разрајпосеноновениема осоветав меераранстоата'
+		'еке об арброем енаци днорој илвреораој шкаитаграанинеиторај '
+		'ао еис дину их ржаваромедреспиент бато рекоревелспенакареект'
+		'ака св усопцличавиазнстрчитискумепци суен авнизвитивезуспнем'
+		'ештсте деив никчинизлкљуључзлатраверрењуласт озн акју мешнеп'
+		'ељаод ви екусадблирадупољаките списусу епо беијукранаранамер'
+		'сноичиалидираноастамамо ира иниретакансрамкаовљатанкомнатбит'
+		'ељколанавворногтајреничкедбво ајуестаци виатиамоандља тваљен'
+	),
+	'sv': (
+		' inen er ingntete förint föerateran et ar ör ng de ra  an st'
+		' deandndeiontt  kota  kall ninändill ti mefiller fi enskasta'
+		'tilom ka veron  re i väntioade av maär stektindaangllemed so'
+		'entattrinkan atararadna  äreri sk sagennd isked  tatig utata'
+		'tannväanvnt  arngeellad ortden paga nga se mitales varav yck'
+		'el komfel vaas la ernist viat namch ati omektmenstr federsom'
+		're manserettundal ig  läckeallnst på nammaileltidesst ntangs'
+		'det oc simat noochpå ilt sylag elamn baelalan prant halisran'
+		'datersrengt rt insonegilare altaril ttaommindin igt flsa for'
+		'katgarkon be etmer frdartececk kuakttornorrn aliinnkriogiagg'
+		'skrlenkenkalner bo gior rat oguppid ge ns mn  te lackaignlla'
+		'log x astprostä ny li vä bisk it  chmboormonsalarivarida ut '
+		'rma poärdflaäntharligdelensendsigma bolrde rale regäll veche'
+		' grsymlut mo tosekivekun lorerbaransketressamrartadiv stomis'
+		'tensluesstatarkaternatet cotra dialokadöveymbfinrd graec  da'
+	),
+	'tr': (
+		' bierilanin an ir  deen larama baler do ya kabiraraer  geya '
+		'arıiliile veri  di içanı saor yor kuiçi olasılamsyadososyli '
+		'lençinle ak ar  sealama sı  taini padı değkleeçede  kosteıla'
+		'llalemeği bealı ma hani ndasi nde areneullekl bu alindda ana'
+		'kul yeçeretibileme giadıesirı şledilringeçenidi la ınıandata'
+		'ayı i iz lı rakır tanne olalirik  ilmadeliiyo sodeniri adaya'
+		'terme mantiruruın tır dave yennı başistki ca dır ay işta ek '
+		'tarrsisizers si yoangişl anyazit belna eresin göinehatatıal '
+		'iziıyolleyalnamverlmaet mi danındsınırısay heula kiok karele'
+		' boyarng edilikrilsonce ğişdizrmarlaçıkseç in tebu isirınşti'
+		'ılıyasısıti  güleş reyanemi lipar çandiyerrılzindirrleon amı'
+		'masre ey oluketmal çıra linşarnınyok önerlgerarirulğerış  ne'
+		'nımnin uyabiürügitncemakgünend sıeyeeğeel il ldırmemeyse tı '
+		'unueyakenonu me noadauluvey conmeçenği kte ekunayapilm süam '
+		'turrante  tükalenmndıstaçalnumnahaltmar milisun lışimlazınek'
+	),
+	'uk': (
+		'ка  неня нняти  по вине ькаськна ий  заеннувано ванпер пранн'
+		' коереати накорів  до пі ма рося ний у роз пезнавідоголя го '
+		'аноорині стаисттан фапро мо каалоайл пафайитичендля длвикрис'
+		'араикоих еноовиіст синачаче ст таандоми віть помстрват рева '
+		'ент даореповдо  буовадалльн обіднла ресрамденнихписвдаекттри'
+		'мил з данпіднсьприилк баальки комредія анилос якми  інманося'
+		'волділостра рекпар вдсимверновтовстийсь саленздіоздопе знхід'
+		' арказпівимває мво містоії кат сеанімента им можктновіан  вк'
+		'ногвкаку екоом амежен тизміазазапконеранекок ранримзанбо тьс'
+		'ьсяівнмет спвор чиід омаікащо лкаробовуабоковті ою лівтипанг'
+		'рит абазвназтни клутитвоічнрядсувапи веільмін є алаавадометр'
+		'торму ріватаово білі лу вивйл мовесуагари ціїстуви ідоійсоро'
+		'малмісматлан чаанамає бе щобут опецьчасстьза вніизндна ва ді'
+		'аленг ствцькджеанскодпотпортівнев встал кр і  ряклюінсренест'
+		'лючрі кцікийнтаканзавнен ноої евіма су читнимстітріло фік те'
+	),
+}
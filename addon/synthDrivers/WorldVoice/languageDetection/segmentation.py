@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""
+Run-length segmentation for language detection.
+
+Every code point is mapped once to a category code, so a string is split
+into maximal runs of characters the detector treats alike with a single
+str.translate() and a single regex scan, instead of classifying it one
+character at a time in Python.
+"""
+
+from array import array
+import re
+import sys
+
+from .blocks import BLOCK_INDEX, BLOCK_NAMES, BLOCK_PAGES, BLOCK_RSHIFT, PAGE_SHIFT, block_id
+
+# Category codes. Alphabetic and other characters get CHARSET_BASE plus the
+# id of their block, so characters of one charset share a code.
+NEUTRAL = 0  # whitespace
+DIGIT = 1
+PUNCTUATION = 2  # non-alphabetic characters in the ASCII blocks
+SYMBOL = 3  # speech symbols
+CHARSET_BASE = 0x10
+
+# Charset ids are the block ids of blocks.py, 0 (None) for unassigned code points.
+CHARSETS = list(BLOCK_NAMES)
+CHARSET_IDS = {charset: index for index, charset in enumerate(CHARSETS)}
+
+# The category table covers planes 0 to 2 (BMP, SMP and SIP); classify()
+# handles the rare characters above it. It holds one byte per code point, so
+# CHARSET_BASE plus the number of charsets must stay below 256.
+TABLE_SIZE = 0x30000
+
+_run_patterns = {}
+
+_SAME_CODE_RE = re.compile(r"(.)\1*", re.DOTALL)
+
+_SYMBOL_CODE = chr(SYMBOL)
+
+_category_table = None
+
+
+def charset_of(c):
+	return BLOCK_NAMES[block_id(ord(c))]
+
+
+def classify(c):
+	"""The category code of *c*, ignoring speech symbols."""
+	if c.isspace():
+		return NEUTRAL
+	if c.isdigit():
+		return DIGIT
+	cp = ord(c)
+	if not c.isalpha() and (cp >> BLOCK_RSHIFT) <= 0x8:
+		return PUNCTUATION
+	return CHARSET_BASE + block_id(cp)
+
+
+def _build_category_table():
+	"""
+	classify() for every code point below TABLE_SIZE, as bytes: the charset
+	codes are expanded from the pages of the block table, then the few
+	whitespace, digit and ASCII punctuation characters are overwritten.
+	"""
+	granules_per_page = 1 << (PAGE_SHIFT - BLOCK_RSHIFT)
+	granule_size = 1 << BLOCK_RSHIFT
+	pages = {}
+	table = bytearray()
+	for page in BLOCK_INDEX[:TABLE_SIZE >> PAGE_SHIFT]:
+		data = pages.get(page)
+		if data is None:
+			blocks = BLOCK_PAGES[page * granules_per_page:(page + 1) * granules_per_page]
+			data = pages[page] = b"".join(bytes((CHARSET_BASE + block,)) * granule_size for block in blocks)
+		table += data
+
+	# Every character below TABLE_SIZE except the surrogates, which are neither
+	# whitespace nor digits, decoded at C speed.
+	encoding = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+	chars = "".join(
+		array("I", range(first, last)).tobytes().decode(encoding)
+		for first, last in ((0, 0xD800), (0xE000, TABLE_SIZE))
+	)
+	for c in filter(str.isdigit, chars):
+		table[ord(c)] = DIGIT
+	for c in filter(str.isspace, chars):
+		table[ord(c)] = NEUTRAL
+	for cp in range(0x9 << BLOCK_RSHIFT):
+		c = chr(cp)
+		if not c.isalpha() and not c.isdigit() and not c.isspace():
+			table[cp] = PUNCTUATION
+	return bytes(table)
+
+
+def category_table():
+	"""Code point -> category code for every code point below TABLE_SIZE, one byte each."""
+	global _category_table
+	if _category_table is None:
+		_category_table = _build_category_table()
+	return _category_table
+
+
+def symbol_chars(identifiers):
+	"""
+	Regex finding the single-character speech symbols, which iter_runs() marks
+	as SYMBOL over the category table, None when there are none.
+	"""
+	single = sorted(i for i in identifiers if len(i) == 1)
+	if not single:
+		return None
+	return re.compile("[%s]" % "".join(re.escape(i) for i in single))
+
+
+def symbol_pattern(identifiers):
+	"""
+	Combined regex finding the multi-character speech symbols in one scan,
+	longest identifier first where several start at the same position.
+	Single-character symbols are marked in the category table instead.
+	"""
+	multi = sorted((i for i in identifiers if len(i) > 1), key=len, reverse=True)
+	if not multi:
+		return None
+	return re.compile("|".join(re.escape(i) for i in multi))
+
+
+def run_pattern(ignoreNumbers=False, ignorePunctuation=False):
+	"""
+	Regex over translated category codes matching one run per decision the
+	detector has to make. Characters that never change the detector state
+	(whitespace, and digits or punctuation when configured to be ignored) are
+	absorbed into the surrounding run, digits and punctuation that are not
+	ignored form one run together, and every speech symbol is a run of its own.
+	"""
+	key = (ignoreNumbers, ignorePunctuation)
+	try:
+		return _run_patterns[key]
+	except KeyError:
+		pass
+	neutral = [NEUTRAL]
+	ignore = []
+	for category, ignored in ((DIGIT, ignoreNumbers), (PUNCTUATION, ignorePunctuation)):
+		(neutral if ignored else ignore).append(category)
+	neutral = "".join(re.escape(chr(category)) for category in neutral)
+	alternatives = [f"[{neutral}]+", re.escape(chr(SYMBOL))]
+	if ignore:
+		ignore = "".join(re.escape(chr(category)) for category in ignore)
+		alternatives.append(f"[{ignore}][{ignore}{neutral}]*")
+	alternatives.append(f"(.)(?:\\1|[{neutral}])*")
+	pattern = _run_patterns[key] = re.compile("|".join(alternatives), re.DOTALL)
+	return pattern
+
+
+def iter_runs(text, table, pattern, symbols=(), symbolPattern=None, symbolChars=None):
+	"""
+	Yield (category, start, end) for the runs of *text* matched by *pattern*
+	(see run_pattern()); category is the code of the first character.
+	Matches of *symbolPattern* and *symbolChars* (see symbol_chars()) are
+	yielded as single SYMBOL runs.
+	"""
+	codes = text.translate(table)
+	if symbolChars is not None:
+		codes = _mark_symbols(text, codes, symbolChars)
+	if symbolPattern is None:
+		yield from _iter_runs(text, codes, pattern, symbols, 0, len(text))
+		return
+	pos = 0
+	for m in symbolPattern.finditer(text):
+		start, end = m.span()
+		if start > pos:
+			yield from _iter_runs(text, codes, pattern, symbols, pos, start)
+		yield SYMBOL, start, end
+		pos = end
+	if pos < len(text):
+		yield from _iter_runs(text, codes, pattern, symbols, pos, len(text))
+
+
+def _mark_symbols(text, codes, symbolChars):
+	"""*codes* with the code of every match of *symbolChars* in *text* replaced by SYMBOL."""
+	pieces = []
+	pos = 0
+	for m in symbolChars.finditer(text):
+		start = m.start()
+		pieces.append(codes[pos:start])
+		pieces.append(_SYMBOL_CODE)
+		pos = start + 1
+	if not pieces:
+		return codes
+	pieces.append(codes[pos:])
+	return "".join(pieces)
+
+
+def _iter_runs(text, codes, pattern, symbols, pos, endpos):
+	for m in pattern.finditer(codes, pos, endpos):
+		start, end = m.span()
+		category = ord(codes[start])
+		if category < TABLE_SIZE:
+			yield category, start, end
+			continue
+		# Beyond the table translate() leaves the character unchanged.
+		for index in range(start, end):
+			c = text[index]
+			yield SYMBOL if c in symbols else classify(c), index, index + 1
+
+
+def iter_category_runs(text):
+	"""
+	Yield (category, start) for each run of characters of *text* with the
+	same category code, speech symbols not taken into account.
+	"""
+	codes = text.translate(category_table())
+	for m in _SAME_CODE_RE.finditer(codes):
+		start = m.start()
+		category = ord(codes[start])
+		if category >= TABLE_SIZE:
+			category = classify(text[start])
+		yield category, start
@@ -1,10 +1,15 @@
 import csv
+import json
 from pathlib import Path
+import queue
 import shutil
+import threading
 import time
 
 import addonHandler
+import config
 import gui
+from logHandler import log
 import wx
 
 addonHandler.initTranslation()
@@ -14,36 +19,202 @@ parent_dir = script_dir.parent.parent
 log_dir = parent_dir / "log"
 log_dir.mkdir(parents=True, exist_ok=True)
 
+LOG_FORMATS = ("csv", "jsonl")
+
 
 class PipelineLog:
+	"""
+	Speech pipeline log written by a background thread.
+
+	write() only queues the record, so logging does not hold up speech. The
+	writer thread appends records in batches, rotates the file once it grows
+	past *max_bytes* or is older than *max_age* seconds and keeps
+	*backup_count* rotated files. When the queue is full the record is
+	dropped and counted instead of blocking the caller.
+	"""
 	FIELDNAMES = ["id", "label", "timing", "timestamp", "sequence"]
+	# Seconds export() waits for the queued records before it exports the files as they are
+	EXPORT_FLUSH_TIMEOUT = 2
+
+	def __init__(
+			self,
+			log_name,
+			max_bytes=4 << 20,
+			max_age=24 * 60 * 60,
+			backup_count=3,
+			queue_size=4096,
+			batch_size=256,
+			flush_interval=0.5,
+	):
+		self.name = Path(log_name).stem
+		self.max_bytes = max_bytes
+		self.max_age = max_age
+		self.backup_count = backup_count
+		self.batch_size = batch_size
+		self.flush_interval = flush_interval
+
+		self._queue = queue.Queue(maxsize=queue_size)
+		self._thread = None
+		self._thread_lock = threading.Lock()
+		# Guards the log files and _created between the writer thread and export()
+		self._files_lock = threading.Lock()
+		self._created = {}
+		self.written = 0
+		self.dropped = 0
+		self._reported_dropped = 0
+
+	@property
+	def format(self):
+		try:
+			fmt = config.conf["WorldVoice"]["log"]["format"]
+		except KeyError:
+			return "csv"
+		return fmt if fmt in LOG_FORMATS else "csv"
+
+	@property
+	def log_file(self):
+		return self._path(self.format)
 
-	def __init__(self, log_name):
-		self.log_file = log_dir / log_name
-		file_exists = self.log_file.exists()
-		with self.log_file.open(mode="a", encoding="utf-8", newline="") as csvfile:
-			writer = csv.DictWriter(csvfile, fieldnames=self.FIELDNAMES)
-			if not file_exists:
-				writer.writeheader()
+	def _path(self, fmt, index=0):
+		if index:
+			return log_dir / f"{self.name}.{index}.{fmt}"
+		return log_dir / f"{self.name}.{fmt}"
 
 	def write(self, _id, label, timing, sequence):
-		with self.log_file.open(mode="a", encoding="utf-8", newline="") as csvfile:
-			writer = csv.DictWriter(csvfile, fieldnames=self.FIELDNAMES)
-			writer.writerow({
-				"id": _id,
-				"label": label,
-				"timing": timing,
-				"timestamp": time.time(),
-				"sequence": sequence,
-			})
+		self._ensure_thread()
+		try:
+			self._queue.put_nowait((_id, label, timing, time.time(), tuple(sequence)))
+		except queue.Full:
+			self.dropped += 1
+
+	def flush(self, timeout=None):
+		"""
+		Wait until the records queued so far have been written; records queued
+		meanwhile are not waited for. Returns False if that takes longer than
+		*timeout* seconds.
+		"""
+		if self._thread is None:
+			return True
+		deadline = None if timeout is None else time.monotonic() + timeout
+		written = threading.Event()
+		try:
+			self._queue.put(written, timeout=timeout)
+		except queue.Full:
+			return False
+		return written.wait(None if deadline is None else max(0, deadline - time.monotonic()))
+
+	def stats(self):
+		return {
+			"queued": self._queue.qsize(),
+			"written": self.written,
+			"dropped": self.dropped,
+		}
+
+	def _ensure_thread(self):
+		if self._thread is not None:
+			return
+		with self._thread_lock:
+			if self._thread is None:
+				thread = threading.Thread(target=self._run, name="WorldVoicePipelineLog", daemon=True)
+				thread.start()
+				self._thread = thread
+
+	def _run(self):
+		while True:
+			batch = [self._queue.get()]
+			deadline = time.monotonic() + self.flush_interval
+			while len(batch) < self.batch_size:
+				timeout = deadline - time.monotonic()
+				if timeout <= 0:
+					break
+				try:
+					batch.append(self._queue.get(timeout=timeout))
+				except queue.Empty:
+					break
+			records = [item for item in batch if not isinstance(item, threading.Event)]
+			try:
+				if records:
+					with self._files_lock:
+						self._write_batch(records)
+			except Exception:
+				log.error("Failed to write the WorldVoice pipeline log", exc_info=True)
+			finally:
+				for item in batch:
+					if isinstance(item, threading.Event):
+						# A flush() waiting for the records queued before it.
+						item.set()
+					self._queue.task_done()
+
+	def _write_batch(self, batch):
+		fmt = self.format
+		path = self._path(fmt)
+		self._rotate_if_needed(path, fmt)
+		new_file = not path.exists()
+		if new_file:
+			self._created[path] = time.time()
+
+		with path.open(mode="a", encoding="utf-8", newline="") as logfile:
+			if fmt == "jsonl":
+				for _id, label, timing, timestamp, sequence in batch:
+					logfile.write(json.dumps(
+						{
+							"id": _id,
+							"label": label,
+							"timing": timing,
+							"timestamp": timestamp,
+							"sequence": [item if isinstance(item, str) else repr(item) for item in sequence],
+						},
+						ensure_ascii=False,
+						separators=(",", ":"),
+					))
+					logfile.write("\n")
+			else:
+				writer = csv.writer(logfile)
+				if new_file:
+					writer.writerow(self.FIELDNAMES)
+				writer.writerows(
+					(_id, label, timing, timestamp, list(sequence))
+					for _id, label, timing, timestamp, sequence in batch
+				)
+		self.written += len(batch)
+
+		if self.dropped != self._reported_dropped:
+			log.debugWarning(f"WorldVoice pipeline log queue full, {self.dropped} records dropped so far")
+			self._reported_dropped = self.dropped
+
+	def _rotate_if_needed(self, path, fmt):
+		try:
+			stat = path.stat()
+		except FileNotFoundError:
+			return
+		created = self._created.setdefault(path, stat.st_ctime)
+		if stat.st_size < self.max_bytes and time.time() - created < self.max_age:
+			return
+
+		for index in range(self.backup_count - 1, 0, -1):
+			backup = self._path(fmt, index)
+			if backup.exists():
+				backup.replace(self._path(fmt, index + 1))
+		if self.backup_count > 0:
+			path.replace(self._path(fmt, 1))
+		else:
+			path.unlink()
+		del self._created[path]
+
+	def _log_files(self, fmt):
+		"""Existing log files of *fmt*, oldest first."""
+		files = [self._path(fmt, index) for index in range(self.backup_count, 0, -1)]
+		files.append(self._path(fmt))
+		return [file for file in files if file.exists()]
 
 	def export(self):
+		fmt = self.format
 		with wx.FileDialog(
 			# Translators: The title of the Export pipeline log file window
 			gui.mainFrame, message=_("Export pipeline log files..."),
 			defaultDir="",
-			defaultFile="pipeline_log.csv",
-			wildcard="csv files (*.csv)|*.csv",
+			defaultFile=f"pipeline_log.{fmt}",
+			wildcard=f"{fmt} files (*.{fmt})|*.{fmt}",
 			style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT
 		) as entryDialog:
 			if entryDialog.ShowModal() != wx.ID_OK:
@@ -51,8 +222,27 @@ class PipelineLog:
 			dst = Path(entryDialog.GetPath())
 
 		try:
-			dst.parent.mkdir(parents=True, exist_ok=True)
-			shutil.move(str(self.log_file), str(dst))
+			# Speech keeps queueing records, so do not wait for the queue to run empty.
+			if not self.flush(self.EXPORT_FLUSH_TIMEOUT):
+				log.debugWarning("WorldVoice pipeline log export did not wait for all queued records")
+			with self._files_lock:
+				files = self._log_files(fmt)
+				if not files:
+					raise FileNotFoundError(str(self._path(fmt)))
+				dst.parent.mkdir(parents=True, exist_ok=True)
+				if len(files) == 1:
+					shutil.move(str(files[0]), str(dst))
+				else:
+					# Concatenate the rotated files, keeping only the first CSV header.
+					with dst.open(mode="w", encoding="utf-8", newline="") as out:
+						for index, file in enumerate(files):
+							with file.open(encoding="utf-8", newline="") as src:
+								if index and fmt == "csv":
+									src.readline()
+								shutil.copyfileobj(src, out)
+					for file in files:
+						file.unlink()
+				self._created.clear()
 			wx.MessageBox(
 				_("Log exported to:\n{}").format(dst),
 				_("Success"),
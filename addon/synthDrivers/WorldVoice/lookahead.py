@@ -0,0 +1,111 @@
+import queue
+import threading
+
+from logHandler import log
+from speech import sayAll
+
+
+class DetectionLookahead:
+	"""
+	Language detection of queued say-all speech on a background thread.
+
+	NVDA filters a say-all sequence when it is queued, but the synth only
+	receives it, and detects its languages, once the speech queued before it
+	has been spoken. submit(), a filter_speechSequence handler moved behind
+	the ones registered before it, hands the filtered sequences to a worker
+	thread running LanguageDetector.predetect on them while the current line
+	is speaking, so speak() finds their strings in the detector cache and only
+	dispatches. Strings a filter registered later still changes miss the
+	cache and are detected by speak() as usual.
+
+	Sequences are predetected in the order they are queued, each starting in
+	the detection state the previous one ended in, as speak() will. At most
+	*max_pending* sequences wait for the worker; the others are left to
+	speak(). cancel() drops the waiting sequences.
+	"""
+
+	def __init__(self, detector, max_pending=8):
+		self.detector = detector
+		self.max_pending = max_pending
+		self._queue = None
+		self._thread = None
+		self._thread_lock = threading.Lock()
+		# Bumped by cancel(), sequences queued before are skipped.
+		self._generation = 0
+		# Number of the last sequence submitted, to spot the ones dropped in between.
+		self._submitted = 0
+		self.detected = 0
+		self.dropped = 0
+
+	def submit(self, speechSequence):
+		speechSequence = list(speechSequence)
+		if self.max_pending <= 0 or not sayAll.SayAllHandler.isRunning():
+			return speechSequence
+		if not any(isinstance(item, str) for item in speechSequence):
+			return speechSequence
+		self._ensure_thread()
+		self._submitted += 1
+		try:
+			self._queue.put_nowait((self._generation, self._submitted, tuple(speechSequence)))
+		except queue.Full:
+			self.dropped += 1
+		return speechSequence
+
+	def cancel(self):
+		self._generation += 1
+		if self._queue is None:
+			return
+		try:
+			while True:
+				self._queue.get_nowait()
+		except queue.Empty:
+			pass
+
+	def terminate(self):
+		if self._thread is None:
+			return
+		self.cancel()
+		self._queue.put(None)
+		self._thread.join()
+		self._thread = None
+
+	def stats(self):
+		return {
+			"pending": self._queue.qsize() if self._queue is not None else 0,
+			"detected": self.detected,
+			"dropped": self.dropped,
+		}
+
+	def _ensure_thread(self):
+		if self._thread is not None:
+			return
+		with self._thread_lock:
+			if self._thread is None:
+				self._queue = queue.Queue(maxsize=self.max_pending)
+				thread = threading.Thread(target=self._run, name="WorldVoiceDetectionLookahead", daemon=True)
+				thread.start()
+				self._thread = thread
+
+	def _run(self):
+		detector = self.detector
+		generation = None
+		number = None
+		state = None
+		while True:
+			item = self._queue.get()
+			if item is None:
+				return
+			itemGeneration, itemNumber, speechSequence = item
+			if itemGeneration != self._generation:
+				continue
+			if itemGeneration != generation or number is None or itemNumber != number + 1:
+				# New say-all or a sequence dropped before this one: start over
+				# from the state the detector is in now.
+				state = detector.carried_state()
+			generation, number = itemGeneration, itemNumber
+			try:
+				state = detector.predetect(speechSequence, state)
+				self.detected += 1
+			except Exception:
+				log.error("WorldVoice language detection lookahead", exc_info=True)
+				number = None
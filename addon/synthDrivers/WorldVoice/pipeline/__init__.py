@@ -1,7 +1,10 @@
+from dataclasses import dataclass
 from functools import wraps
 from itertools import chain, pairwise
+from logging import DEBUG
 import re
 import string
+import time
 from typing import Iterable, Iterator, Union
 import uuid
 
@@ -13,7 +16,9 @@ from synthDriverHandler import getSynth
 
 from .._speechcommand import WVLangChangeCommand
 from ..log import PipelineLog
-from .settings import get_effective_pipeline_settings
+from ..profiler import profiler
+from .cache import SegmentCache
+from .settings import get_pipeline_settings
 
 SpeechCmd = Union[str, "BaseSpeechCommand"]
 pl = PipelineLog("pipeline.csv")
@@ -24,6 +29,16 @@ _NUMBER_RE = re.compile(r"[0-9\-\+]+[0-9.:]*[0-9]+|[0-9]")
 _CH_SPACE_RE = re.compile(r"(?<=[\u4e00-\u9fa5])\s+(?=[\u4e00-\u9fa5])")
 
 _SENTENCE_END_RE = re.compile(r"^[.:;,?!](?:\s|$)")
+# Same as _SENTENCE_END_RE, for Pattern.match(string, pos, endpos) where "^" would not match at pos.
+_SENTENCE_END_AT_RE = re.compile(r"[.:;,?!](?:\s|$)")
+
+segment_cache = SegmentCache()
+
+# raw stage -> variant wrapped by with_speech_sequence_log
+_instrumented_stages = {}
+_instrumentation_enabled = False
+# Whether NVDA logged at debug level when the stages were last bound
+_debug_logging = False
 
 def with_order_log(label: str):
 	""" The order numbers are reversed because of recursion: the order number assigned earlier execution is greater than that of a later execution."""
@@ -43,29 +58,52 @@ def with_order_log(label: str):
 
 
 def with_speech_sequence_log(label: str):
+	"""
+	Build the instrumented variant of a stage. The stage itself is returned
+	unchanged; the variant is only registered while pipeline logging or the
+	latency profiler is on, see refresh_instrumentation().
+	"""
 	def decorator(func):
 		@wraps(func)
 		def wrapper(speechSequence):
-			_id = uuid.uuid4().hex
-			if (config.conf["general"]["loggingLevel"] == "DEBUG" or config.conf["WorldVoice"]["log"]["enable"]) and config.conf["WorldVoice"]["log"][label]:
-				speechSequence = list(speechSequence)
-				if config.conf["general"]["loggingLevel"] == "DEBUG":
+			debug = config.conf["general"]["loggingLevel"] == "DEBUG"
+			log_conf = config.conf["WorldVoice"]["log"]
+			record = log_conf["enable"]
+			logging = (debug or record) and log_conf[label]
+			profiling = profiler.enabled
+			if not (logging or profiling):
+				return func(speechSequence)
+
+			speechSequence = list(speechSequence)
+			if logging:
+				_id = uuid.uuid4().hex
+				if debug:
 					log.debug(f"speech sequence before {label} pipeline: {speechSequence}")
-				if config.conf["WorldVoice"]["log"]["enable"]:
+				if record:
 					pl.write(_id, label, "before", speechSequence)
-				speechSequence = func(speechSequence)
-				speechSequence = list(speechSequence)
-				if config.conf["general"]["loggingLevel"] == "DEBUG":
+			start = time.perf_counter()
+			speechSequence = list(func(speechSequence))
+			if profiling:
+				profiler.record(label, _engine_label(), time.perf_counter() - start)
+			if logging:
+				if debug:
 					log.debug(f"speech sequence after {label} pipeline: {speechSequence}")
-				if config.conf["WorldVoice"]["log"]["enable"]:
+				if record:
 					pl.write(_id, label, "after", speechSequence)
-			else:
-				speechSequence = func(speechSequence)
 			return speechSequence
-		return wrapper
+		_instrumented_stages[func] = wrapper
+		return func
 	return decorator
 
 
+def _engine_label():
+	synth = getSynth()
+	try:
+		return synth._voiceManager.defaultVoiceInstance.engine
+	except AttributeError:
+		return getattr(synth, "name", "")
+
+
 def listable(func):
 	@wraps(func)
 	def wrapper(speechSequence):
@@ -77,16 +115,32 @@ def listable(func):
 
 
 def get_ignore_comma_between_number():
-	settings = get_effective_pipeline_settings()
+	settings = get_pipeline_settings()
 	return settings.ignore_comma_between_number
 
 
 def get_number_mode():
-	settings = get_effective_pipeline_settings()
+	settings = get_pipeline_settings()
 	return settings.number_mode
 
 
-def get_translate_table():
+@dataclass(frozen=True)
+class DigitTable:
+	"""Digit translation tables for one number language and symbol dictionary revision."""
+	version: int
+	# digit -> replacement, for str.translate of a single character
+	table: dict[int, str]
+	# digit -> " " + replacement, so a digit run is spaced out by one str.translate
+	spaced: dict[int, str]
+
+
+_digit_table_key: tuple | None = None
+_digit_table: DigitTable | None = None
+_digit_table_version = 0
+
+
+def get_translate_table() -> DigitTable:
+	global _digit_table_key, _digit_table, _digit_table_version
 	synth = getSynth()
 	if synth.name == 'WorldVoice':
 		number_language = synth._numlan
@@ -95,6 +149,10 @@ def get_translate_table():
 		number_language = "Windows"
 		speech_symbols = None
 
+	key = (number_language, speech_symbols, getattr(speech_symbols, "revision", 0))
+	if key == _digit_table_key:
+		return _digit_table
+
 	# Build translation table for single digits
 	translate_table: dict[int, str] = {}
 	if speech_symbols:
@@ -103,22 +161,26 @@ def get_translate_table():
 				sym = speech_symbols.symbols[d]
 				if sym.language in (number_language, "Windows"):
 					translate_table[ord(d)] = sym.replacement or d
+	spaced_table = {ord(d): " " + translate_table.get(ord(d), d) for d in "0123456789"}
 
-	return translate_table
+	_digit_table_version += 1
+	_digit_table = DigitTable(_digit_table_version, translate_table, spaced_table)
+	_digit_table_key = key
+	return _digit_table
 
 
 def get_item_wait_factor():
-	settings = get_effective_pipeline_settings()
+	settings = get_pipeline_settings()
 	return settings.scaled_item_wait()
 
 
 def get_number_wait_factor():
-	settings = get_effective_pipeline_settings()
+	settings = get_pipeline_settings()
 	return settings.scaled_number_wait()
 
 
 def get_chinesespace_wait_factor():
-	settings = get_effective_pipeline_settings()
+	settings = get_pipeline_settings()
 	return settings.scaled_chinesespace_wait()
 
 
@@ -296,7 +358,12 @@ def _insert_WVLangChangeCommand_between_number(
 			if isinstance(item, (LangChangeCommand, WVLangChangeCommand)):
 				current_lang = item.lang or default_lang
 			continue
-		yield from merge_consecutive_strings(deduplicate_language_command(iter_number_speech_segments_language(item, current_lang, number_language)))
+		segments = segment_cache.get_or_build(
+			("number_language", item, current_lang, number_language),
+			item,
+			lambda: iter_number_speech_segments_language(item, current_lang, number_language),
+		)
+		yield from merge_consecutive_strings(deduplicate_language_command(segments))
 
 
 def iter_number_speech_segments_language(item, current_lang, number_language, number_re=_NUMBER_RE):
@@ -348,7 +415,7 @@ def inject_number_language(
 		return
 
 
-def _translate_number(raw: str, mode: str, table: dict[int, str]) -> Iterator[str]:
+def _translate_number(raw: str, mode: str, digits: DigitTable) -> Iterator[str]:
 	parts = raw.split(".")
 	for i, part in enumerate(parts):
 		if i > 0:
@@ -361,16 +428,15 @@ def _translate_number(raw: str, mode: str, table: dict[int, str]) -> Iterator[st
 			yield part
 			continue
 		if len(part) == 1:
-			yield " " + part.translate(table)
+			yield " " + part.translate(digits.table)
 			continue
 		pos = 0
 		for m in _PURE_NUMBER_RE.finditer(part):
 			start, end = m.span()
 			if start > pos:
 				yield " " + part[pos:start] + " "
-			digits = m.group()
 			# Emit digits spaced out and translated
-			yield " " + " ".join(d.translate(table) for d in digits)
+			yield m.group().translate(digits.spaced)
 			pos = end
 		if pos < len(part):
 			yield " " + part[pos:]
@@ -380,7 +446,8 @@ def _translate_number(raw: str, mode: str, table: dict[int, str]) -> Iterator[st
 def inject_number_mode(
 		speechSequence: Iterable[SpeechCmd],
 ) -> Iterator[SpeechCmd]:
-	mode = get_number_mode()
+	settings = get_pipeline_settings()
+	mode = settings.number_mode
 	translate_table = get_translate_table()
 
 	for item in speechSequence:
@@ -388,11 +455,12 @@ def inject_number_mode(
 			yield item
 			continue
 
-		synth = getSynth()
-		if synth.name == 'WorldVoice':
-			yield from merge_consecutive_strings(deduplicate_language_command(iter_number_speech_segments_mode(item, mode, translate_table)))
-		else:
-			yield from merge_consecutive_strings(iter_number_speech_segments_mode(item, mode, translate_table))
+		# The mode segments are all strings, so there is no language command to deduplicate.
+		yield from segment_cache.get_or_build(
+			("number_mode", item, settings.version, translate_table.version),
+			item,
+			lambda: merge_consecutive_strings(iter_number_speech_segments_mode(item, mode, translate_table)),
+		)
 
 
 def iter_number_speech_segments_mode(item, mode, translate_table, number_re=_NUMBER_RE):
@@ -425,17 +493,20 @@ def iter_number_speech_segments_mode(item, mode, translate_table, number_re=_NUM
 
 
 def merge_consecutive_strings(items):
-	buffer = ""
+	# Collect fragments and join once; repeated += is quadratic in the number of fragments.
+	buffer: list[str] = []
 	for item in items:
 		if isinstance(item, str):
-			buffer += item
+			# Empty strings were never yielded: they left the old "" buffer falsy.
+			if item:
+				buffer.append(item)
 		else:
 			if buffer:
-				yield buffer
-				buffer = ""
+				yield "".join(buffer)
+				buffer.clear()
 			yield item
 	if buffer:
-		yield buffer
+		yield "".join(buffer)
 
 
 # @with_order_log("chinesespace_wait_factor")
@@ -473,6 +544,49 @@ def inject_chinese_space_pause(
 			yield item[pos:]
 
 
+class _VoiceSwitchTracker:
+	"""
+	Track the voice instance selected by language-change commands so that
+	only commands that actually switch to a different voice are kept.
+	"""
+
+	def __init__(self, synth):
+		self._voice_manager = synth._voiceManager
+		self.default_instance = self._voice_manager.defaultVoiceInstance
+		self.default_language = synth.language
+		self.reset()
+
+	def reset(self):
+		self.voice_instance = self.default_instance
+		self.current_language = self.default_language
+
+	def resolve(self, lang):
+		return self._voice_manager.getVoiceInstanceForLanguage(lang) or self.default_instance
+
+	def switches(self, lang) -> bool:
+		# Skip if the language is actually unchanged
+		if lang == self.current_language:
+			return False
+
+		# Resolve the new language and its voice instance
+		if lang is None:							   # Revert to default language
+			new_instance = self.default_instance
+			self.current_language = self.default_language
+		else:
+			new_instance = self._voice_manager.getVoiceInstanceForLanguage(lang)
+			self.current_language = lang
+			if new_instance is None:				   # Fallback when no voice found
+				new_instance = self.default_instance
+
+		# Skip if the voice instance remains the same
+		if new_instance == self.voice_instance:
+			return False
+
+		# Effective switch: update state
+		self.voice_instance = new_instance
+		return True
+
+
 def deduplicate_language_command(speechSequence):
 	"""
 	Stream *speech_sequence* and emit only the language-change commands
@@ -486,36 +600,13 @@ def deduplicate_language_command(speechSequence):
 	   voice instance than the one currently in use.
 	3. Forward all non-language-change commands unchanged.
 	"""
-	synth = getSynth()
-
-	# Initial voice / language
-	voice_instance = default_instance = synth._voiceManager.defaultVoiceInstance
-	current_language = default_language = synth.language
+	tracker = _VoiceSwitchTracker(getSynth())
 
 	for command in speechSequence:
 		# Handle language-change commands
 		if isinstance(command, (LangChangeCommand, WVLangChangeCommand)):
-			# Skip if the language is actually unchanged
-			if command.lang == current_language:
-				continue
-
-			# Resolve the new language and its voice instance
-			if command.lang is None:					   # Revert to default language
-				new_instance = default_instance
-				current_language = default_language
-			else:
-				new_instance = synth._voiceManager.getVoiceInstanceForLanguage(command.lang)
-				current_language = command.lang
-				if new_instance is None:			   # Fallback when no voice found
-					new_instance = default_instance
-
-			# Skip if the voice instance remains the same
-			if new_instance == voice_instance:
-				continue
-
-			# Effective switch: update state and yield the command
-			voice_instance = new_instance
-			yield command
+			if tracker.switches(command.lang):
+				yield command
 		# Forward all other commands
 		else:
 			yield command
@@ -575,61 +666,412 @@ def inject_langchange_reorder(
 		yield from buffer
 
 
-def order_move_to_start_register():
-	# stack: first in last out
-	filter_speechSequence.moveToEnd(speech_viewer, False)
-	filter_speechSequence.moveToEnd(number_wait_factor, False)
-	filter_speechSequence.moveToEnd(item_wait_factor, False)
+# Stages in the order filter_speechSequence runs them once registered.
+CHAINED_STAGES = (
+	ignore_comma_between_number,
+	inject_number_language,
+	inject_number_mode,
+	inject_chinese_space_pause,
+	item_wait_factor,
+	number_wait_factor,
+	speech_viewer,
+)
 
-	filter_speechSequence.moveToEnd(inject_chinese_space_pause, False)
-	filter_speechSequence.moveToEnd(inject_number_mode, False)
-	filter_speechSequence.moveToEnd(inject_number_language, False)
+STAGE_LOG_LABELS = (
+	"ignore_comma_between_number",
+	"number_language",
+	"number_mode",
+	"chinesespace_wait_factor",
+	"item_wait_factor",
+	"number_wait_factor",
+	"speech_viewer",
+)
 
-	filter_speechSequence.moveToEnd(ignore_comma_between_number, False)
 
+def is_fused_enabled():
+	return config.conf["WorldVoice"]["pipeline"]["fused"]
 
-def order_move_to_end_register():
-	# queue: first in first out
-	filter_speechSequence.moveToEnd(ignore_comma_between_number, True)
 
-	filter_speechSequence.moveToEnd(inject_number_language, True)
-	filter_speechSequence.moveToEnd(inject_number_mode, True)
-	filter_speechSequence.moveToEnd(inject_chinese_space_pause, True)
+def _stage_log_enabled():
+	log_conf = config.conf["WorldVoice"]["log"]
+	if not (config.conf["general"]["loggingLevel"] == "DEBUG" or log_conf["enable"]):
+		return False
+	return any(log_conf[label] for label in STAGE_LOG_LABELS)
+
+
+class FusedPipeline:
+	"""
+	All pipeline stages compiled into a single-pass transform.
+
+	The output is identical to running the chained stages one after another,
+	but the speech sequence is walked once and every string is scanned once
+	for numbers; that match list is shared by the number language and number
+	mode stages. Settings are resolved once per utterance and the expansion
+	of each string is memoized in segment_cache.
+	"""
+
+	def __init__(self, settings, synth):
+		self.settings_version = settings.version
+		self.ignore_comma = settings.ignore_comma_between_number
+		self.number_mode = settings.number_mode
+		self.translate_table = get_translate_table()
+
+		chinesespace_wait = settings.scaled_chinesespace_wait()
+		item_wait = settings.scaled_item_wait()
+		number_wait = settings.scaled_number_wait()
+		self.chinese_pause = BreakCommand(chinesespace_wait) if chinesespace_wait > 0 else None
+		self.item_break = BreakCommand(item_wait) if item_wait > 0 else None
+		self.number_break = BreakCommand(number_wait) if number_wait > 0 else None
+
+		self.inject_language = hasattr(synth, "_voiceManager")
+		if self.inject_language:
+			self.number_language = synth._numlan
+			self.tracker = _VoiceSwitchTracker(synth)
+		self._voice_keys = {}
+
+	@classmethod
+	def from_current_settings(cls):
+		synth = getSynth()
+		return cls(get_pipeline_settings(synth=synth), synth)
+
+	def apply(
+			self,
+			speechSequence: Iterable[SpeechCmd],
+	) -> Iterator[SpeechCmd]:
+		item_break = self.item_break
+		number_break = self.number_break
+		# item_wait_factor compares raw strings, number_wait_factor the stripped ones.
+		previous_is_str = False
+		previous_number = None
+
+		for command in self._expand(speechSequence):
+			is_str = isinstance(command, str)
+			if item_break and previous_is_str and is_str:
+				yield item_break
+				previous_number = None
+			previous_is_str = is_str
+
+			if not is_str:
+				previous_number = None
+				yield command
+				continue
+
+			command = command.strip()
+			if not command:
+				continue
+			if number_break and previous_number is not None \
+			and _NUMBER_RE.match(previous_number) and _NUMBER_RE.match(command):
+				yield number_break
+			previous_number = command
+			yield command
+
+	def _expand(self, speechSequence):
+		current_lang = default_lang = self.tracker.default_language if self.inject_language else None
+
+		for item in speechSequence:
+			if not isinstance(item, str):
+				if self.inject_language:
+					if isinstance(item, (LangChangeCommand, WVLangChangeCommand)):
+						current_lang = item.lang or default_lang
+				elif isinstance(item, WVLangChangeCommand):
+					continue
+				yield item
+				continue
+
+			key = (
+				"fused",
+				item,
+				self.settings_version,
+				self.translate_table.version,
+				self._voice_key(current_lang),
+			)
+			yield from segment_cache.get_or_build(
+				key,
+				item,
+				lambda: self._expand_string(item, current_lang),
+			)
+
+	def _voice_key(self, current_lang):
+		"""
+		Everything the voice deduplication of one string depends on, so cached
+		expansions are not reused after the language to voice mapping changed.
+		"""
+		if not self.inject_language:
+			return None
+		try:
+			return self._voice_keys[current_lang]
+		except KeyError:
+			pass
+		tracker = self.tracker
+		number_language = self.number_language
+		num_lang = number_language if number_language != "default" else current_lang
+		voice_key = (
+			num_lang,
+			current_lang,
+			tracker.default_language,
+			tracker.default_instance,
+			tracker.resolve(num_lang),
+			tracker.resolve(current_lang),
+		)
+		self._voice_keys[current_lang] = voice_key
+		return voice_key
+
+	def _expand_string(self, item, current_lang):
+		if self.ignore_comma and "," in item:
+			item = _COMMA_NUMBER_RE.sub("", item)
+		if not item:
+			return
+
+		matches = [m.span() for m in _NUMBER_RE.finditer(item)]
+		if self.inject_language and matches:
+			parts = self._language_parts(item, matches, current_lang)
+		else:
+			parts = ((0, len(item)),)
+
+		# Text parts are (start, end) spans of *item*; a span is only copied
+		# when it is emitted, or once when its numbers are rewritten.
+		index = 0
+		for part in parts:
+			if not isinstance(part, tuple):
+				yield part
+				continue
+			start, end = part
+			if index < len(matches) and matches[index][1] <= end:
+				text, index = self._number_text(item, part, matches, index)
+				yield from self._chinese_space(text, 0, len(text))
+			else:
+				# Span boundaries sit next to digits, so scanning the span in place
+				# sees the same lookaround context as scanning a sliced copy.
+				yield from self._chinese_space(item, start, end)
+
+	def _language_parts(self, item, matches, current_lang):
+		"""
+		Emulate inject_number_language for one string: wrap every number with
+		language commands, drop the ones that do not switch voice and merge the
+		adjacent text back into (start, end) spans of *item*.
+		"""
+		number_language = self.number_language
+		num_lang = number_language if number_language != "default" else current_lang
+		tracker = self.tracker
+		tracker.reset()
+
+		parts = []
+		span_start = 0
+		for start, end in matches:
+			if tracker.switches(num_lang):
+				if start > span_start:
+					parts.append((span_start, start))
+				parts.append(WVLangChangeCommand(num_lang))
+				span_start = start
+			if tracker.switches(current_lang):
+				parts.append((span_start, end))
+				parts.append(WVLangChangeCommand(current_lang))
+				span_start = end
+		if span_start < len(item):
+			parts.append((span_start, len(item)))
+		return parts
+
+	def _number_text(self, item, span, matches, index):
+		"""
+		Emulate inject_number_mode on item[start:end] using the shared match list.
+		Returns the text and the index of the first match after the span.
+		"""
+		span_start, span_end = span
+		mode = self.number_mode
+		table = self.translate_table
+
+		out = []
+		pos = span_start
+		while index < len(matches):
+			start, end = matches[index]
+			if end > span_end:
+				break
+			index += 1
+			prefix = item[pos:start]
+			if prefix:
+				out.append(prefix)
+			# Switch to 'number' mode for spaced decimals (e.g. " .123")
+			effective_mode = mode
+			if mode == "value":
+				if prefix.strip() == "." and not prefix.endswith(" "):
+					effective_mode = "number"
+			out.extend(_translate_number(item[start:end], effective_mode, table))
+			# If it looks like end of sentence (e.g. "123."), don't add space.
+			if (
+				not _SENTENCE_END_AT_RE.match(item, end, span_end)
+				and not (end < span_end and item[end] in string.ascii_letters)
+			):
+				out.append(" ")
+			pos = end
+		if pos < span_end:
+			out.append(item[pos:span_end])
+		return "".join(out), index
+
+	def _chinese_space(self, text, start, end):
+		if not self.chinese_pause:
+			yield text[start:end]
+			return
+
+		pos = start
+		for m in _CH_SPACE_RE.finditer(text, start, end):
+			match_start, match_end = m.span()
+			if match_start > pos:
+				yield text[pos:match_start]
+			pos = match_end
+			yield self.chinese_pause
+		if pos < end:
+			yield text[pos:end]
+
+
+def fused_pipeline(
+		speechSequence: Iterable[SpeechCmd],
+) -> Iterator[SpeechCmd]:
+	"""Run every enabled stage in one pass, see FusedPipeline."""
+	yield from FusedPipeline.from_current_settings().apply(speechSequence)
+
 
-	filter_speechSequence.moveToEnd(item_wait_factor, True)
-	filter_speechSequence.moveToEnd(number_wait_factor, True)
+def _handler(stage):
+	"""The variant of *stage* to run, instrumented or raw."""
+	if _instrumentation_enabled:
+		return _instrumented_stages[stage]
+	return stage
 
-	filter_speechSequence.moveToEnd(speech_viewer, True)
+
+class PipelineRegistry:
+	"""
+	Owns the single filter_speechSequence handler of the speech pipeline.
+
+	Stages are enabled and disabled by flipping a flag; the handlers to run
+	are precomputed in CHAINED_STAGES order whenever a flag, the fused
+	setting or the instrumentation binding changes, so NVDA calls one handler
+	per utterance and the global filter chain is never re-sorted. The handler
+	rebinds the stages itself when NVDA's logging level moved to or from
+	debug, which NVDA does not announce.
+	"""
+
+	def __init__(self, stages):
+		self._stages = tuple(stages)
+		self._enabled = dict.fromkeys(self._stages, False)
+		self._fused = False
+		self._active = ()
+		self.registered = False
+
+	def is_enabled(self, stage):
+		return self._enabled[stage]
+
+	def enable(self, stage):
+		if not self._enabled[stage]:
+			self._enabled[stage] = True
+			self.rebuild()
+
+	def disable(self, stage):
+		if self._enabled[stage]:
+			self._enabled[stage] = False
+			self.rebuild()
+
+	def disable_all(self):
+		self._enabled = dict.fromkeys(self._stages, False)
+		self.rebuild()
+
+	def rebuild(self):
+		self._fused = is_fused_enabled()
+		enabled = [stage for stage in self._stages if self._enabled[stage]]
+		if not enabled:
+			self._active = ()
+		elif self._fused and not _instrumentation_enabled:
+			# The fused pass resolves which stages apply from the settings itself.
+			self._active = (fused_pipeline,)
+		else:
+			# Per-stage logging and profiling need the intermediate sequences.
+			self._active = tuple(_handler(stage) for stage in enabled)
+
+	def handler(self, speechSequence):
+		if log.isEnabledFor(DEBUG) != _debug_logging:
+			refresh_instrumentation()
+		for stage in self._active:
+			speechSequence = stage(speechSequence)
+		return speechSequence
+
+	def register(self):
+		if not self.registered:
+			filter_speechSequence.register(self.handler)
+			self.registered = True
+
+	def unregister(self):
+		filter_speechSequence.unregister(self.handler)
+		self.registered = False
+
+	def move_to_start(self):
+		filter_speechSequence.moveToEnd(self.handler, False)
+
+	def move_to_end(self):
+		filter_speechSequence.moveToEnd(self.handler, True)
+
+
+pipeline_registry = PipelineRegistry(CHAINED_STAGES)
+
+
+def refresh_instrumentation(*args, **kwargs):
+	"""
+	Bind the instrumented stage variants while pipeline logging or the latency
+	profiler is on and the raw stages otherwise, so speech pays nothing for
+	instrumentation when it is off. Call after the WorldVoice log settings
+	changed; a change of NVDA's logging level is picked up by
+	PipelineRegistry.handler.
+	"""
+	global _instrumentation_enabled, _debug_logging
+	profiler.refresh()
+	_debug_logging = log.isEnabledFor(DEBUG)
+	_instrumentation_enabled = profiler.enabled or _stage_log_enabled()
+	pipeline_registry.rebuild()
+
+
+def order_move_to_start_register():
+	# stack: first in last out
+	pipeline_registry.move_to_start()
+
+
+def order_move_to_end_register():
+	# queue: first in first out
+	pipeline_registry.move_to_end()
 
 
 def static_register():
 	log.debug("static register")
+	refresh_instrumentation()
 
-	filter_speechSequence.register(inject_chinese_space_pause)
-	filter_speechSequence.register(inject_number_language)
-	filter_speechSequence.register(inject_number_mode)
-	filter_speechSequence.register(number_wait_factor)
+	pipeline_registry.enable(inject_chinese_space_pause)
+	pipeline_registry.enable(inject_number_language)
+	pipeline_registry.enable(inject_number_mode)
+	pipeline_registry.enable(number_wait_factor)
 
-	filter_speechSequence.register(speech_viewer)
+	pipeline_registry.enable(speech_viewer)
+	pipeline_registry.register()
 
 
 def dynamic_register():
 	log.debug("dynamic register")
 
-	filter_speechSequence.register(ignore_comma_between_number)
-	filter_speechSequence.register(item_wait_factor)
+	pipeline_registry.enable(ignore_comma_between_number)
+	pipeline_registry.enable(item_wait_factor)
+	pipeline_registry.register()
+
+
+def register_stage(stage):
+	"""Enable an optional stage after its setting has been turned on."""
+	pipeline_registry.enable(stage)
+
+
+def unregister_stage(stage):
+	pipeline_registry.disable(stage)
 
 
 def unregister():
 	log.debug("unregister")
 
-	filter_speechSequence.unregister(ignore_comma_between_number)
-
-	filter_speechSequence.unregister(inject_chinese_space_pause)
-	filter_speechSequence.unregister(inject_number_mode)
-	filter_speechSequence.unregister(inject_number_language)
+	pipeline_registry.unregister()
+	pipeline_registry.disable_all()
 
-	filter_speechSequence.unregister(item_wait_factor)
-	filter_speechSequence.unregister(number_wait_factor)
 
-	filter_speechSequence.unregister(speech_viewer)
+config.post_configProfileSwitch.register(refresh_instrumentation)
+config.post_configReset.register(refresh_instrumentation)
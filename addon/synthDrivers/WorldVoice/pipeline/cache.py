@@ -0,0 +1,94 @@
+from collections import OrderedDict
+import sys
+import threading
+from typing import Any, Hashable
+
+
+# Rough per-entry bookkeeping cost (OrderedDict node, key tuple, value tuple).
+_ENTRY_OVERHEAD = 160
+
+
+def _estimate_size(text: str, value: tuple) -> int:
+	size = _ENTRY_OVERHEAD + sys.getsizeof(text)
+	for item in value:
+		if isinstance(item, str):
+			size += sys.getsizeof(item)
+		else:
+			size += 64
+	return size
+
+
+class SegmentCache:
+	"""
+	Bounded LRU cache for per-string pipeline results.
+
+	Screen reader speech repeats the same strings constantly (menu items,
+	control names, status text), so the segments produced for a string are
+	kept and reused as long as the key, which includes every setting the
+	result depends on, matches. Entries are evicted least recently used
+	first once the estimated size exceeds *max_bytes*; strings larger than
+	*max_entry_bytes* are never cached.
+	"""
+
+	def __init__(self, max_bytes: int = 1 << 20, max_entry_bytes: int = 1 << 14):
+		self.max_bytes = max_bytes
+		self.max_entry_bytes = max_entry_bytes
+		self._items: OrderedDict[Hashable, tuple[tuple, int]] = OrderedDict()
+		self._lock = threading.Lock()
+		self.size = 0
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+
+	def __len__(self) -> int:
+		return len(self._items)
+
+	def get(self, key: Hashable) -> tuple | None:
+		with self._lock:
+			try:
+				value, _ = self._items[key]
+			except KeyError:
+				self.misses += 1
+				return None
+			self._items.move_to_end(key)
+			self.hits += 1
+			return value
+
+	def put(self, key: Hashable, text: str, value: tuple) -> None:
+		size = _estimate_size(text, value)
+		if size > self.max_entry_bytes:
+			return
+		with self._lock:
+			previous = self._items.pop(key, None)
+			if previous is not None:
+				self.size -= previous[1]
+			self._items[key] = (value, size)
+			self.size += size
+			while self.size > self.max_bytes and self._items:
+				_, (_, evicted_size) = self._items.popitem(last=False)
+				self.size -= evicted_size
+				self.evictions += 1
+
+	def get_or_build(self, key: Hashable, text: str, build) -> tuple:
+		value = self.get(key)
+		if value is None:
+			value = tuple(build())
+			self.put(key, text, value)
+		return value
+
+	def clear(self) -> None:
+		with self._lock:
+			self._items.clear()
+			self.size = 0
+
+	def stats(self) -> dict[str, Any]:
+		lookups = self.hits + self.misses
+		return {
+			"entries": len(self._items),
+			"bytes": self.size,
+			"max_bytes": self.max_bytes,
+			"hits": self.hits,
+			"misses": self.misses,
+			"evictions": self.evictions,
+			"hit_rate": self.hits / lookups if lookups else 0.0,
+		}
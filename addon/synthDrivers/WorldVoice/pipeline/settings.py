@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Any, Callable
 
 import config
@@ -29,8 +29,12 @@ PIPELINE_CONFIG_KEYS = (
 
 _last_scope_application: tuple[str, str] | None = None
 
+_snapshot: "PipelineSettings | None" = None
+_snapshot_synth: Any = None
+_settings_version = 0
 
-@dataclass
+
+@dataclass(frozen=True)
 class PipelineSettings:
 	scope: str
 	ignore_comma_between_number: bool
@@ -40,6 +44,8 @@ class PipelineSettings:
 	item_wait_factor: int
 	sayall_wait_factor: int
 	chinesespace_wait_factor: int
+	# get_pipeline_settings_version() when the snapshot was taken, see get_pipeline_settings
+	version: int = 0
 
 	@property
 	def global_factor_units(self) -> int:
@@ -90,6 +96,7 @@ def save_pipeline_settings(settings: PipelineSettings, conf: Any = config.conf)
 	pipeline = _pipeline_section(conf)
 	for key in PIPELINE_CONFIG_KEYS:
 		pipeline[key] = getattr(settings, key)
+	invalidate_pipeline_settings()
 
 
 def _runtime_value(synth: Any, public_name: str, private_name: str, fallback: Any) -> Any:
@@ -110,16 +117,20 @@ def get_effective_pipeline_settings(synth: Any | None = None, conf: Any = config
 	settings = load_pipeline_settings(conf)
 	if getattr(synth, "name", None) != "WorldVoice":
 		if settings.scope != "all":
-			settings.ignore_comma_between_number = False
-			settings.number_wait_factor = 0
-			settings.item_wait_factor = 0
-			settings.sayall_wait_factor = 0
-			settings.chinesespace_wait_factor = 0
-			return settings
-		settings.ignore_comma_between_number = bool(
-			settings.global_factor_units * settings.ignore_comma_between_number
+			return replace(
+				settings,
+				ignore_comma_between_number=False,
+				number_wait_factor=0,
+				item_wait_factor=0,
+				sayall_wait_factor=0,
+				chinesespace_wait_factor=0,
+			)
+		return replace(
+			settings,
+			ignore_comma_between_number=bool(
+				settings.global_factor_units * settings.ignore_comma_between_number
+			),
 		)
-		return settings
 
 	return PipelineSettings(
 		scope=settings.scope,
@@ -148,6 +159,46 @@ def get_effective_pipeline_settings(synth: Any | None = None, conf: Any = config
 	)
 
 
+def invalidate_pipeline_settings(*args: Any, **kwargs: Any) -> None:
+	"""Drop the cached snapshot after a pipeline setting or the active config profile changed."""
+	global _snapshot, _snapshot_synth, _settings_version
+	_snapshot = None
+	_snapshot_synth = None
+	_settings_version += 1
+
+
+def get_pipeline_settings_version() -> int:
+	return _settings_version
+
+
+def get_pipeline_settings(synth: Any | None = None) -> PipelineSettings:
+	"""
+	Return the cached effective settings, rebuilding them only after
+	invalidate_pipeline_settings() or when the synthesizer changed. The
+	snapshot carries the settings version it was taken at, so results cached
+	for one snapshot are keyed by its version rather than by its values.
+	"""
+	global _snapshot, _snapshot_synth
+	if synth is None:
+		try:
+			synth = getSynth()
+		except Exception:
+			synth = None
+
+	snapshot = _snapshot
+	if snapshot is None or _snapshot_synth is not synth:
+		if snapshot is not None:
+			invalidate_pipeline_settings()
+		snapshot = replace(get_effective_pipeline_settings(synth=synth), version=_settings_version)
+		_snapshot = snapshot
+		_snapshot_synth = synth
+	return snapshot
+
+
+config.post_configProfileSwitch.register(invalidate_pipeline_settings)
+config.post_configReset.register(invalidate_pipeline_settings)
+
+
 def apply_pipeline_settings_to_synth(synth: Any, settings: PipelineSettings) -> None:
 	synth.cni = settings.ignore_comma_between_number
 	synth.nummod = settings.number_mode
@@ -0,0 +1,169 @@
+import csv
+import math
+from pathlib import Path
+import threading
+
+import addonHandler
+import config
+import gui
+import wx
+
+addonHandler.initTranslation()
+
+METRIC_SPEAK_DISPATCH = "speak_dispatch"
+METRIC_QUEUE_WAIT = "queue_wait"
+METRIC_FIRST_AUDIO = "first_audio"
+METRIC_TASK_GAP = "task_gap"
+
+
+class LatencyHistogram:
+	"""
+	Streaming latency histogram with logarithmic buckets.
+
+	Bucket bounds grow by 2 ** (1 / BUCKETS_PER_OCTAVE), so percentiles are
+	accurate to about 9% while memory stays constant however many samples
+	are recorded.
+	"""
+	BUCKETS_PER_OCTAVE = 8
+	MIN_SECONDS = 1e-6
+
+	def __init__(self):
+		self.counts = {}
+		self.count = 0
+		self.total = 0.0
+		self.min = math.inf
+		self.max = 0.0
+
+	def add(self, seconds):
+		if seconds <= self.MIN_SECONDS:
+			index = 0
+		else:
+			index = int(math.log2(seconds / self.MIN_SECONDS) * self.BUCKETS_PER_OCTAVE) + 1
+		self.counts[index] = self.counts.get(index, 0) + 1
+		self.count += 1
+		self.total += seconds
+		if seconds < self.min:
+			self.min = seconds
+		if seconds > self.max:
+			self.max = seconds
+
+	def _upper_bound(self, index):
+		return self.MIN_SECONDS * 2 ** (index / self.BUCKETS_PER_OCTAVE)
+
+	def percentile(self, percent):
+		if not self.count:
+			return 0.0
+		rank = max(1, math.ceil(self.count * percent / 100))
+		seen = 0
+		for index in sorted(self.counts):
+			seen += self.counts[index]
+			if seen >= rank:
+				return min(max(self._upper_bound(index), self.min), self.max)
+		return self.max
+
+	@property
+	def mean(self):
+		return self.total / self.count if self.count else 0.0
+
+
+class LatencyProfiler:
+	"""
+	Latency histograms per (metric, engine).
+
+	Metrics are the pipeline stage labels plus speak_dispatch (the body of
+	SynthDriver.speak), queue_wait (time a task waited in the TaskManager
+	queue), first_audio (SynthDriver.speak entry to the first core.speak
+	call) and task_gap (end of a task to the start of the next one, when
+	the next one was already waiting). Call sites check `enabled` before
+	taking any timestamp.
+	"""
+
+	def __init__(self):
+		self.enabled = False
+		self._histograms = {}
+		self._lock = threading.Lock()
+
+	def refresh(self):
+		try:
+			self.enabled = bool(config.conf["WorldVoice"]["log"]["profile"])
+		except KeyError:
+			self.enabled = False
+
+	def record(self, metric, engine, seconds):
+		key = (metric, engine)
+		with self._lock:
+			histogram = self._histograms.get(key)
+			if histogram is None:
+				histogram = self._histograms[key] = LatencyHistogram()
+			histogram.add(seconds)
+
+	def reset(self):
+		with self._lock:
+			self._histograms.clear()
+
+	def snapshot(self):
+		"""One row per (metric, engine), times in milliseconds."""
+		with self._lock:
+			items = sorted(self._histograms.items())
+			rows = []
+			for (metric, engine), histogram in items:
+				rows.append({
+					"metric": metric,
+					"engine": engine,
+					"count": histogram.count,
+					"mean": histogram.mean * 1000,
+					"p50": histogram.percentile(50) * 1000,
+					"p95": histogram.percentile(95) * 1000,
+					"p99": histogram.percentile(99) * 1000,
+					"max": histogram.max * 1000,
+				})
+		return rows
+
+	def report(self):
+		rows = self.snapshot()
+		if not rows:
+			return _("No latency samples recorded.")
+		lines = ["%-28s %-12s %8s %9s %9s %9s %9s" % ("metric", "engine", "count", "p50 ms", "p95 ms", "p99 ms", "max ms")]
+		for row in rows:
+			lines.append("%-28s %-12s %8d %9.2f %9.2f %9.2f %9.2f" % (
+				row["metric"],
+				row["engine"],
+				row["count"],
+				row["p50"],
+				row["p95"],
+				row["p99"],
+				row["max"],
+			))
+		return "\n".join(lines)
+
+	def export(self):
+		with wx.FileDialog(
+			# Translators: The title of the Export latency profile window
+			gui.mainFrame, message=_("Export latency profile..."),
+			defaultDir="",
+			defaultFile="latency_profile.csv",
+			wildcard="csv files (*.csv)|*.csv",
+			style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT
+		) as entryDialog:
+			if entryDialog.ShowModal() != wx.ID_OK:
+				return
+			dst = Path(entryDialog.GetPath())
+
+		try:
+			rows = self.snapshot()
+			with dst.open(mode="w", encoding="utf-8", newline="") as csvfile:
+				writer = csv.DictWriter(csvfile, fieldnames=["metric", "engine", "count", "mean", "p50", "p95", "p99", "max"])
+				writer.writeheader()
+				writer.writerows(rows)
+			wx.MessageBox(
+				_("Latency profile exported to:\n{}").format(dst),
+				_("Success"),
+				style=wx.OK | wx.ICON_INFORMATION
+			)
+		except Exception as e:
+			wx.LogError(
+				_("Cannot export latency profile to {}:\n{}").format(dst, e)
+			)
+
+
+profiler = LatencyProfiler()
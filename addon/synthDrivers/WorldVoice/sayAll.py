@@ -25,7 +25,7 @@ from speech.types import (
 	_flattenNestedSequences,
 )
 
-from .pipeline.settings import get_effective_pipeline_settings
+from .pipeline.settings import get_pipeline_settings
 
 
 SayAllHandler = None
@@ -146,7 +146,7 @@ class _TextReader(sayAll._TextReader):
 		seq = list(_flattenNestedSequences(speechGen))
 		seq.insert(0, cb)
 
-		waitfactor = get_effective_pipeline_settings().scaled_sayall_wait()
+		waitfactor = get_pipeline_settings().scaled_sayall_wait()
 		if waitfactor > 0:
 			seq.append(BreakCommand(waitfactor + 100))
 		# Speak the speech sequence.
@@ -1,3 +1,6 @@
+from collections import deque
+from functools import partial
+from itertools import count
 import queue
 import threading
 import time
@@ -5,8 +8,11 @@ from dataclasses import dataclass
 from concurrent.futures import Future
 
 from logHandler import log
+from speech.commands import BreakCommand
 from synthDriverHandler import synthIndexReached, synthDoneSpeaking, getSynth
 
+from .profiler import METRIC_FIRST_AUDIO, METRIC_QUEUE_WAIT, METRIC_TASK_GAP, profiler
+
 
 # ----------------------------
 # Utilities
@@ -15,9 +21,17 @@ from synthDriverHandler import synthIndexReached, synthDoneSpeaking, getSynth
 class CancellationToken:
 	def __init__(self):
 		self._ev = threading.Event()
+		self._lock = threading.Lock()
+		self._callbacks = []
 
 	def cancel(self):
-		self._ev.set()
+		with self._lock:
+			if self._ev.is_set():
+				return
+			self._ev.set()
+			callbacks, self._callbacks = self._callbacks, []
+		for callback in callbacks:
+			callback()
 
 	def is_cancelled(self):
 		return self._ev.is_set()
@@ -25,6 +39,57 @@ class CancellationToken:
 	def wait(self, timeout=None):
 		return self._ev.wait(timeout)
 
+	def add_callback(self, callback):
+		"""Call *callback* on cancel, at once if already cancelled."""
+		with self._lock:
+			if not self._ev.is_set():
+				self._callbacks.append(callback)
+				return
+		callback()
+
+	def remove_callback(self, callback):
+		with self._lock:
+			try:
+				self._callbacks.remove(callback)
+			except ValueError:
+				pass
+
+
+class _Completion:
+	"""
+	End of a speech task or break: the engine done speaking (speech tasks
+	only), cancellation or shutdown, whichever is set first. wait() sleeps
+	until then or the deadline, with no periodic wake-ups, and returns the
+	reason.
+	"""
+	DONE = "done"
+	CANCELLED = "cancelled"
+	STOPPED = "stopped"
+	TIMEOUT = "timeout"
+
+	def __init__(self, speech=True):
+		self.speech = speech
+		self._cond = threading.Condition(threading.Lock())
+		self.reason = None
+		# perf_counter() when the reason was set
+		self.when = None
+
+	def set(self, reason):
+		with self._cond:
+			if self.reason is None:
+				self.reason = reason
+				self.when = time.perf_counter()
+				self._cond.notify_all()
+
+	def cancel(self):
+		self.set(self.CANCELLED)
+
+	def wait(self, timeout=None):
+		with self._cond:
+			if self.reason is None:
+				self._cond.wait_for(lambda: self.reason is not None, timeout)
+			return self.reason or self.TIMEOUT
+
 
 class SpeechFuture(Future):
 	"""Future with Promise-style then()."""
@@ -57,6 +122,112 @@ class SpeechFuture(Future):
 		return next_fut
 
 
+def _settle(futures, future):
+	"""End *futures* the way *future* ended."""
+	for other in futures:
+		if other.done():
+			continue
+		if future.cancelled():
+			other.cancel()
+		elif future.exception() is not None:
+			other.set_exception(future.exception())
+		else:
+			other.set_result(future.result())
+
+
+# Lanes, most urgent first. The worker always takes the oldest task of the
+# most urgent lane holding any, see _Lanes and TaskManager._put.
+LANE_IMMEDIATE = 0
+LANE_NEXT = 1
+LANE_NORMAL = 2
+LANE_BACKGROUND = 3
+LANE_NAMES = ("immediate", "next", "normal", "background")
+
+
+class _Lanes:
+	"""
+	One FIFO queue per lane; get() takes from the most urgent lane that is not
+	empty, except that the next lane waits for the rest of the utterance
+	being spoken from a less urgent lane.
+	"""
+
+	def __init__(self):
+		self._lanes = tuple(deque() for _ in LANE_NAMES)
+		self._cond = threading.Condition(threading.Lock())
+		# Utterance of the last item taken from a lane less urgent than next
+		self._utterance = None
+
+	def put(self, item, lane=LANE_NORMAL):
+		with self._cond:
+			self._lanes[lane].append(item)
+			self._cond.notify()
+
+	def _due(self):
+		"""The lane get() takes from next, None if all are empty."""
+		for index, lane in enumerate(self._lanes):
+			if not lane:
+				continue
+			if index == LANE_NEXT and self._utterance is not None:
+				# NVDA queues next speech once WorldVoice reports done speaking,
+				# which it does after every segment of an utterance.
+				for later in range(LANE_NEXT + 1, len(self._lanes)):
+					if self._lanes[later]:
+						if getattr(self._lanes[later][0], "utterance", None) == self._utterance:
+							return later
+						break
+			return index
+		return None
+
+	def _pop(self):
+		index = self._due()
+		if index is None:
+			raise queue.Empty
+		item = self._lanes[index].popleft()
+		if index > LANE_NEXT:
+			self._utterance = getattr(item, "utterance", None)
+		return item
+
+	def get(self):
+		with self._cond:
+			self._cond.wait_for(lambda: any(self._lanes))
+			return self._pop()
+
+	def get_nowait(self):
+		with self._cond:
+			return self._pop()
+
+	def pop_while(self, lane, predicate):
+		"""
+		Take the items at the front of *lane* while *predicate* holds for them,
+		stopping as soon as get() would take from another lane.
+		"""
+		items = []
+		with self._cond:
+			queue_ = self._lanes[lane]
+			while self._due() == lane and predicate(queue_[0]):
+				items.append(self._pop())
+		return items
+
+	def drain(self, after):
+		"""Take every item of the lanes less urgent than *after*."""
+		with self._cond:
+			items = []
+			for lane in self._lanes[after + 1:]:
+				items.extend(lane)
+				lane.clear()
+		return items
+
+	def peek(self):
+		"""The item get() would return next, None if there is none."""
+		with self._cond:
+			index = self._due()
+			return None if index is None else self._lanes[index][0]
+
+	def depths(self):
+		with self._cond:
+			return {name: len(lane) for name, lane in zip(LANE_NAMES, self._lanes)}
+
+
 @dataclass
 class _Task:
 	voiceInstance: object
@@ -65,6 +236,18 @@ class _Task:
 	future: SpeechFuture
 	token: CancellationToken | None = None
 	timeout: float | None = None
+	# perf_counter() timestamps, only taken while the latency profiler is on
+	enqueued: float | None = None
+	utterance_start: float | None = None
+	# Speaks without waiting for the audio to be played, see TaskManager._run_ahead
+	run_ahead: callable = None
+	# Seconds of silence, for break tasks
+	pause: float | None = None
+	lane: int = LANE_NORMAL
+	# Id of the SynthDriver.speak call that queued the task, see TaskManager.begin_utterance
+	utterance: int | None = None
+	# Speech sequence run and run_ahead take, see TaskManager._coalesce
+	sequence: list | None = None
 
 
 def IndexReached_notify_forward(synth, index):
@@ -85,13 +268,21 @@ def DoneSpeaking_notify_forward(synth):
 class TaskManager:
 
 	def __init__(self):
-		self._q: queue.Queue[_Task | None] = queue.Queue()
+		self._q = _Lanes()
 		self._stop = threading.Event()
 		self._state_lock = threading.Lock()
 
 		self._current_voice = None
 		self._current_token = None
-		self._current_done_event = None
+		self._current_completion = None
+		self._current_lane = None
+		self._utterances = count()
+		self._utterance = None
+		self._utterance_start = None
+		# perf_counter() when the last task ended, only taken while the latency profiler is on
+		self._last_end = None
+		# Voice whose engine holds speech synthesized ahead, not played yet
+		self._buffered_voice = None
 
 		self._thread = threading.Thread(target=self._worker, daemon=True)
 
@@ -105,33 +296,115 @@ class TaskManager:
 	# Public API
 	# ----------------------------
 
-	def add_task(self, voiceInstance, fn, *, token: CancellationToken | None = None):
+	def begin_utterance(self, start=None):
+		"""
+		Mark the start of the speech SynthDriver.speak queues next. Its speak
+		and break tasks share an utterance id, and a next task does not run
+		between them. *start* is the SynthDriver.speak entry time for the
+		first_audio metric, given while the latency profiler is on.
+		"""
+		self._utterance = next(self._utterances)
+		self._utterance_start = start
+
+	def add_task(self, voiceInstance, fn, *, token: CancellationToken | None = None, lane=LANE_NORMAL):
+		fut = SpeechFuture()
+		task = _Task(voiceInstance, fn, False, fut, token)
+		if profiler.enabled:
+			task.enqueued = time.perf_counter()
+		self._put(task, lane)
+		return fut
+
+	def add_speak_task(self, voiceInstance, speak_fn, *, token: CancellationToken | None = None, timeout=None, run_ahead=None, lane=LANE_NORMAL, sequence=None):
+		"""
+		Queue *speak_fn*, which speaks and returns once the engine is done
+		speaking. *run_ahead*, if given, speaks without waiting for the audio to
+		be played; it is used instead of *speak_fn* when the next task speaks on
+		the same engine, see _run_ahead. With a speech *sequence*, both are
+		called with the sequence to speak, which may take in the speech queued
+		after it for the same voice, see _coalesce.
+		"""
 		fut = SpeechFuture()
-		self._q.put(_Task(voiceInstance, fn, False, fut, token))
+		task = _Task(voiceInstance, speak_fn, True, fut, token, timeout)
+		task.run_ahead = run_ahead
+		task.sequence = sequence
+		task.utterance = self._utterance
+		if profiler.enabled:
+			task.enqueued = time.perf_counter()
+			# Only the first speak task of an utterance starts audio.
+			task.utterance_start = self._utterance_start
+			self._utterance_start = None
+		self._put(task, lane)
 		return fut
 
-	def add_speak_task(self, voiceInstance, speak_fn, *, token: CancellationToken | None = None, timeout=None):
+	def add_break_task(self, voiceInstance, seconds, *, token: CancellationToken | None = None, lane=LANE_NORMAL):
+		"""Queue *seconds* of silence, cut short by cancel()."""
 		fut = SpeechFuture()
-		self._q.put(_Task(voiceInstance, speak_fn, True, fut, token, timeout))
+		task = _Task(voiceInstance, None, False, fut, token)
+		task.pause = seconds
+		task.utterance = self._utterance
+		if profiler.enabled:
+			task.enqueued = time.perf_counter()
+		self._put(task, lane)
 		return fut
 
+	def queue_depths(self):
+		"""Number of tasks waiting per lane, by lane name."""
+		return self._q.depths()
+
+	def _put(self, task, lane):
+		"""
+		Queue *task* in *lane*. Tasks run in lane order, oldest first within a
+		lane; a running task is never interrupted to run a more urgent one,
+		except that:
+
+		- an immediate task interrupts the normal and background lanes: the
+		  task running in them is stopped and the tasks waiting in them are
+		  cancelled, so the rest of an interrupted utterance is not spoken
+		  without its interrupted part (NVDA speaks an utterance interrupted by
+		  NOW speech again from its start);
+		- a next task stops a break running in those lanes, unless the break
+		  belongs to an utterance whose speech is still queued, see _Lanes.
+		"""
+		task.lane = lane
+		if lane == LANE_IMMEDIATE:
+			for item in self._q.drain(LANE_NEXT):
+				if isinstance(item, _Task):
+					item.future.cancel()
+		self._q.put(task, lane)
+		if lane > LANE_NEXT:
+			return
+		with self._state_lock:
+			current_lane = self._current_lane
+			completion = self._current_completion
+		if current_lane is None or current_lane <= LANE_NEXT:
+			return
+		if lane == LANE_IMMEDIATE:
+			# Also discards the speech a normal task synthesized ahead.
+			self.cancel_current()
+		elif completion is not None and not completion.speech and self._q.peek() is task:
+			completion.cancel()
+
 	def cancel_current(self):
 		with self._state_lock:
 			token = self._current_token
 			voice = self._current_voice
-			done = self._current_done_event
+			done = self._current_completion
+			buffered = self._buffered_voice
+			self._buffered_voice = None
 
 		if token:
 			token.cancel()
 
-		if voice:
+		for stopped in {voice, buffered} - {None}:
 			try:
-				voice.stop()
+				# Also discards the speech synthesized ahead.
+				stopped.stop()
 			except Exception:
 				log.debug("Failed to stop current voice", exc_info=True)
 
 		if done:
-			done.set()
+			done.set(_Completion.CANCELLED)
+		self._last_end = None
 
 	def cancel(self):
 		# cancel active
@@ -143,14 +416,17 @@ class TaskManager:
 				item = self._q.get_nowait()
 				if isinstance(item, _Task):
 					item.future.cancel()
-				self._q.task_done()
 		except queue.Empty:
 			pass
 
 	def shutdown(self):
 		self.cancel()
 		self._stop.set()
-		self._q.put(None)
+		with self._state_lock:
+			done = self._current_completion
+		if done:
+			done.set(_Completion.STOPPED)
+		self._q.put(None, LANE_IMMEDIATE)
 		self._thread.join()
 
 		try:
@@ -177,21 +453,80 @@ class TaskManager:
 		except Exception:
 			return
 		with self._state_lock:
-			done = self._current_done_event
-		if done:
-			done.set()
+			done = self._current_completion
+		if done and done.speech:
+			done.set(_Completion.DONE)
 
 	def _worker(self):
 		while not self._stop.is_set():
 			task = self._q.get()
 			if task is None:
 				return
-			try:
-				self._run_one(task)
-			finally:
-				self._q.task_done()
+			self._run_one(task)
+
+	@staticmethod
+	def _continues(task, voice):
+		"""Whether *task* speaks on the engine of *voice*, so it plays after what that engine holds."""
+		if not task.wait_done or task.future.cancelled():
+			return False
+		if task.token and task.token.is_cancelled():
+			return False
+		return getattr(task.voiceInstance, "core", None) is getattr(voice, "core", None)
+
+	def _run_ahead(self, task):
+		"""
+		Whether to use task.run_ahead: when the next task speaks on the same
+		engine, the engine synthesizes that task's speech while this one plays
+		instead of starting only after this one is done, so voice switches on
+		one engine are gapless. The last task of such a run waits for the
+		whole of it to be played.
+		"""
+		if task.run_ahead is None:
+			return False
+		next_task = self._q.peek()
+		return isinstance(next_task, _Task) and self._continues(next_task, task.voiceInstance)
+
+	def _coalesce(self, task):
+		"""
+		Speak the speech tasks of the same voice queued right after *task*, and
+		the breaks between them if the engine pauses on BreakCommands, in one
+		call with it, so they cost one engine call and one wait for done
+		speaking instead of one each. The merged tasks end with *task*.
+		"""
+		if task.sequence is None:
+			return
+		voice = task.voiceInstance
+		native_breaks = getattr(voice, "nativeBreaks", False)
+
+		def mergeable(other):
+			if not isinstance(other, _Task) or other.voiceInstance is not voice:
+				return False
+			if other.token is not task.token or other.future.cancelled():
+				return False
+			if other.pause is not None:
+				return native_breaks
+			return other.sequence is not None
+
+		sequence = list(task.sequence)
+		merged = self._q.pop_while(task.lane, mergeable)
+		for other in merged:
+			if other.pause is not None:
+				sequence.append(BreakCommand(round(other.pause * 1000)))
+			else:
+				sequence.extend(other.sequence)
+		task.run = partial(task.run, sequence)
+		if task.run_ahead is not None:
+			task.run_ahead = partial(task.run_ahead, sequence)
+		if merged:
+			task.future.add_done_callback(partial(_settle, [other.future for other in merged]))
 
 	def _run_one(self, task: _Task):
+		with self._state_lock:
+			buffered = self._buffered_voice
+			self._buffered_voice = None
+		if buffered is not None and not self._continues(task, buffered):
+			# The task that was to play after the speech synthesized ahead went away.
+			self._run_one(_Task(buffered, buffered.drain, True, SpeechFuture(), lane=self._current_lane))
 
 		if task.future.cancelled():
 			return
@@ -200,46 +535,68 @@ class TaskManager:
 			task.future.cancel()
 			return
 
+		self._coalesce(task)
 		with self._state_lock:
 			self._current_voice = task.voiceInstance
 			self._current_token = task.token
+			self._current_lane = task.lane
+
+		if task.enqueued is not None:
+			now = time.perf_counter()
+			engine = getattr(task.voiceInstance, "engine", "")
+			profiler.record(METRIC_QUEUE_WAIT, engine, now - task.enqueued)
+			if task.utterance_start is not None:
+				profiler.record(METRIC_FIRST_AUDIO, engine, now - task.utterance_start)
+			last_end = self._last_end
+			if last_end is not None and task.enqueued <= last_end:
+				# The task was waiting when the previous one ended.
+				profiler.record(METRIC_TASK_GAP, engine, now - last_end)
 
 		try:
+			# ---------------- break ----------------
+
+			if task.pause is not None:
+				reason = self._wait(task, _Completion(speech=False), None, task.pause)
+				if reason == _Completion.TIMEOUT:
+					task.future.set_result(True)
+					if profiler.enabled:
+						self._last_end = time.perf_counter()
+				else:
+					self._last_end = None
+					task.future.cancel()
+				return
+
 			# ---------------- normal task ----------------
 
 			if not task.wait_done:
 				result = task.run()
 				task.future.set_result(result)
+				if profiler.enabled:
+					self._last_end = time.perf_counter()
 				return
 
 			# ---------------- speech task ----------------
 
-			done = threading.Event()
-
-			with self._state_lock:
-				self._current_done_event = done
-
-			task.run()
-
-			start = time.monotonic()
-
-			while True:
-				if self._stop.is_set():
-					task.future.cancel()
-					return
+			if self._run_ahead(task):
+				task.run_ahead()
+				with self._state_lock:
+					self._buffered_voice = task.voiceInstance
+				task.future.set_result(True)
+				self._last_end = None
+				return
 
-				if task.token and task.token.is_cancelled():
+			done = _Completion()
+			reason = self._wait(task, done, task.run, task.timeout)
+			if reason == _Completion.DONE:
+				task.future.set_result(True)
+				if profiler.enabled:
+					self._last_end = done.when
+			else:
+				self._last_end = None
+				if reason == _Completion.TIMEOUT:
+					task.future.set_exception(TimeoutError("Speech timeout"))
+				else:
 					task.future.cancel()
-					return
-
-				if task.timeout is not None:
-					if time.monotonic() - start > task.timeout:
-						task.future.set_exception(TimeoutError("Speech timeout"))
-						return
-
-				if done.wait(0.05):
-					task.future.set_result(True)
-					return
 
 		except Exception as e:
 			task.future.set_exception(e)
@@ -249,4 +606,22 @@ class TaskManager:
 			with self._state_lock:
 				self._current_voice = None
 				self._current_token = None
-				self._current_done_event = None
+				self._current_completion = None
+				# Speech synthesized ahead still plays for the lane of its task.
+				self._current_lane = task.lane if self._buffered_voice is not None else None
+
+	def _wait(self, task, done, run, timeout):
+		"""Run *run*, if any, and wait for *done*, see _Completion. Returns the reason it ended."""
+		with self._state_lock:
+			self._current_completion = done
+		if task.token:
+			task.token.add_callback(done.cancel)
+		if self._stop.is_set():
+			done.set(_Completion.STOPPED)
+		try:
+			if run is not None:
+				run()
+			return done.wait(timeout)
+		finally:
+			if task.token:
+				task.token.remove_callback(done.cancel)
@@ -0,0 +1,796 @@
+"""Headless throughput benchmark for the WorldVoice speech pipeline and language detection.
+
+Runs on plain CPython without NVDA: the handful of NVDA modules the pipeline
+imports are replaced by small stand-ins before the add-on modules are loaded.
+
+Usage:
+	python tools/benchmark.py                  # compare against the stored baseline
+	python tools/benchmark.py --save-baseline  # record a new baseline
+	python tools/benchmark.py --tolerance 0.4  # allow 40% slowdown before failing
+	python tools/benchmark.py --update-golden  # record the current detector output as expected
+
+Throughput is reported in chars/sec of stage input, allocations as the peak
+memory traced by tracemalloc while the stage runs; language detection also
+reports the language switches it emits per 1000 chars. The corpora are made
+of distinct lines, so the uncached runs do not hit the segment caches after
+the first line.
+
+Each measurement is the median of --repeat runs. Throughput is also stored
+relative to a fixed pure-Python calibration loop run between the measured
+runs, and the baseline is compared on that ratio, so it carries over between
+machines of different speed. Only the whole pipeline runs (chain, fused) and
+the uncached detector runs (detect) are compared; the rest is reported. Before
+measuring, the detector is checked against the golden corpus in
+detection_golden.json, and against detection_baseline.json, random text over
+many scripts and blocks with the output of the detector before its block
+table was generated from Blocks.txt. --update-golden leaves the latter
+alone. The exit status is 1 when the detector output differs from either or
+a compared measurement falls more than the tolerance below the baseline.
+"""
+
+import argparse
+from concurrent.futures import CancelledError
+import json
+from pathlib import Path
+import random
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+import types
+
+ROOT = Path(__file__).resolve().parent.parent
+ADDON_DIR = ROOT / "addon"
+BASELINE_FILE = Path(__file__).resolve().parent / "benchmark_baseline.json"
+GOLDEN_FILE = Path(__file__).resolve().parent / "detection_golden.json"
+BASELINE_DETECTION_FILE = Path(__file__).resolve().parent / "detection_baseline.json"
+
+
+# ----------------------------
+# NVDA stand-ins
+# ----------------------------
+
+class _Action:
+	def __init__(self):
+		self._handlers = []
+
+	def register(self, handler):
+		if handler not in self._handlers:
+			self._handlers.append(handler)
+
+	def unregister(self, handler):
+		if handler in self._handlers:
+			self._handlers.remove(handler)
+
+	def notify(self, **kwargs):
+		for handler in list(self._handlers):
+			handler(**kwargs)
+
+
+class _Filter(_Action):
+	def moveToEnd(self, handler, behindOthers=True):
+		if handler not in self._handlers:
+			return False
+		self._handlers.remove(handler)
+		if behindOthers:
+			self._handlers.append(handler)
+		else:
+			self._handlers.insert(0, handler)
+		return True
+
+	def apply(self, value):
+		for handler in self._handlers:
+			value = handler(value)
+		return value
+
+
+class _Log:
+	def _noop(self, *args, **kwargs):
+		pass
+
+	debug = info = warning = debugWarning = error = exception = _noop
+
+	def isEnabledFor(self, level):
+		return False
+
+
+def _module(name, **attrs):
+	module = types.ModuleType(name)
+	module.__dict__.update(attrs)
+	sys.modules[name] = module
+	return module
+
+
+def _package(name, path):
+	module = _module(name)
+	module.__path__ = [str(path)]
+	return module
+
+
+def install_stand_ins(conf):
+	class SpeechCommand:
+		pass
+
+	class SynthCommand(SpeechCommand):
+		pass
+
+	class SynthParamCommand(SynthCommand):
+		pass
+
+	class BreakCommand(SynthCommand):
+		def __init__(self, time=0):
+			self.time = time
+
+		def __repr__(self):
+			return "BreakCommand(time=%d)" % self.time
+
+	class LangChangeCommand(SynthParamCommand):
+		def __init__(self, lang):
+			self.lang = lang
+			self.isDefault = not lang
+
+		def __repr__(self):
+			return "LangChangeCommand (%r)" % self.lang
+
+	class IndexCommand(SynthCommand):
+		def __init__(self, index):
+			self.index = index
+
+		def __repr__(self):
+			return "IndexCommand(%r)" % self.index
+
+	_module(
+		"config",
+		conf=conf,
+		post_configProfileSwitch=_Action(),
+		post_configReset=_Action(),
+	)
+	_module("logHandler", log=_Log())
+	_module("addonHandler", initTranslation=lambda: None)
+	_module("gui")
+	_module("wx")
+	_package("speech", ADDON_DIR)
+	_module(
+		"speech.commands",
+		SpeechCommand=SpeechCommand,
+		SynthCommand=SynthCommand,
+		SynthParamCommand=SynthParamCommand,
+		BreakCommand=BreakCommand,
+		LangChangeCommand=LangChangeCommand,
+		IndexCommand=IndexCommand,
+	)
+	_module("speech.extensions", filter_speechSequence=_Filter())
+	synth_driver_handler = _module(
+		"synthDriverHandler",
+		synthIndexReached=_Action(),
+		synthDoneSpeaking=_Action(),
+	)
+	synth_driver_handler.synth = None
+	synth_driver_handler.getSynth = lambda: synth_driver_handler.synth
+
+	# Load the add-on packages without running their NVDA-bound __init__ modules.
+	_package("synthDrivers", ADDON_DIR / "synthDrivers")
+	_package("synthDrivers.WorldVoice", ADDON_DIR / "synthDrivers" / "WorldVoice")
+
+	class PipelineLog:
+		def __init__(self, log_name):
+			pass
+
+		def write(self, *args, **kwargs):
+			pass
+
+	_module("synthDrivers.WorldVoice.log", PipelineLog=PipelineLog)
+
+
+def default_conf():
+	return {
+		"general": {"loggingLevel": "INFO"},
+		"speech": {"trustVoiceLanguage": True},
+		"WorldVoice": {
+			"autoLanguageSwitching": {
+				"ignoreNumbersInLanguageDetection": False,
+				"ignorePunctuationInLanguageDetection": False,
+				"latinCharactersLanguage": "en",
+				"CJKCharactersLanguage": "zh",
+				"arabicCharactersLanguage": "ar",
+				"statisticalDetection": False,
+				"statisticalMinLength": 20,
+				"carryDetectionState": False,
+				"mergeCJKExtensions": False,
+				"lookaheadDetection": True,
+				"lookaheadSequences": 8,
+				"lookaheadSynthesis": True,
+				"DetectLanguageTiming": "after",
+			},
+			"pipeline": {
+				"scope": "WorldVoice",
+				"fused": True,
+				"ignore_comma_between_number": True,
+				"number_mode": "number",
+				"global_wait_factor": 10,
+				"number_wait_factor": 10,
+				"item_wait_factor": 10,
+				"sayall_wait_factor": 10,
+				"chinesespace_wait_factor": 10,
+			},
+			"log": {
+				"enable": False,
+				"ignore_comma_between_number": False,
+				"number_mode": False,
+				"number_language": False,
+				"number_wait_factor": False,
+				"item_wait_factor": False,
+				"chinesespace_wait_factor": False,
+				"speech_viewer": False,
+				"format": "csv",
+				"profile": False,
+			},
+			"role": {},
+		},
+	}
+
+
+class _Symbol:
+	def __init__(self, identifier, replacement, language, mode=0):
+		self.identifier = identifier
+		self.replacement = replacement
+		self.language = language
+		self.mode = mode
+
+
+class _SpeechSymbols:
+	def __init__(self, symbols):
+		self.symbols = {s.identifier: s for s in symbols}
+		self.revision = 1
+
+
+class _VoiceManager:
+	def __init__(self, voices, default):
+		self._voices = voices
+		self.defaultVoiceInstance = voices[default]
+
+	def getVoiceInstanceForLanguage(self, language):
+		return self._voices.get(language.split("_")[0], self.defaultVoiceInstance)
+
+
+class _Synth:
+	name = "WorldVoice"
+
+	def __init__(self):
+		self.language = "en"
+		self._voiceManager = _VoiceManager({"en": "voice-en", "zh": "voice-zh", "ru": "voice-ru", "ar": "voice-ar"}, "en")
+		self._numlan = "zh"
+		self._cni = True
+		self._nummod = "number"
+		self._globalwaitfactor = 10
+		self._numberwaitfactor = 10
+		self._itemwaitfactor = 10
+		self._sayallwaitfactor = 10
+		self._chinesespacewaitfactor = 10
+		self.uwv = True
+		self.speechSymbols = _SpeechSymbols([
+			_Symbol("1", "一", "zh"),
+			_Symbol("2", "二", "zh"),
+			_Symbol("3", "三", "zh"),
+		])
+
+
+# ----------------------------
+# Corpora
+# ----------------------------
+
+def _distinct_lines(count, make_line, seed):
+	"""
+	*count* different lines from *make_line(rng)*. Every line is distinct so
+	that the uncached runs measure the pipeline and not the segment cache.
+	"""
+	rng = random.Random(seed)
+	lines = []
+	seen = set()
+	while len(lines) < count:
+		line = make_line(rng)
+		if line not in seen:
+			seen.add(line)
+			lines.append(line)
+	return lines
+
+
+def corpus_numeric_table():
+	rows = []
+	for row in range(200):
+		rows.append("%d" % row)
+		rows.append("%d,%03d.%02d" % (row * 17, row * 31 % 1000, row % 100))
+		rows.append("%d-%02d-%02d" % (1900 + row, row % 12 + 1, row % 28 + 1))
+		rows.append("%d:%02d" % (row // 60, row % 60))
+	return rows
+
+
+CJK_WORDS = "今天 天氣 很好 我們 一起 去 公園 散步 看到 很多 花 開了 昨天 下雨 明天 老師 學生 書店 咖啡 電影 晚上 朋友 城市 火車".split()
+
+
+def corpus_cjk_prose():
+	return _distinct_lines(100, lambda rng: " ".join(rng.choice(CJK_WORDS) for _ in range(52)) + " ", 1)
+
+
+def corpus_mixed_scripts():
+	words = "Hello мир مرحبا world привет 世界 salam سلام, version".split()
+
+	def line(rng):
+		tokens = [rng.choice(words) for _ in range(30)]
+		tokens.insert(rng.randrange(len(tokens)), str(rng.randint(1900, 2100)))
+		tokens.insert(rng.randrange(len(tokens)), "%d.%02d" % (rng.randint(0, 9), rng.randint(0, 99)))
+		return " ".join(tokens) + " "
+	return _distinct_lines(150, line, 2)
+
+
+SAYALL_SENTENCES = (
+	"The quick brown fox jumps over the lazy dog while {0} people watch. ",
+	"In {1}, the committee approved {2:,} new members and {3}.5% growth. ",
+	"Meanwhile, the report on page {0} describes results for {1} and {4}. ",
+	"Our train leaves at {5}:{6:02d} and reaches the coast {0} minutes later. ",
+)
+
+
+def corpus_sayall():
+	def paragraph(rng):
+		sentences = []
+		for _ in range(60):
+			year = rng.randint(1900, 2030)
+			sentences.append(rng.choice(SAYALL_SENTENCES).format(
+				rng.randint(1, 500), year, rng.randint(1000, 99999), rng.randint(1, 99), year + 1,
+				rng.randint(0, 23), rng.randint(0, 59),
+			))
+		return "".join(sentences)
+	return _distinct_lines(10, paragraph, 3)
+
+
+CORPORA = {
+	"numeric_table": corpus_numeric_table,
+	"cjk_prose": corpus_cjk_prose,
+	"mixed_scripts": corpus_mixed_scripts,
+	"sayall": corpus_sayall,
+}
+
+
+# ----------------------------
+# Measurement
+# ----------------------------
+
+def _chars(sequence):
+	return sum(len(item) for item in sequence if isinstance(item, str))
+
+
+_CALIBRATION_TEXT = "".join("%s%s, %d " % (chr(0x4E00 + i % 500), "abc"[i % 3], i) for i in range(10000))
+
+
+def _calibration_workload():
+	"""A fixed workload of string walking and dict lookups over _CALIBRATION_TEXT."""
+	counts = {}
+	for char in _CALIBRATION_TEXT:
+		counts[char] = counts.get(char, 0) + 1
+	return "".join(sorted(counts))
+
+
+def _timed(fn, *args):
+	start = time.perf_counter()
+	fn(*args)
+	return time.perf_counter() - start
+
+
+def _measure(fn, sequence, repeat):
+	"""
+	Median of *repeat* runs of *fn* over *sequence*. The runs are interleaved
+	with runs of the calibration workload, one before the first run and one
+	after each run, and every run is divided by the mean of the two
+	calibrations around it, so "relative", the median of those ratios, holds
+	across machines and follows clock changes during the benchmark.
+	"""
+	chars = _chars(sequence)
+	calibration_chars = len(_CALIBRATION_TEXT)
+	rates = []
+	ratios = []
+	before = _timed(_calibration_workload)
+	for _ in range(repeat):
+		elapsed = _timed(lambda: list(fn(list(sequence))))
+		after = _timed(_calibration_workload)
+		rates.append(chars / elapsed)
+		ratios.append((chars / elapsed) / (calibration_chars / ((before + after) / 2)))
+		before = after
+
+	tracemalloc.start()
+	tracemalloc.reset_peak()
+	list(fn(list(sequence)))
+	_, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	return {
+		"chars_per_sec": statistics.median(rates),
+		"relative": statistics.median(ratios),
+		"peak_kib": peak / 1024,
+	}
+
+
+def _clear_caches(pipeline):
+	pipeline.segment_cache.clear()
+
+
+def _detection_conf(overrides):
+	conf = default_conf()["WorldVoice"]["autoLanguageSwitching"]
+	conf.update(overrides)
+	sys.modules["config"].conf["WorldVoice"]["autoLanguageSwitching"] = conf
+
+
+def _detector(languages, symbols=()):
+	languageDetection = sys.modules["synthDrivers.WorldVoice.languageDetection"]
+	speechSymbols = _SpeechSymbols([_Symbol(**symbol) for symbol in symbols]) if symbols else None
+	return languageDetection.LanguageDetector(languages, speechSymbols)
+
+
+def run(repeat):
+	pipeline = sys.modules["synthDrivers.WorldVoice.pipeline"]
+
+	results = {}
+	for corpus_name, build in CORPORA.items():
+		sequence = build()
+		corpus_results = {}
+
+		stage_input = sequence
+		for stage in pipeline.CHAINED_STAGES:
+			def uncached(seq, stage=stage):
+				_clear_caches(pipeline)
+				return stage(seq)
+
+			corpus_results[stage.__name__] = _measure(uncached, stage_input, repeat)
+			stage_input = list(stage(list(stage_input)))
+
+		chained_output = None
+		fused_output = None
+		for label, cached in (("chain", False), ("fused", False), ("fused_cached", True)):
+			if label == "chain":
+				def fn(seq):
+					for stage in pipeline.CHAINED_STAGES:
+						seq = stage(seq)
+					return seq
+			else:
+				fn = pipeline.fused_pipeline
+
+			def measured(seq, fn=fn, cached=cached):
+				if not cached:
+					_clear_caches(pipeline)
+				return fn(seq)
+
+			corpus_results[label] = _measure(measured, sequence, repeat)
+			output = [repr(item) for item in fn(list(sequence))]
+			if label == "chain":
+				chained_output = output
+			elif fused_output is None:
+				fused_output = output
+
+		if chained_output != fused_output:
+			raise AssertionError("fused pipeline output differs from the chained stages for %s" % corpus_name)
+		results[corpus_name] = corpus_results
+	return results
+
+
+# ----------------------------
+# Language detection
+# ----------------------------
+
+DETECTION_LANGUAGES = ["en", "zh", "ja", "ko", "ru", "ar", "fr", "de"]
+
+
+def corpus_japanese():
+	sentences = (
+		"今日は天気がいいので、公園へ散歩に行きました。",
+		"カメラで写真を撮りました。",
+		"駅の近くに新しい本屋ができました。",
+		"友達と一緒にラーメンを食べました。",
+		"明日は朝から会議があります。",
+		"コーヒーを飲みながらニュースを読みました。",
+	)
+	return _distinct_lines(100, lambda rng: "".join(rng.choice(sentences) for _ in range(8)), 4)
+
+
+def corpus_korean():
+	sentences = (
+		"오늘은 날씨가 좋아서 공원에 산책을 갔습니다. ",
+		"사진을 {0}장 찍었습니다. ",
+		"친구와 함께 {0}번 버스를 탔습니다. ",
+		"내일은 아침 {1}시에 회의가 있습니다. ",
+		"커피를 마시면서 뉴스를 읽었습니다. ",
+	)
+
+	def line(rng):
+		return "".join(rng.choice(sentences).format(rng.randint(1, 999), rng.randint(1, 12)) for _ in range(8))
+	return _distinct_lines(100, line, 5)
+
+
+def corpus_arabic_digits():
+	sentences = (
+		"رقم الهاتف {0} والعنوان شارع {1}، الطابق {2}. ",
+		"وصل القطار في الساعة {2} مع {1} راكبا. ",
+		"السعر {1} دينارا للقطعة الواحدة. ",
+	)
+
+	def line(rng):
+		return "".join(
+			rng.choice(sentences).format("09%08d" % rng.randint(0, 99999999), rng.randint(1, 999), rng.randint(1, 12))
+			for _ in range(6)
+		)
+	return _distinct_lines(100, line, 6)
+
+
+DETECTION_CORPORA = {
+	"cjk_prose": corpus_cjk_prose,
+	"mixed_scripts": corpus_mixed_scripts,
+	"sayall": corpus_sayall,
+	"japanese": corpus_japanese,
+	"korean": corpus_korean,
+	"arabic_digits": corpus_arabic_digits,
+}
+
+
+def _encode(item):
+	commands = sys.modules["speech.commands"]
+	speechcommand = sys.modules["synthDrivers.WorldVoice._speechcommand"]
+	if isinstance(item, str):
+		return item
+	if isinstance(item, speechcommand.WVLangChangeCommand):
+		return {"lang": item.lang}
+	if isinstance(item, commands.LangChangeCommand):
+		return {"nvdaLang": item.lang}
+	raise TypeError("unexpected detector output %r" % item)
+
+
+def _decode(item):
+	commands = sys.modules["speech.commands"]
+	speechcommand = sys.modules["synthDrivers.WorldVoice._speechcommand"]
+	if isinstance(item, str):
+		return item
+	if "lang" in item:
+		return speechcommand.WVLangChangeCommand(item["lang"])
+	return commands.LangChangeCommand(item["nvdaLang"])
+
+
+def _run_case(case):
+	synth = sys.modules["synthDriverHandler"].synth
+	synth.language = case.get("synthLanguage", "en")
+	_detection_conf(case.get("settings", {}))
+	detector = _detector(case["languages"], case.get("symbols", ()))
+	result = {}
+	if "sequence" in case:
+		sequence = [_decode(item) for item in case["sequence"]]
+		result["expected"] = [_encode(item) for item in detector.add_detected_language_commands(sequence)]
+	if "spelling" in case:
+		result["expectedSpelling"] = [list(part) for part in detector.process_for_spelling(case["spelling"], case.get("locale"))]
+	return result
+
+
+def check_golden(update, path=GOLDEN_FILE):
+	"""Compare the detector with the cases in *path*, or record its output with *update*."""
+	cases = json.loads(path.read_text(encoding="utf-8"))
+	failures = []
+	for case in cases:
+		result = _run_case(case)
+		if update:
+			case.update(result)
+			continue
+		for key, value in result.items():
+			if case.get(key) != value:
+				failures.append((case["name"], key, case.get(key), value))
+	if update:
+		path.write_text(json.dumps(cases, ensure_ascii=False, indent="\t") + "\n", encoding="utf-8")
+		print("golden corpus updated: %s" % path)
+	sys.modules["synthDriverHandler"].synth.language = "en"
+	_detection_conf({})
+	return failures
+
+
+def run_detection(repeat):
+	_detection_conf({})
+	detector = _detector(DETECTION_LANGUAGES)
+	speechcommand = sys.modules["synthDrivers.WorldVoice._speechcommand"]
+
+	results = {}
+	for corpus_name, build in DETECTION_CORPORA.items():
+		sequence = build()
+		chars = _chars(sequence)
+		output = list(detector.add_detected_language_commands(list(sequence)))
+		switches = sum(1 for item in output if isinstance(item, speechcommand.WVLangChangeCommand))
+		corpus_results = {}
+		for label, cached in (("detect", False), ("detect_cached", True)):
+			def measured(seq, cached=cached):
+				if not cached:
+					detector.cache.clear()
+				return detector.add_detected_language_commands(seq)
+
+			corpus_results[label] = _measure(measured, sequence, repeat)
+			corpus_results[label]["switches_per_1k"] = switches * 1000 / chars
+		results["detection_" + corpus_name] = corpus_results
+	return results
+
+
+# ----------------------------
+# Speech tasks
+# ----------------------------
+
+class _Core:
+	"""Engine stand-in reporting done speaking *seconds* after each speak call."""
+	wv = "benchmark"
+
+	def __init__(self, seconds):
+		self.seconds = seconds
+
+	def speak(self):
+		synth_driver_handler = sys.modules["synthDriverHandler"]
+		threading.Timer(self.seconds, synth_driver_handler.synthDoneSpeaking.notify, kwargs={"synth": self}).start()
+
+
+class _TaskVoice:
+	engine = "benchmark"
+
+	def stop(self):
+		pass
+
+
+def run_tasks(count=100, seconds=0.002):
+	"""
+	Time the TaskManager worker takes to move on to the next speech task:
+	after the engine reports done speaking (task_gap), and after the token of
+	the task being spoken is cancelled from another thread; and the time an
+	immediate or next lane task waits behind a queue of normal speech. Times
+	in ms.
+	"""
+	taskManager = sys.modules["synthDrivers.WorldVoice.taskManager"]
+	profiler = sys.modules["synthDrivers.WorldVoice.profiler"].profiler
+	core = _Core(seconds)
+	voice = _TaskVoice()
+
+	manager = taskManager.TaskManager()
+	profiler.reset()
+	profiler.enabled = True
+	try:
+		futures = [manager.add_speak_task(voice, core.speak) for _ in range(count)]
+		futures[-1].result(timeout=60)
+		gap = next(row for row in profiler.snapshot() if row["metric"] == taskManager.METRIC_TASK_GAP)
+	finally:
+		profiler.enabled = False
+		profiler.reset()
+
+	# An engine that never reports done, so only cancellation ends the task.
+	cancel_times = []
+	for _ in range(min(count, 20)):
+		token = taskManager.CancellationToken()
+		started = threading.Event()
+		future = manager.add_speak_task(voice, started.set, token=token)
+		started.wait(5)
+		cancelled = time.perf_counter()
+		token.cancel()
+		try:
+			future.exception(timeout=5)
+		except CancelledError:
+			pass
+		cancel_times.append(time.perf_counter() - cancelled)
+
+	# Say-all load: utterances ten times as long, queued in the normal lane.
+	load_core = _Core(seconds * 10)
+	lane_times = {"immediate_under_load": [], "next_under_load": []}
+	for name, lane in (("immediate_under_load", taskManager.LANE_IMMEDIATE), ("next_under_load", taskManager.LANE_NEXT)):
+		for _ in range(min(count, 20)):
+			started = threading.Event()
+			manager.add_speak_task(voice, lambda: (started.set(), load_core.speak()))
+			for _ in range(count):
+				manager.add_speak_task(voice, load_core.speak)
+			started.wait(5)
+			queued = time.perf_counter()
+			future = manager.add_task(voice, time.perf_counter, lane=lane)
+			lane_times[name].append(future.result(timeout=60) - queued)
+			manager.cancel()
+			# Let the done notifications of the cancelled speech go by.
+			time.sleep(load_core.seconds * 2)
+	manager.shutdown()
+
+	def percentiles(times):
+		times = sorted(times)
+		return {
+			"p50": times[len(times) // 2] * 1000,
+			"p95": times[int(len(times) * 0.95)] * 1000,
+			"max": times[-1] * 1000,
+		}
+
+	return {
+		"task_gap": {"p50": gap["p50"], "p95": gap["p95"], "max": gap["max"]},
+		"token_cancel": percentiles(cancel_times),
+		**{name: percentiles(times) for name, times in lane_times.items()},
+	}
+
+
+def report_tasks(results):
+	print("speech tasks")
+	for name, measurement in results.items():
+		print("  %-30s %8.3f ms p50 %8.3f ms p95 %8.3f ms max" % (name, measurement["p50"], measurement["p95"], measurement["max"]))
+
+
+# The rows compared against the baseline: whole runs of the pipeline and of
+# the detector. The single stages and the cached runs take too little time
+# per run to compare reliably and are only reported.
+GATED_STAGES = ("chain", "fused", "detect")
+
+
+def compare(results, baseline, tolerance):
+	failures = []
+	for corpus_name, stages in results.items():
+		for stage_name, measurement in stages.items():
+			if stage_name not in GATED_STAGES:
+				continue
+			try:
+				expected = baseline[corpus_name][stage_name]["relative"]
+			except KeyError:
+				continue
+			if measurement["relative"] < expected * (1 - tolerance):
+				failures.append((corpus_name, stage_name, measurement["relative"], expected))
+	return failures
+
+
+def report(results):
+	for corpus_name, stages in results.items():
+		print(corpus_name)
+		for stage_name, measurement in stages.items():
+			line = "  %-30s %14.0f chars/sec %8.3f relative %10.1f KiB peak" % (
+				stage_name,
+				measurement["chars_per_sec"],
+				measurement["relative"],
+				measurement["peak_kib"],
+			)
+			if "switches_per_1k" in measurement:
+				line += " %8.2f switches/1k chars" % measurement["switches_per_1k"]
+			print(line)
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--repeat", type=int, default=15, help="runs per measurement, the median is kept")
+	parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown against the baseline")
+	parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+	parser.add_argument("--save-baseline", action="store_true")
+	parser.add_argument("--update-golden", action="store_true", help="record the current detector output in the golden corpus")
+	args = parser.parse_args(argv)
+
+	install_stand_ins(default_conf())
+	sys.modules["synthDriverHandler"].synth = _Synth()
+	# Import only after the stand-ins are in place.
+	import synthDrivers.WorldVoice.pipeline  # noqa: F401
+	import synthDrivers.WorldVoice.languageDetection  # noqa: F401
+	import synthDrivers.WorldVoice.taskManager  # noqa: F401
+
+	failures = check_golden(args.update_golden)
+	# Never updated: the output of the detector before the block table was generated.
+	failures += check_golden(False, BASELINE_DETECTION_FILE)
+	for name, key, expected, actual in failures:
+		print("GOLDEN MISMATCH %s/%s:\n  expected %r\n  actual   %r" % (name, key, expected, actual))
+	if failures:
+		return 1
+
+	results = run(args.repeat)
+	results.update(run_detection(args.repeat))
+	report(results)
+	# Wall-clock waits, reported but not compared against the baseline.
+	report_tasks(run_tasks())
+
+	if args.save_baseline:
+		args.baseline.write_text(json.dumps(results, indent="\t", sort_keys=True) + "\n", encoding="utf-8")
+		print("baseline saved to %s" % args.baseline)
+		return 0
+
+	if not args.baseline.exists():
+		print("no baseline at %s, run with --save-baseline first" % args.baseline)
+		return 0
+
+	failures = compare(results, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance)
+	for corpus_name, stage_name, measured, expected in failures:
+		print("REGRESSION %s/%s: %.3f relative, baseline %.3f" % (corpus_name, stage_name, measured, expected))
+	return 1 if failures else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
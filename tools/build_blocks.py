@@ -0,0 +1,263 @@
+"""Generate addon/synthDrivers/WorldVoice/languageDetection/blocks.py from Unicode Blocks.txt.
+
+Usage:
+	python tools/build_blocks.py                      # latest Blocks.txt from unicode.org
+	python tools/build_blocks.py 15.1.0               # Blocks.txt of a given Unicode version
+	python tools/build_blocks.py path/to/Blocks.txt   # a local copy
+
+The generated module maps every code point of the 17 planes to a block id
+with a two-level table: BLOCK_INDEX holds one page id per 256 code points,
+BLOCK_PAGES holds the block ids of each distinct page, 16 code points per
+entry (Unicode blocks always start and end on a multiple of 16). Block ids
+index BLOCK_NAMES, where id 0 (None) stands for unassigned code points and
+the blocks of NO_CHARSET.
+"""
+
+import argparse
+from array import array
+from pathlib import Path
+import re
+import sys
+from urllib.request import urlopen
+
+ROOT = Path(__file__).resolve().parent.parent
+OUTPUT = ROOT / "addon" / "synthDrivers" / "WorldVoice" / "languageDetection" / "blocks.py"
+URL = "https://www.unicode.org/Public/{version}/ucd/Blocks.txt"
+
+BLOCK_RSHIFT = 4
+PAGE_SHIFT = 8
+MAX_CODE_POINT = 0x10FFFF
+
+# Unicode blocks that language detection treats as one charset.
+# The names on the right are the ones LanguageDetector refers to.
+ALIASES = {
+	"Latin-1 Supplement": "Extended Latin",
+	"Latin Extended-A": "Extended Latin",
+	"IPA Extensions": "Extended Latin",
+	"Hiragana": "Kana",
+	"Katakana": "Kana",
+	"Katakana Phonetic Extensions": "Kana",
+}
+
+# Blocks of punctuation, symbols, marks, private use, surrogates and format
+# characters, which belong to no charset: they are left unassigned (None),
+# like the code points outside any block, so a run of them keeps the current
+# language. The symbol and punctuation blocks the detector always named
+# (Letterlike Symbols, CJK Symbols and Punctuation, ...) are not listed.
+NO_CHARSET = frozenset((
+	"Aegean Numbers",
+	"Alchemical Symbols",
+	"Ancient Greek Musical Notation",
+	"Ancient Greek Numbers",
+	"Ancient Symbols",
+	"Arrows",
+	"Block Elements",
+	"Box Drawing",
+	"Braille Patterns",
+	"Byzantine Musical Symbols",
+	"CJK Compatibility",
+	"CJK Compatibility Forms",
+	"CJK Radicals Supplement",
+	"CJK Strokes",
+	"Chess Symbols",
+	"Combining Diacritical Marks",
+	"Combining Diacritical Marks Extended",
+	"Combining Diacritical Marks Supplement",
+	"Combining Diacritical Marks for Symbols",
+	"Combining Half Marks",
+	"Common Indic Number Forms",
+	"Control Pictures",
+	"Coptic Epact Numbers",
+	"Counting Rod Numerals",
+	"Cuneiform Numbers and Punctuation",
+	"Currency Symbols",
+	"Cyrillic Extended-A",
+	"Dingbats",
+	"Domino Tiles",
+	"Egyptian Hieroglyph Format Controls",
+	"Emoticons",
+	"Enclosed Alphanumeric Supplement",
+	"Enclosed Alphanumerics",
+	"Enclosed CJK Letters and Months",
+	"Enclosed Ideographic Supplement",
+	"General Punctuation",
+	"Geometric Shapes",
+	"Geometric Shapes Extended",
+	"Glagolitic Supplement",
+	"High Private Use Surrogates",
+	"High Surrogates",
+	"Ideographic Description Characters",
+	"Indic Siyaq Numbers",
+	"Kanbun",
+	"Khmer Symbols",
+	"Low Surrogates",
+	"Mahjong Tiles",
+	"Mathematical Operators",
+	"Mayan Numerals",
+	"Miscellaneous Mathematical Symbols-A",
+	"Miscellaneous Mathematical Symbols-B",
+	"Miscellaneous Symbols",
+	"Miscellaneous Symbols and Arrows",
+	"Miscellaneous Symbols and Pictographs",
+	"Miscellaneous Technical",
+	"Mongolian Supplement",
+	"Musical Symbols",
+	"Optical Character Recognition",
+	"Ornamental Dingbats",
+	"Ottoman Siyaq Numbers",
+	"Phaistos Disc",
+	"Playing Cards",
+	"Private Use Area",
+	"Rumi Numeral Symbols",
+	"Shorthand Format Controls",
+	"Sinhala Archaic Numbers",
+	"Small Form Variants",
+	"Specials",
+	"Sundanese Supplement",
+	"Supplemental Arrows-A",
+	"Supplemental Arrows-B",
+	"Supplemental Arrows-C",
+	"Supplemental Mathematical Operators",
+	"Supplemental Symbols and Pictographs",
+	"Supplementary Private Use Area-A",
+	"Supplementary Private Use Area-B",
+	"Sutton SignWriting",
+	"Symbols and Pictographs Extended-A",
+	"Symbols for Legacy Computing",
+	"Tags",
+	"Tai Xuan Jing Symbols",
+	"Tamil Supplement",
+	"Transport and Map Symbols",
+	"Variation Selectors",
+	"Variation Selectors Supplement",
+	"Vertical Forms",
+	"Yi Radicals",
+	"Yijing Hexagram Symbols",
+	"Znamenny Musical Notation",
+))
+
+_LINE_RE = re.compile(r"^([0-9A-F]+)\.\.([0-9A-F]+);\s*(.+?)\s*$")
+_VERSION_RE = re.compile(r"^#\s*Blocks-([0-9.]+)\.txt")
+
+
+def read_source(source):
+	if Path(source).is_file():
+		return Path(source).read_text(encoding="utf-8")
+	if re.fullmatch(r"[0-9.]+|latest", source):
+		source = URL.format(version="UCD/latest" if source == "latest" else source)
+	with urlopen(source) as response:
+		return response.read().decode("utf-8")
+
+
+def parse(text):
+	version = "unknown"
+	ranges = []
+	for line in text.splitlines():
+		m = _VERSION_RE.match(line)
+		if m:
+			version = m.group(1)
+			continue
+		m = _LINE_RE.match(line)
+		if m:
+			ranges.append((int(m.group(1), 16), int(m.group(2), 16), m.group(3)))
+	return version, ranges
+
+
+def alias(name):
+	if name in NO_CHARSET:
+		return None
+	return ALIASES.get(name, name)
+
+
+def build(ranges):
+	names = [None]
+	ids = {None: 0}
+	granules = [0] * ((MAX_CODE_POINT + 1) >> BLOCK_RSHIFT)
+	for first, last, name in ranges:
+		if first & 0xF or (last + 1) & 0xF:
+			raise ValueError("block %s is not aligned to %d code points" % (name, 1 << BLOCK_RSHIFT))
+		name = alias(name)
+		if name is None:
+			continue
+		if name not in ids:
+			ids[name] = len(names)
+			names.append(name)
+		granules[first >> BLOCK_RSHIFT:(last + 1) >> BLOCK_RSHIFT] = [ids[name]] * ((last + 1 - first) >> BLOCK_RSHIFT)
+
+	page_size = 1 << (PAGE_SHIFT - BLOCK_RSHIFT)
+	pages = {}
+	index = array("H")
+	page_data = array("H")
+	for start in range(0, len(granules), page_size):
+		page = tuple(granules[start:start + page_size])
+		if page not in pages:
+			pages[page] = len(pages)
+			page_data.extend(page)
+		index.append(pages[page])
+	return names, index, page_data
+
+
+def _wrap(values, per_line=16):
+	lines = []
+	for start in range(0, len(values), per_line):
+		lines.append("\t" + ", ".join("0x%x" % v for v in values[start:start + per_line]) + ",")
+	return "\n".join(lines)
+
+
+def render(version, names, index, pages):
+	out = [
+		"# -*- coding: utf-8 -*-",
+		"# Generated by tools/build_blocks.py from Unicode %s Blocks.txt, do not edit." % version,
+		"from array import array",
+		"",
+		"UNICODE_VERSION = %r" % version,
+		"BLOCK_RSHIFT = %d" % BLOCK_RSHIFT,
+		"PAGE_SHIFT = %d" % PAGE_SHIFT,
+		"",
+		"BLOCK_NAMES = (",
+	]
+	out.extend("\t%r," % name for name in names)
+	out.extend([
+		")",
+		"",
+		"# Page id per %d code points." % (1 << PAGE_SHIFT),
+		"BLOCK_INDEX = array('H', (",
+		_wrap(index),
+		"))",
+		"",
+		"# Block ids of each page, one per %d code points." % (1 << BLOCK_RSHIFT),
+		"BLOCK_PAGES = array('H', (",
+		_wrap(pages),
+		"))",
+		"",
+		"",
+		"def block_id(cp):",
+		"\t\"\"\"Index in BLOCK_NAMES of the block of code point *cp*, 0 if unassigned.\"\"\"",
+		"\treturn BLOCK_PAGES[(BLOCK_INDEX[cp >> PAGE_SHIFT] << (PAGE_SHIFT - BLOCK_RSHIFT)) | ((cp >> BLOCK_RSHIFT) & 0x%x)]" % ((1 << (PAGE_SHIFT - BLOCK_RSHIFT)) - 1),
+		"",
+		"",
+		"def block_name(cp):",
+		"\treturn BLOCK_NAMES[block_id(cp)]",
+		"",
+	])
+	return "\n".join(out)
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("source", nargs="?", default="latest", help="Unicode version, Blocks.txt path or URL")
+	parser.add_argument("--output", type=Path, default=OUTPUT)
+	args = parser.parse_args(argv)
+
+	version, ranges = parse(read_source(args.source))
+	if not ranges:
+		print("no blocks found in %s" % args.source)
+		return 1
+	names, index, pages = build(ranges)
+	args.output.write_text(render(version, names, index, pages), encoding="utf-8")
+	print("%s: Unicode %s, %d blocks, %d distinct pages" % (args.output, version, len(names) - 1, len(pages) >> (PAGE_SHIFT - BLOCK_RSHIFT)))
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,151 @@
+"""Generate addon/synthDrivers/WorldVoice/languageDetection/ngrams.py, the trigram
+profiles of the statistical language identifier.
+
+Usage:
+	python tools/build_ngrams.py --gettext /usr/share/locale   # train on gettext catalogs
+	python tools/build_ngrams.py --corpus path/to/corpus       # train on <lang>.txt files
+
+With --gettext, the translations in <dir>/<lang>/LC_MESSAGES/*.mo are the
+training text of <lang> and their English source strings the training text
+of en. A profile is the PROFILE_SIZE most frequent character trigrams of the
+words of a language, most frequent first; words are padded with a space on
+both sides so that prefixes and suffixes count.
+"""
+
+import argparse
+from collections import Counter
+from pathlib import Path
+import re
+import struct
+import sys
+
+ROOT = Path(__file__).resolve().parent.parent
+OUTPUT = ROOT / "addon" / "synthDrivers" / "WorldVoice" / "languageDetection" / "ngrams.py"
+
+PROFILE_SIZE = 300
+
+# Languages sharing a script with others, by script.
+LANGUAGES = {
+	"Latin": [
+		"en", "fr", "de", "es", "it", "pt", "nl", "sv", "da", "nb", "fi", "pl", "cs", "sk",
+		"sl", "hr", "hu", "ro", "tr", "ca", "id", "et", "lt",
+	],
+	"Cyrillic": ["ru", "uk", "bg", "sr", "be"],
+	"Arabic": ["ar", "fa"],
+}
+
+# Letters counted for the languages of each script.
+SCRIPTS = {
+	"Latin": re.compile(r"^[a-z\u00c0-\u024f]+$"),
+	"Cyrillic": re.compile(r"^[\u0400-\u052f]+$"),
+	"Arabic": re.compile(r"^[\u0600-\u06ff\ufb50-\ufdff\ufe70-\ufeff]+$"),
+}
+
+# printf and format placeholders, markup and keyboard accelerators of UI strings.
+_MARKUP_RE = re.compile(r"%[-+ #0-9.*]*[a-zA-Z]|\{[^}]*\}|<[^>]*>|&[a-z]+;|[_&~](?=\w)")
+_WORD_RE = re.compile(r"[^\W\d_]+")
+
+
+def words(text):
+	return _WORD_RE.findall(_MARKUP_RE.sub(" ", text).lower())
+
+
+def trigrams(word):
+	padded = " %s " % word
+	return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def read_mo(path):
+	"""(msgid, msgstr) pairs of a gettext .mo catalog."""
+	data = path.read_bytes()
+	magic = struct.unpack("<I", data[:4])[0]
+	endian = "<" if magic == 0x950412de else ">"
+	_, count, ids_offset, strs_offset = struct.unpack(endian + "4I", data[4:20])
+	for i in range(count):
+		id_length, id_offset = struct.unpack(endian + "2I", data[ids_offset + i * 8:ids_offset + i * 8 + 8])
+		str_length, str_offset = struct.unpack(endian + "2I", data[strs_offset + i * 8:strs_offset + i * 8 + 8])
+		msgid = data[id_offset:id_offset + id_length]
+		if not msgid:
+			continue  # catalog header
+		try:
+			yield msgid.decode("utf-8"), data[str_offset:str_offset + str_length].decode("utf-8")
+		except UnicodeDecodeError:
+			continue
+
+
+def gettext_corpora(locale_dir):
+	corpora = {}
+	for language in [language for languages in LANGUAGES.values() for language in languages]:
+		catalogs = sorted((locale_dir / language / "LC_MESSAGES").glob("*.mo"))
+		for catalog in catalogs:
+			for msgid, msgstr in read_mo(catalog):
+				if language != "en":
+					corpora.setdefault(language, []).append(msgstr.replace("\0", " "))
+				if msgstr and msgid != msgstr:
+					corpora.setdefault("en", []).append(msgid.replace("\0", " "))
+	return {language: "\n".join(texts) for language, texts in corpora.items()}
+
+
+def file_corpora(corpus_dir):
+	return {path.stem: path.read_text(encoding="utf-8") for path in sorted(corpus_dir.glob("*.txt"))}
+
+
+def profile(text, script):
+	counts = Counter()
+	for word in words(text):
+		if script.match(word):
+			counts.update(trigrams(word))
+	return [trigram for trigram, _ in counts.most_common(PROFILE_SIZE)]
+
+
+def render(source, profiles):
+	out = [
+		"# -*- coding: utf-8 -*-",
+		"# Generated by tools/build_ngrams.py from %s, do not edit." % source,
+		"",
+		"PROFILE_SIZE = %d" % PROFILE_SIZE,
+		"",
+		"# Language -> its most frequent word trigrams, most frequent first, concatenated.",
+		"PROFILES = {",
+	]
+	for language in sorted(profiles):
+		grams = profiles[language]
+		out.append("\t%r: (" % language)
+		for start in range(0, len(grams), 20):
+			out.append("\t\t%r" % "".join(grams[start:start + 20]))
+		out.append("\t),")
+	out.extend(["}", ""])
+	return "\n".join(out)
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	group = parser.add_mutually_exclusive_group(required=True)
+	group.add_argument("--gettext", type=Path, help="locale directory with <lang>/LC_MESSAGES/*.mo catalogs")
+	group.add_argument("--corpus", type=Path, help="directory with one <lang>.txt file per language")
+	parser.add_argument("--output", type=Path, default=OUTPUT)
+	args = parser.parse_args(argv)
+
+	if args.gettext:
+		corpora = gettext_corpora(args.gettext)
+		source = "gettext catalogs"
+	else:
+		corpora = file_corpora(args.corpus)
+		source = "a text corpus"
+	scripts = {language: SCRIPTS[script] for script, languages in LANGUAGES.items() for language in languages}
+	profiles = {}
+	for language, text in corpora.items():
+		if language not in scripts:
+			continue
+		grams = profile(text, scripts[language])
+		if len(grams) < PROFILE_SIZE:
+			print("skipping %s: only %d trigrams" % (language, len(grams)))
+			continue
+		profiles[language] = grams
+	args.output.write_text(render(source, profiles), encoding="utf-8")
+	print("%s: %d profiles" % (args.output, len(profiles)))
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())